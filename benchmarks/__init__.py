@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# Micro-benchmarks for the library. Run each one as a module from the root
+# of the repository, e.g. ``python -m benchmarks.checksums``.
+# #########################################################################
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This benchmark compares every supported checksum algorithm on files the
+# size of typical photons so the fastest suitable algorithm can be picked
+# for change detection and integrity checks.
+#
+# Usage: python -m benchmarks.checksums [--sizes 1 16 256] [--rounds 50]
+# #########################################################################
+from src.tools.utils import DigestUtils, SystemUtils
+from typing import Any
+import statistics
+import argparse
+import tempfile
+import time
+import json
+import os
+
+def measure(filepath: str, algorithm: str, rounds: int) -> list[float]:
+    """
+    Hashes a file repeatedly and returns how long each round took.
+
+    Parameters
+    ----------
+    filepath : :class:`str`
+        The file to hash.
+    algorithm : :class:`str`
+        The checksum algorithm to use.
+    rounds : :class:`int`
+        The number of times to hash the file.
+
+    Returns
+    ----------
+    :class:`list[float]`
+        The duration of every round in seconds.
+    """
+    SystemUtils.get_file_checksum(filepath, algorithm=algorithm) # Warm the page cache.
+    durations: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        SystemUtils.get_file_checksum(filepath, algorithm=algorithm)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def run(sizes: list[int], rounds: int) -> list[dict[str, Any]]:
+    """
+    Benchmarks every supported algorithm against a synthetic photon of each provided size.
+
+    Parameters
+    ----------
+    sizes : :class:`list[int]`
+        The photon sizes in KiB.
+    rounds : :class:`int`
+        The number of times each file is hashed per algorithm.
+
+    Returns
+    ----------
+    :class:`list[dict[str, Any]]`
+        One result per size and algorithm containing the median duration and throughput.
+    """
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            filepath = os.path.join(directory, f"photon_{size}k.py")
+            line = b"class Photon(IPhoton): value = '4C756D696E616C'\n"
+            with open(filepath, "wb") as file:
+                file.write((line * (size * 1024 // len(line) + 1))[:size * 1024])
+            for algorithm in DigestUtils.get_algorithms():
+                median = statistics.median(measure(filepath, algorithm, rounds))
+                results.append({
+                    "size_kib": size,
+                    "algorithm": algorithm,
+                    "median_us": median * 1e6,
+                    "mib_per_second": (size / 1024) / median if median else float("inf"),
+                    "cryptographic": algorithm in DigestUtils.cryptographic
+                })
+    return results
+
+def report(results: list[dict[str, Any]]) -> None:
+    """
+    Prints the benchmark results as a table, fastest algorithm first for every size.
+
+    Parameters
+    ----------
+    results : :class:`list[dict[str, Any]]`
+        The results returned by :func:`run()`.
+    """
+    print(f"{'size':>8}  {'algorithm':<10} {'median':>12} {'throughput':>14}  use")
+    for result in sorted(results, key=lambda result: (result["size_kib"], result["median_us"])):
+        usage = "integrity" if result["cryptographic"] else "change detection"
+        print(f"{result['size_kib']:>5} KiB  {result['algorithm']:<10} "
+              f"{result['median_us']:>9.1f} us {result['mib_per_second']:>9.1f} MiB/s  {usage}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare photon checksum algorithms.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 256, 4096], help="photon sizes in KiB")
+    parser.add_argument("--rounds", type=int, default=50, help="hashes per algorithm and size")
+    parser.add_argument("--json", action="store_true", help="print the raw results as JSON")
+    arguments = parser.parse_args()
+    results = run(arguments.sizes, arguments.rounds)
+    if arguments.json:
+        print(json.dumps(results, indent=4))
+    else:
+        report(results)
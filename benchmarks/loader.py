@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This benchmark generates synthetic photon trees and measures how the
+# loader scales while loading, starting, reloading, watching, and unloading
+# them. Results are written as JSON so they can be compared across commits.
+#
+# Usage: python -m benchmarks.loader [--files 200] [--depth 3] [--classes 2]
+#        [--size 4] [--import-weight 1000] [--rounds 5] [--output run.json]
+#        [--compare baseline.json]
+# #########################################################################
+from src.managers.tracer import LoopTrace
+from src.managers.loader import Loader
+from typing import Any, Awaitable, Callable, Optional
+import statistics
+import subprocess
+import platform
+import argparse
+import tempfile
+import asyncio
+import psutil
+import time
+import json
+import sys
+import os
+
+operations: tuple[str, ...] = ("load", "warm", "reload", "watch", "unload")
+
+def generate_tree(directory: str, files: int, depth: int, classes: int, size: int, import_weight: int) -> list[str]:
+    """
+    Writes a synthetic photon tree and returns the paths of its photon files.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The root of the tree.
+    files : :class:`int`
+        The number of photon files.
+    depth : :class:`int`
+        The number of nested directories below the root. Files are spread evenly over every level.
+    classes : :class:`int`
+        The number of photon classes defined in every file.
+    size : :class:`int`
+        The minimum size of every file in KiB, reached by padding it with a constant.
+    import_weight : :class:`int`
+        The number of loop iterations every file executes at module level when it is imported.
+
+    Returns
+    ----------
+    :class:`list[str]`
+        The paths of all generated photon files.
+    """
+    levels = [directory]
+    for level in range(1, depth + 1):
+        levels.append(os.path.join(levels[-1], f"tier_{level}"))
+    for level in levels:
+        os.makedirs(level, exist_ok=True)
+    filepaths: list[str] = []
+    for index in range(files):
+        filepath = os.path.join(levels[index % len(levels)], f"photon_{index}.py")
+        write_photon(filepath, index, classes, size, import_weight, revision=0)
+        filepaths.append(filepath)
+    return filepaths
+
+def write_photon(filepath: str, index: int, classes: int, size: int, import_weight: int, revision: int) -> None:
+    """
+    Writes a single synthetic photon file.
+
+    Parameters
+    ----------
+    filepath : :class:`str`
+        The path of the photon file.
+    index : :class:`int`
+        The number of the file, which keeps every photon name unique.
+    classes : :class:`int`
+        The number of photon classes defined in the file.
+    size : :class:`int`
+        The minimum size of the file in KiB.
+    import_weight : :class:`int`
+        The number of loop iterations executed at module level.
+    revision : :class:`int`
+        A number which changes the contents of the file, e.g. to trigger a reload.
+    """
+    lines = ["from src.interfaces.photon import IPhoton",
+             f"REVISION = {revision}",
+             f"WEIGHT = sum(value * value for value in range({import_weight}))"]
+    for number in range(classes):
+        lines.extend([f"class Photon_{index}_{number}(IPhoton):",
+                      "    async def finalize(self): return True",
+                      "    def compute(self, value): return value * WEIGHT"])
+    source = "\n".join(lines) + "\n"
+    padding = max(size * 1024 - len(source) - 16, 0)
+    source += f"PADDING = '{'0' * padding}'\n"
+    with open(filepath, "w") as file:
+        file.write(source)
+
+def get_rss() -> int:
+    """
+    Returns the current resident set size of the benchmark process.
+
+    Returns
+    ----------
+    :class:`int`
+        The resident set size in bytes.
+    """
+    return psutil.Process().memory_info().rss
+
+def get_peak_rss() -> int:
+    """
+    Returns the largest resident set size the benchmark process reached so far.
+
+    Returns
+    ----------
+    :class:`int`
+        The peak resident set size in bytes, or the current one where the platform doesn't track a peak.
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024 # Linux reports KiB, macOS bytes.
+    except ImportError: # pragma: no cover
+        return getattr(psutil.Process().memory_info(), "peak_wset", get_rss())
+
+async def measure(operation: Callable[[], Awaitable[Any]]) -> dict[str, float]:
+    """
+    Runs an operation once and measures what it cost.
+
+    Parameters
+    ----------
+    operation : :class:`Callable[[], Awaitable[Any]]`
+        A coroutine function performing the operation.
+
+    Returns
+    ----------
+    :class:`dict[str, float]`
+        The wall time and CPU time in seconds, and the resident set size in MiB afterwards.
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    await operation()
+    return {"wall": time.perf_counter() - wall,
+            "cpu": time.process_time() - cpu,
+            "rss_mib": get_rss() / 2**20}
+
+async def run_round(directory: str, arguments: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """
+    Measures every operation once against a freshly generated photon tree.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        An empty directory to generate the tree in.
+    arguments : :class:`argparse.Namespace`
+        The parsed command line arguments.
+
+    Returns
+    ----------
+    :class:`dict[str, dict[str, float]]`
+        The measurements of every operation.
+    """
+    filepaths = generate_tree(directory, arguments.files, arguments.depth, arguments.classes,
+                              arguments.size, arguments.import_weight)
+    changed = filepaths[:max(1, int(len(filepaths) * arguments.changes))]
+    loader = Loader(workers=arguments.workers, algorithm=arguments.algorithm)
+    samples: dict[str, dict[str, float]] = {}
+    def _change_files(revision: int) -> None:
+        for filepath in changed:
+            write_photon(filepath, filepaths.index(filepath), arguments.classes,
+                         arguments.size, arguments.import_weight, revision)
+    async def _load() -> None:
+        await loader.load_photons(directory, recursive=True)
+    async def _reload() -> None:
+        await loader.reload_photons(loader.photons.get_by_filepaths(changed))
+    async def _watch() -> None:
+        await loader._observe_photons(directory, loop_trace=LoopTrace([], 0)) # Stops after one cycle.
+    async def _unload() -> None:
+        await loader.unload_photons(list(dict.fromkeys(photon.filepath for photon in loader.photons.values())))
+    samples["load"] = await measure(_load)
+    samples["warm"] = await measure(loader.warm)
+    _change_files(1)
+    samples["reload"] = await measure(_reload)
+    loader._is_watching = True
+    await _watch() # Builds the Merkle index, so the measured cycle only sees the changes.
+    _change_files(2)
+    samples["watch"] = await measure(_watch)
+    loader._is_watching = False
+    samples["unload"] = await measure(_unload)
+    return samples
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """
+    Reduces the samples of one metric to its percentiles.
+
+    Parameters
+    ----------
+    values : :class:`list[float]`
+        The samples of every round.
+
+    Returns
+    ----------
+    :class:`dict[str, float]`
+        The ``min``, ``p50``, ``p90``, ``p99``, ``max``, and ``mean`` of the samples.
+    """
+    quantiles = statistics.quantiles(values, n=100, method="inclusive") if len(values) > 1 else values * 99
+    return {"min": min(values), "p50": quantiles[49], "p90": quantiles[89], "p99": quantiles[98],
+            "max": max(values), "mean": statistics.fmean(values)}
+
+def get_commit() -> Optional[str]:
+    """
+    Returns the commit the benchmark runs against.
+
+    Returns
+    ----------
+    Optional[:class:`str`]
+        The hash of the checked out commit, or ``None`` outside of a git repository.
+    """
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    """
+    Benchmarks every operation over several rounds, discarding the warmup rounds.
+
+    Parameters
+    ----------
+    arguments : :class:`argparse.Namespace`
+        The parsed command line arguments.
+
+    Returns
+    ----------
+    :class:`dict[str, Any]`
+        The environment, the configuration, and the percentiles of every operation and metric.
+    """
+    rounds: list[dict[str, dict[str, float]]] = []
+    for number in range(arguments.warmup + arguments.rounds):
+        with tempfile.TemporaryDirectory() as directory:
+            samples = await run_round(directory, arguments)
+        if number >= arguments.warmup:
+            rounds.append(samples)
+    results = {operation: {metric: summarize([samples[operation][metric] for samples in rounds])
+                           for metric in ("wall", "cpu", "rss_mib")} for operation in operations}
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": {key: value for key, value in vars(arguments).items() if not key in ("output", "compare", "json")},
+        "photons": arguments.files * arguments.classes,
+        "peak_rss_mib": get_peak_rss() / 2**20,
+        "results": results
+    }
+
+def report(results: dict[str, Any], baseline: Optional[dict[str, Any]] = None) -> None:
+    """
+    Prints the wall time percentiles of every operation, optionally next to a baseline run.
+
+    Parameters
+    ----------
+    results : :class:`dict[str, Any]`
+        The results returned by :func:`run()`.
+    baseline : Optional[:class:`dict[str, Any]`]
+        The results of an earlier run, e.g. of another commit. Defaults to ``None``.
+    """
+    print(f"{results['photons']} photons in {results['config']['files']} files, "
+          f"peak RSS {results['peak_rss_mib']:.1f} MiB")
+    print(f"{'operation':<10} {'p50':>10} {'p90':>10} {'p99':>10} {'cpu p50':>10}" + ("  vs baseline" if baseline else ""))
+    for operation in operations:
+        wall, cpu = results["results"][operation]["wall"], results["results"][operation]["cpu"]
+        line = f"{operation:<10} {wall['p50'] * 1e3:>7.1f} ms {wall['p90'] * 1e3:>7.1f} ms " \
+               f"{wall['p99'] * 1e3:>7.1f} ms {cpu['p50'] * 1e3:>7.1f} ms"
+        previous = (baseline or {}).get("results", {}).get(operation, None)
+        if previous and previous["wall"]["p50"]:
+            line += f"  {(wall['p50'] / previous['wall']['p50'] - 1) * 100:>+8.1f}%"
+        print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure how the photon loader scales with synthetic photon trees.")
+    parser.add_argument("--files", type=int, default=200, help="photon files in the tree")
+    parser.add_argument("--depth", type=int, default=3, help="nested directory levels below the root")
+    parser.add_argument("--classes", type=int, default=2, help="photon classes per file")
+    parser.add_argument("--size", type=int, default=4, help="minimum size of every file in KiB")
+    parser.add_argument("--import-weight", type=int, default=1000, help="loop iterations every file runs on import")
+    parser.add_argument("--changes", type=float, default=0.1, help="fraction of files changed before reloading and watching")
+    parser.add_argument("--workers", type=int, default=1, help="workers of the loader")
+    parser.add_argument("--algorithm", default="sha512", help="checksum algorithm of the loader")
+    parser.add_argument("--rounds", type=int, default=5, help="measured rounds")
+    parser.add_argument("--warmup", type=int, default=1, help="rounds which are run but not measured")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="a JSON file of an earlier run to compare against")
+    parser.add_argument("--json", action="store_true", help="print the raw results as JSON")
+    arguments = parser.parse_args()
+    results = asyncio.run(run(arguments))
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=4)
+    if arguments.json:
+        print(json.dumps(results, indent=4))
+    else:
+        baseline = None
+        if arguments.compare:
+            with open(arguments.compare) as file:
+                baseline = json.load(file)
+        report(results, baseline)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This benchmark compares the throughput of CPU-bound work, and how fast a
+# thread can be halted, between plain threads, the former settrace-based
+# traced thread, and the cancellable threads of the thread manager.
+#
+# Usage: python -m benchmarks.threads [--iterations 1000000] [--rounds 5]
+# #########################################################################
+from src.managers.threads import CancellableThread, CancellationToken
+from typing import Any, Callable, Optional
+import statistics
+import threading
+import argparse
+import time
+import json
+import sys
+
+class LegacyTracedThread(threading.Thread):
+    """The former :class:`TracedThread`, which traced every line of its code so :func:`halt()` could stop it."""
+    def __init__(self: "LegacyTracedThread", *args: tuple, **keywords: dict[str, Any]) -> None:
+        threading.Thread.__init__(self, *args, **keywords)
+        self.halted: bool = False
+
+    def run(self: "LegacyTracedThread") -> None:
+        sys.settrace(self.globaltrace)
+        try: threading.Thread.run(self)
+        except SystemExit: pass
+
+    def globaltrace(self: "LegacyTracedThread", frame: Any, event: str, arg: Any) -> Optional[Callable]:
+        return self.localtrace if event == "call" else None
+
+    def localtrace(self: "LegacyTracedThread", frame: Any, event: str, arg: Any) -> Callable:
+        if self.halted and event == "line":
+            raise SystemExit()
+        return self.localtrace
+
+    def halt(self: "LegacyTracedThread") -> None:
+        self.halted = True
+
+def step(value: int) -> int:
+    """
+    A small pure Python function, so the workload makes calls as well as executing lines.
+
+    Parameters
+    ----------
+    value : :class:`int`
+        The previous value.
+
+    Returns
+    ----------
+    :class:`int`
+        The next value.
+    """
+    return (value * 31 + 7) % 1000003
+
+def work(iterations: Optional[int], cooperative: bool = True) -> int:
+    """
+    Runs a CPU-bound loop, checking the cancellation token of the thread every 1024 iterations.
+
+    Parameters
+    ----------
+    iterations : Optional[:class:`int`]
+        The number of iterations, or ``None`` to loop until the thread is halted.
+    cooperative : Optional[:class:`bool`]
+        If ``False``, the token is ignored, so a cancellable thread has to be interrupted. Defaults to ``True``.
+
+    Returns
+    ----------
+    :class:`int`
+        The final value, so the loop can't be skipped.
+
+    Notes
+    ----------
+    - Threads without a token check a token which is never cancelled, so every thread type runs the same code.
+    """
+    token = (CancellableThread.current_token() if cooperative else None) or CancellationToken() # Same code on every thread.
+    value, count = 0, 0
+    while iterations is None or count < iterations:
+        value = step(value)
+        count += 1
+        if count & 1023 == 0 and token.is_cancelled:
+            break
+    return value
+
+def measure(thread_type: type, iterations: int) -> float:
+    """
+    Runs the workload once on a new thread and returns its throughput.
+
+    Parameters
+    ----------
+    thread_type : :class:`type`
+        The thread class to run the workload on.
+    iterations : :class:`int`
+        The number of iterations of the workload.
+
+    Returns
+    ----------
+    :class:`float`
+        The number of iterations per second.
+    """
+    thread = thread_type(target=work, args=(iterations,))
+    start = time.perf_counter()
+    thread.start()
+    thread.join()
+    return iterations / (time.perf_counter() - start)
+
+def measure_halt(thread_type: type, cooperative: bool = True) -> float:
+    """
+    Starts an endless workload, halts it, and returns how long the thread took to stop.
+
+    Parameters
+    ----------
+    thread_type : :class:`type`
+        The thread class to run the workload on.
+    cooperative : Optional[:class:`bool`]
+        If ``False``, the workload ignores its token and a cancellable thread is interrupted immediately.\
+        Defaults to ``True``.
+
+    Returns
+    ----------
+    :class:`float`
+        The number of seconds between halting the thread and the thread ending.
+    """
+    thread = thread_type(target=work, args=(None, cooperative), daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    if isinstance(thread, CancellableThread):
+        thread.halt(timeout=None if cooperative else 0.0)
+    else:
+        thread.halt()
+    thread.join()
+    return time.perf_counter() - start
+
+def run(iterations: int, rounds: int) -> list[dict[str, Any]]:
+    """
+    Benchmarks every thread type.
+
+    Parameters
+    ----------
+    iterations : :class:`int`
+        The number of iterations of the workload per round.
+    rounds : :class:`int`
+        The number of rounds per thread type.
+
+    Returns
+    ----------
+    :class:`list[dict[str, Any]]`
+        One result per thread type with its median throughput, its slowdown compared to a plain thread,\
+        and its median halt latency.
+    """
+    candidates: list[tuple[str, type, bool]] = [
+        ("threading.Thread", threading.Thread, True),
+        ("legacy TracedThread", LegacyTracedThread, True),
+        ("CancellableThread", CancellableThread, True),
+        ("CancellableThread (interrupted)", CancellableThread, False)
+    ]
+    results: list[dict[str, Any]] = []
+    throughputs: dict[str, list[float]] = {name: [] for name, _, _ in candidates}
+    work(iterations) # Warm up, so the first thread type isn't measured at a lower clock speed.
+    for _ in range(rounds): # Interleaved, so a change of clock speed affects every thread type alike.
+        for name, thread_type, cooperative in candidates:
+            throughputs[name].append(measure(thread_type, iterations))
+    for name, thread_type, cooperative in candidates:
+        halt = None if thread_type is threading.Thread else \
+            statistics.median(measure_halt(thread_type, cooperative) for _ in range(rounds))
+        results.append({"thread": name,
+                        "iterations_per_second": statistics.median(throughputs[name]),
+                        "halt_ms": None if halt is None else halt * 1e3})
+    baseline = results[0]["iterations_per_second"]
+    for result in results:
+        result["slowdown"] = baseline / result["iterations_per_second"]
+    return results
+
+def report(results: list[dict[str, Any]]) -> None:
+    """
+    Prints the benchmark results as a table.
+
+    Parameters
+    ----------
+    results : :class:`list[dict[str, Any]]`
+        The results returned by :func:`run()`.
+    """
+    print(f"{'thread':<32} {'throughput':>16} {'slowdown':>9} {'halt':>10}")
+    for result in results:
+        halt = "-" if result["halt_ms"] is None else f"{result['halt_ms']:.2f} ms"
+        print(f"{result['thread']:<32} {result['iterations_per_second'] / 1e6:>10.2f} M it/s "
+              f"{result['slowdown']:>8.2f}x {halt:>10}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the overhead and halt latency of managed thread types.")
+    parser.add_argument("--iterations", type=int, default=1000000, help="workload iterations per round")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per thread type")
+    parser.add_argument("--json", action="store_true", help="print the raw results as JSON")
+    arguments = parser.parse_args()
+    results = run(arguments.iterations, arguments.rounds)
+    if arguments.json:
+        print(json.dumps(results, indent=4))
+    else:
+        report(results)
@@ -7,26 +7,36 @@
 # #########################################################################
 from ..errors.cleanup import (
     PhotonNotFoundError, 
+    PhotonCollisionError, 
     PhotonNotInitializedError, 
     FinalizerNotImplementedError
 )
 from ..errors.system import (
-    DirectoryNotFoundError
+    DirectoryNotFoundError,
+    PhotonProcessError
 )
 from ..errors.threads import (
     NoThreadsFoundError, 
+    ThreadCancelledError,
     ThreadLimitReachedError, 
+    ThreadQueueFullError,
+    ThreadPoolClosedError,
     ThreadsAlreadyRunningError, 
     ThreadManagerAlreadyRunningError
 )
 
 __all__ = (
     PhotonNotFoundError,
+    PhotonCollisionError,
     PhotonNotInitializedError,
     FinalizerNotImplementedError,
     DirectoryNotFoundError,
+    PhotonProcessError,
     NoThreadsFoundError,
+    ThreadCancelledError,
     ThreadLimitReachedError,
+    ThreadQueueFullError,
+    ThreadPoolClosedError,
     ThreadsAlreadyRunningError,
     ThreadManagerAlreadyRunningError
 )
\ No newline at end of file
@@ -63,4 +63,23 @@ class PhotonNotFoundError(Exception):
         *args : :class:`object` 
             The error message arguments.
         """
-        super().__init__(*args)
\ No newline at end of file
+        super().__init__(*args)
+
+class PhotonCollisionError(Exception):
+    """
+    Error raised when a photon name is already registered by a photon of another file.
+
+    Examples
+    ----------
+    >>> raise PhotonCollisionError("Photon name is already registered!")
+    """
+    def __init__(self, *args: object) -> None:
+        """
+        Initializes the `PhotonCollisionError` instance.
+
+        Parameters
+        ----------
+        *args : :class:`object` 
+            The error message arguments.
+        """
+        super().__init__(*args)
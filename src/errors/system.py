@@ -25,4 +25,23 @@ class DirectoryNotFoundError(Exception):
         *args : :class:`object` 
             The error message arguments.
         """
-        super().__init__(*args)
\ No newline at end of file
+        super().__init__(*args)
+
+class PhotonProcessError(Exception):
+    """
+    Error raised when the worker process of an isolated photon cannot be reached or exits unexpectedly.
+
+    Examples
+    ----------
+    >>> raise PhotonProcessError("The worker process of the photon exited unexpectedly!")
+    """
+    def __init__(self, *args: object) -> None:
+        """
+        Initializes the :class:`PhotonProcessError` instance.
+
+        Parameters
+        ----------
+        *args : :class:`object` 
+            The error message arguments.
+        """
+        super().__init__(*args)
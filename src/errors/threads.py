@@ -82,4 +82,71 @@ class ThreadLimitReachedError(Exception):
         *args : :class:`object`
             The error message arguments.
         """
-        super().__init__(*args)
\ No newline at end of file
+        super().__init__(*args)
+
+class ThreadQueueFullError(ThreadLimitReachedError):
+    """
+    Error raised when a task is submitted to a worker pool whose queue is full.
+
+    Examples
+    ----------
+    >>> raise ThreadQueueFullError("The queue of the worker pool is full!")
+
+    Notes
+    ----------
+    - The error derives from :class:`ThreadLimitReachedError`, so code which already handles a full thread manager\
+    handles a full queue as well.
+    """
+    def __init__(self, *args: object) -> None:
+        """
+        Initializes the :class:`ThreadQueueFullError` instance.
+
+        Parameters
+        ----------
+        *args : :class:`object`
+            The error message arguments.
+        """
+        super().__init__(*args)
+
+class ThreadPoolClosedError(Exception):
+    """
+    Error raised when a task is submitted to a worker pool which was shut down or halted.
+
+    Examples
+    ----------
+    >>> raise ThreadPoolClosedError("The worker pool has been shut down!")
+    """
+    def __init__(self, *args: object) -> None:
+        """
+        Initializes the :class:`ThreadPoolClosedError` instance.
+
+        Parameters
+        ----------
+        *args : :class:`object`
+            The error message arguments.
+        """
+        super().__init__(*args)
+
+class ThreadCancelledError(SystemExit):
+    """
+    Error raised inside of a managed thread once it has been cancelled.
+
+    Examples
+    ----------
+    >>> raise ThreadCancelledError("The thread has been cancelled!")
+
+    Notes
+    ----------
+    - The error derives from :class:`SystemExit`, like the error which halted traced threads before, so it isn't\
+    swallowed by an ``except Exception`` block of the thread and ends the thread without printing a traceback.
+    """
+    def __init__(self, *args: object) -> None:
+        """
+        Initializes the :class:`ThreadCancelledError` instance.
+
+        Parameters
+        ----------
+        *args : :class:`object`
+            The error message arguments.
+        """
+        super().__init__(*args)
@@ -200,6 +200,19 @@ class IPhoton(metaclass=IPhotonMeta):
         if print_output: # pragma: no cover
             self._print(message=message, file=file, **kwargs)
 
+    async def initialize(self: "IPhoton") -> None:
+        """
+        A method that can be overridden to perform asynchronous setup, e.g. opening files or building caches,\
+        right after the photon is created.
+
+        Notes
+        ----------
+        - The photon is only marked as ready once this method completes. Photons which are started together,\
+        e.g. by :func:`Loader.warm()`, initialize concurrently, so slow warmups overlap instead of adding up.
+        - Unlike :func:`finalize()`, implementing this method is optional.
+        """
+        return None
+
     async def finalize(self: "IPhoton") -> bool:
         """
         A method that can, and should, be overridden to perform finalization tasks when the photon is unloaded.
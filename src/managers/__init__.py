@@ -5,18 +5,59 @@
 # Version: 1.0.0
 # Date: 07/26/23
 # #########################################################################
+from ..managers.bytecode import (
+    BytecodeCache
+)
+from ..managers.events import (
+    EventBus,
+    PhotonEvent,
+    Subscription
+)
+from ..managers.graph import (
+    DependencyGraph
+)
 from ..managers.handler import (
+    AbsorptionResult,
     Handler
 )
+from ..managers.inspector import (
+    Inspector,
+    PhotonSignature
+)
+from ..managers.isolation import (
+    IsolatedHandler,
+    PhotonProcess,
+    PhotonProxy
+)
 from ..managers.loader import (
     Loader
 )
+from ..managers.manifest import (
+    Manifest
+)
+from ..managers.merkle import (
+    MerkleIndex
+)
+from ..managers.quarantine import (
+    Quarantine,
+    QuarantineEntry
+)
+from ..managers.registry import (
+    Registry
+)
 from ..managers.resolver import (
     Resolver
 )
+from ..managers.stats import (
+    LifecycleStats,
+    PhaseStats
+)
 from ..managers.threads import (
+    CancellableThread,
+    CancellationToken,
     TracedThread, 
-    ThreadManager
+    ThreadManager,
+    WorkerPool
 )
 from ..managers.tracer import (
     LoopTask,
@@ -24,11 +65,32 @@ from ..managers.tracer import (
 )
 
 __all__ = (
+    BytecodeCache,
+    EventBus,
+    PhotonEvent,
+    Subscription,
+    DependencyGraph,
+    AbsorptionResult,
     Handler,
+    Inspector,
+    PhotonSignature,
+    IsolatedHandler,
+    PhotonProcess,
+    PhotonProxy,
     Loader,
+    Manifest,
+    MerkleIndex,
+    Quarantine,
+    QuarantineEntry,
+    Registry,
     Resolver,
+    LifecycleStats,
+    PhaseStats,
+    CancellableThread,
+    CancellationToken,
     TracedThread,
     ThreadManager,
+    WorkerPool,
     LoopTask,
     LoopTrace
 )
\ No newline at end of file
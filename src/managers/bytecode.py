@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for caching the compiled code of photon files
+# by their checksum so that known versions never have to be compiled again.
+# #########################################################################
+from ..tools.utils import DigestUtils
+from types import CodeType
+from typing import Optional
+import importlib.util as util
+import threading
+import marshal
+import sys
+import os
+
+class BytecodeCache():
+    """Stores marshalled code objects of photon files outside of the photon tree, keyed by their contents."""
+    extension: str = ".pyc"
+    digest_algorithm: str = "sha256"
+
+    def __init__(self: "BytecodeCache", directory: str) -> None:
+        """
+        Initializes a new :class:`BytecodeCache` instance. The directory is created on the first write.
+
+        Parameters
+        ----------
+        directory : :class:`str`
+            The directory that compiled code is stored in. It should be located outside of any photon tree.
+
+        Notes
+        ----------
+        - Every entry is named after the path and the ``sha256`` digest of the source of the photon file together with the cache tag of the\
+        interpreter and its optimization level, and starts with the magic number of the interpreter. Code compiled\
+        by another Python version is therefore never executed, and reverting a photon to a version that was\
+        loaded before, or restarting the loader, skips compilation entirely.
+        - The path is part of the key because every code object remembers the file it was compiled from, which\
+        appears in tracebacks.
+        - Unlike ``__pycache__`` directories, entries never depend on modification times, so they survive being\
+        collected by :class:`Sentinel` and stay valid when a file is rewritten with identical contents.
+        - Entries are always keyed by a strong digest instead of the checksum algorithm of the :class:`Loader`,\
+        which may be a fast one such as ``crc32``. A collision would otherwise execute the code of another version.
+        """
+        self._directory: str = os.path.abspath(directory)
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self: "BytecodeCache") -> int:
+        """
+        Returns the number of entries currently stored by the cache.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cached code objects.
+        """
+        try: return sum(1 for name in os.listdir(self._directory) if name.endswith(self.extension))
+        except OSError: return 0
+
+    @property
+    def directory(self: "BytecodeCache") -> str:
+        """
+        Returns the directory that compiled code is stored in.
+
+        Returns
+        ----------
+        :class:`str`
+            The absolute path of the cache directory.
+        """
+        return self._directory
+
+    @property
+    def algorithm(self: "BytecodeCache") -> str:
+        """
+        Returns the algorithm of the digests the entries are keyed by.
+
+        Returns
+        ----------
+        :class:`str`
+            The digest algorithm, which is always ``sha256``.
+        """
+        return self.digest_algorithm
+
+    @property
+    def hits(self: "BytecodeCache") -> int:
+        """
+        Returns the number of imports which didn't have to compile their photon.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cache hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self: "BytecodeCache") -> int:
+        """
+        Returns the number of imports which had to compile their photon.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cache misses.
+        """
+        return self._misses
+
+    def _get_entry(self: "BytecodeCache", filepath: str, checksum: str) -> str:
+        """
+        Returns the location of the entry for a version of a photon file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : :class:`str`
+            The ``sha256`` digest of the contents of the file.
+
+        Returns
+        ----------
+        :class:`str`
+            The path of the cache entry.
+        """
+        key = f"{os.path.abspath(filepath)}\0{self.digest_algorithm}:{checksum}\0{sys.flags.optimize}".encode("utf-8")
+        digest = DigestUtils.new("sha256")
+        digest.update(key)
+        return os.path.join(self._directory, f"{digest.hexdigest()}.{sys.implementation.cache_tag}{self.extension}")
+
+    def get(self: "BytecodeCache", filepath: str, checksum: Optional[str]) -> Optional[CodeType]:
+        """
+        Returns the cached code of a version of a photon file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : Optional[:class:`str`]
+            The ``sha256`` digest of the contents of the file.
+
+        Returns
+        ----------
+        Optional[:class:`CodeType`]
+            The compiled code, or ``None`` if it isn't cached or the entry is unusable.
+
+        Notes
+        ----------
+        - Entries which are truncated, corrupted, or written by another interpreter are removed.
+        """
+        if checksum is None:
+            return None
+        entry = self._get_entry(filepath, checksum)
+        try:
+            with open(entry, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        try:
+            if not data.startswith(util.MAGIC_NUMBER):
+                raise ValueError("The entry was written by another interpreter!")
+            code = marshal.loads(data[len(util.MAGIC_NUMBER):])
+            if not isinstance(code, CodeType):
+                raise ValueError("The entry doesn't contain a code object!")
+            return code
+        except (EOFError, ValueError, TypeError):
+            try: os.remove(entry)
+            except OSError: pass # pragma: no cover
+            return None
+
+    def put(self: "BytecodeCache", filepath: str, checksum: str, code: CodeType) -> bool:
+        """
+        Stores the compiled code of a version of a photon file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : :class:`str`
+            The ``sha256`` digest of the contents the code was compiled from.
+        code : :class:`CodeType`
+            The compiled code of the file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the entry was written, ``False`` if the cache directory isn't writable.
+
+        Notes
+        ----------
+        - Entries are written to a temporary file first and then moved into place, so concurrent imports never\
+        read a partially written entry.
+        """
+        entry = self._get_entry(filepath, checksum)
+        temporary = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(util.MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(temporary, entry)
+            return True
+        except OSError: # pragma: no cover
+            try: os.remove(temporary)
+            except OSError: pass
+            return False
+
+    def compile(self: "BytecodeCache", filepath: str) -> CodeType:
+        """
+        Returns the compiled code of a photon file, only compiling it if the current version isn't cached.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+
+        Returns
+        ----------
+        :class:`CodeType`
+            The compiled code of the file.
+
+        Raises
+        ----------
+        OSError
+            If the photon file cannot be read.
+        SyntaxError
+            If the photon file cannot be compiled.
+
+        Notes
+        ----------
+        - The source is always read, and the entry is looked up by the digest of the bytes that were actually\
+        read, so a file which changes in the meantime is never executed or cached under the wrong version.
+        """
+        with open(filepath, "rb") as file:
+            source = file.read()
+        digest = DigestUtils.new(self.digest_algorithm)
+        digest.update(source)
+        code = self.get(filepath, digest.hexdigest())
+        if not code is None:
+            with self._lock:
+                self._hits += 1
+            return code
+        code = compile(source, filepath, "exec", dont_inherit=True)
+        self.put(filepath, digest.hexdigest(), code)
+        with self._lock:
+            self._misses += 1
+        return code
+
+    def clear(self: "BytecodeCache") -> int:
+        """
+        Removes every entry from the cache.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of removed entries.
+        """
+        removed = 0
+        try: names = os.listdir(self._directory)
+        except OSError: return removed
+        for name in names:
+            if name.endswith(self.extension):
+                try:
+                    os.remove(os.path.join(self._directory, name))
+                    removed += 1
+                except OSError: # pragma: no cover
+                    continue
+        return removed
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module publishes lifecycle events of photons to subscribers, so
+# they can follow the registry incrementally instead of polling it.
+# #########################################################################
+from ..tools.logger import Logger
+from collections import deque
+from typing import Any, Callable, Iterable, Optional
+import threading
+import asyncio
+import inspect
+import time
+
+class PhotonEvent():
+    """Describes something which happened to a photon or a photon file."""
+    kinds: tuple[str, ...] = ("discovered", "imported", "started", "reloaded", "failed", "unloaded")
+
+    def __init__(self: "PhotonEvent",
+                 kind: str,
+                 filepath: str,
+                 name: Optional[str] = None,
+                 duration: Optional[float] = None,
+                 error: Optional[BaseException] = None) -> None:
+        """
+        Initializes a new :class:`PhotonEvent` instance.
+
+        Parameters
+        ----------
+        kind : :class:`str`
+            One of ``discovered``, ``imported``, ``started``, ``reloaded``, ``failed``, or ``unloaded``.
+        filepath : :class:`str`
+            The path of the photon file.
+        name : Optional[:class:`str`]
+            The name of the photon, or ``None`` for events of the whole file, e.g. ``imported``. Defaults to ``None``.
+        duration : Optional[:class:`float`]
+            The number of seconds the operation which caused the event took. Defaults to ``None``.
+        error : Optional[:class:`BaseException`]
+            The error of a ``failed`` event, if it is known. Defaults to ``None``.
+
+        Raises
+        ----------
+        ValueError
+            If ``kind`` is not a known event kind.
+        """
+        if not kind in self.kinds:
+            raise ValueError(f"The event kind must be one of {', '.join(self.kinds)}!")
+        self.kind: str = kind
+        self.filepath: str = filepath
+        self.name: Optional[str] = name
+        self.duration: Optional[float] = duration
+        self.error: Optional[BaseException] = error
+        self.timestamp: float = time.time()
+
+    def __str__(self: "PhotonEvent") -> str:
+        """
+        Returns the current :class:`PhotonEvent` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`PhotonEvent` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+class Subscription():
+    """A bounded buffer of photon events which is consumed as an asynchronous iterator."""
+    drop_policies: tuple[str, ...] = ("oldest", "newest")
+
+    def __init__(self: "Subscription",
+                 kinds: Optional[Iterable[str]] = None,
+                 buffer: int = 256,
+                 drop: str = "oldest") -> None:
+        """
+        Initializes a new :class:`Subscription` instance.
+
+        Parameters
+        ----------
+        kinds : Optional[:class:`Iterable[str]`]
+            The event kinds to receive. Defaults to ``None``, which receives every event.
+        buffer : Optional[:class:`int`]
+            The maximum number of events waiting to be consumed. Defaults to ``256``.
+        drop : Optional[:class:`str`]
+            Which event is dropped once the buffer is full, either the ``oldest`` waiting event or the\
+            ``newest`` incoming one. Defaults to ``oldest``.
+
+        Raises
+        ----------
+        TypeError
+            If ``buffer`` is not an integer.
+        ValueError
+            If ``buffer`` is less than one, or ``drop`` or one of the ``kinds`` is unknown.
+
+        Notes
+        ----------
+        - Events are published from whichever thread caused them, e.g. the watcher thread, while the\
+        subscription is consumed on the event loop which iterates it. A full buffer never blocks the loader,\
+        so a slow consumer only loses its own events, which are counted by :attr:`dropped`.
+        """
+        if not isinstance(buffer, int) or isinstance(buffer, bool):
+            raise TypeError("The event buffer must be an integer!")
+        if buffer < 1:
+            raise ValueError("The event buffer must be at least one!")
+        if not drop in self.drop_policies:
+            raise ValueError(f"The drop policy must be one of {', '.join(self.drop_policies)}!")
+        kinds = None if kinds is None else frozenset(kinds)
+        if not kinds is None and not kinds.issubset(PhotonEvent.kinds):
+            raise ValueError(f"The event kinds must be any of {', '.join(PhotonEvent.kinds)}!")
+        self._kinds: Optional[frozenset[str]] = kinds
+        self._limit: int = buffer
+        self._drop: str = drop
+        self._events: deque[PhotonEvent] = deque()
+        self._dropped: int = 0
+        self._closed: bool = False
+        self._waiter: Optional[asyncio.Future] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def pending(self: "Subscription") -> int:
+        """
+        Returns the number of events waiting to be consumed.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of buffered events.
+        """
+        return len(self._events)
+
+    @property
+    def dropped(self: "Subscription") -> int:
+        """
+        Returns the number of events which were dropped because the buffer was full.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of dropped events.
+        """
+        return self._dropped
+
+    @property
+    def is_closed(self: "Subscription") -> bool:
+        """
+        Returns a flag indicating if the subscription stopped receiving events.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the subscription is closed, ``False`` otherwise.
+        """
+        return self._closed
+
+    def accepts(self: "Subscription", event: PhotonEvent) -> bool:
+        """
+        Returns a flag indicating if the subscription receives the provided event.
+
+        Parameters
+        ----------
+        event : :class:`PhotonEvent`
+            The published event.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the subscription is open and the kind of the event was requested, ``False`` otherwise.
+        """
+        return not self._closed and (self._kinds is None or event.kind in self._kinds)
+
+    def push(self: "Subscription", event: PhotonEvent) -> bool:
+        """
+        Buffers an event and wakes up the consumer, applying the drop policy if the buffer is full.
+
+        Parameters
+        ----------
+        event : :class:`PhotonEvent`
+            The published event.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the event was buffered, ``False`` if it was dropped or the subscription is closed.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            if len(self._events) >= self._limit:
+                self._dropped += 1
+                if self._drop == "newest":
+                    return False
+                self._events.popleft()
+            self._events.append(event)
+            self._wake()
+            return True
+
+    def close(self: "Subscription") -> None:
+        """Stops receiving events. Events which are already buffered can still be consumed."""
+        with self._lock:
+            self._closed = True
+            self._wake()
+
+    def _wake(self: "Subscription") -> None:
+        """Resolves the future the consumer is waiting on, from any thread. The lock must be held."""
+        waiter, self._waiter = self._waiter, None
+        if waiter is None or waiter.done():
+            return
+        try: waiter.get_loop().call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+        except RuntimeError: pass # The consumer's event loop is already closed.
+
+    def __aiter__(self: "Subscription") -> "Subscription":
+        return self
+
+    async def __anext__(self: "Subscription") -> PhotonEvent:
+        """``|coro|``
+
+        Returns the next buffered event, waiting for one if necessary.
+
+        Returns
+        ----------
+        :class:`PhotonEvent`
+            The oldest buffered event.
+
+        Raises
+        ----------
+        StopAsyncIteration
+            Once the subscription is closed and every buffered event was consumed.
+        """
+        while True:
+            with self._lock:
+                if self._events:
+                    return self._events.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+                self._waiter = asyncio.get_running_loop().create_future()
+                waiter = self._waiter
+            await waiter
+
+    async def __aenter__(self: "Subscription") -> "Subscription":
+        return self
+
+    async def __aexit__(self: "Subscription", *exception: Any) -> None:
+        self.close()
+
+class EventBus():
+    """Publishes photon events to every subscription and listener which requested them."""
+    def __init__(self: "EventBus", logging: bool = False) -> None:
+        """
+        Initializes a new :class:`EventBus` instance.
+
+        Parameters
+        ----------
+        logging : Optional[:class:`bool`]
+            If ``True``, errors raised by listeners are logged. Defaults to ``False``.
+        """
+        self.logging: bool = logging
+        self._logger: Logger = Logger(__name__)
+        self._subscriptions: list[Subscription] = []
+        self._listeners: list[tuple[Callable[[PhotonEvent], Any], Optional[frozenset[str]]]] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def active(self: "EventBus") -> bool:
+        """
+        Returns a flag indicating if anybody receives events, so publishers can skip creating them.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if there is at least one subscription or listener, ``False`` otherwise.
+        """
+        return len(self._subscriptions) > 0 or len(self._listeners) > 0
+
+    def subscribe(self: "EventBus",
+                  kinds: Optional[Iterable[str]] = None,
+                  buffer: int = 256,
+                  drop: str = "oldest") -> Subscription:
+        """
+        Creates a new subscription which receives every future event of the requested kinds.
+
+        Parameters
+        ----------
+        kinds : Optional[:class:`Iterable[str]`]
+            The event kinds to receive. Defaults to ``None``, which receives every event.
+        buffer : Optional[:class:`int`]
+            The maximum number of events waiting to be consumed. Defaults to ``256``.
+        drop : Optional[:class:`str`]
+            Either ``oldest`` or ``newest``. Defaults to ``oldest``.
+
+        Returns
+        ----------
+        :class:`Subscription`
+            The subscription, which is removed from the bus once it is closed.
+        """
+        subscription = Subscription(kinds, buffer, drop)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def add_listener(self: "EventBus", callback: Callable[[PhotonEvent], Any], kinds: Optional[Iterable[str]] = None) -> None:
+        """
+        Registers a function which is called with every future event of the requested kinds.
+
+        Parameters
+        ----------
+        callback : :class:`Callable[[PhotonEvent], Any]`
+            A function or coroutine function receiving the event.
+        kinds : Optional[:class:`Iterable[str]`]
+            The event kinds to receive. Defaults to ``None``, which receives every event.
+
+        Raises
+        ----------
+        TypeError
+            If ``callback`` is not callable.
+        ValueError
+            If one of the ``kinds`` is unknown.
+
+        Notes
+        ----------
+        - Listeners are called on the thread which published the event, so they should return quickly.\
+        Coroutine functions are scheduled as tasks on the event loop of that thread instead of being awaited.
+        - Errors raised by listeners never reach the loader.
+        """
+        if not callable(callback):
+            raise TypeError("The event listener must be callable!")
+        kinds = None if kinds is None else frozenset(kinds)
+        if not kinds is None and not kinds.issubset(PhotonEvent.kinds):
+            raise ValueError(f"The event kinds must be any of {', '.join(PhotonEvent.kinds)}!")
+        with self._lock:
+            self._listeners.append((callback, kinds))
+
+    def remove_listener(self: "EventBus", callback: Callable[[PhotonEvent], Any]) -> bool:
+        """
+        Stops calling a previously registered listener.
+
+        Parameters
+        ----------
+        callback : :class:`Callable[[PhotonEvent], Any]`
+            The registered function.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the listener was removed, ``False`` if it wasn't registered.
+        """
+        with self._lock:
+            listeners = [listener for listener in self._listeners if listener[0] != callback]
+            removed = len(listeners) != len(self._listeners)
+            self._listeners = listeners
+        return removed
+
+    def emit(self: "EventBus", event: PhotonEvent) -> None:
+        """
+        Publishes an event to every subscription and listener which requested its kind.
+
+        Parameters
+        ----------
+        event : :class:`PhotonEvent`
+            The event to publish.
+        """
+        with self._lock:
+            self._subscriptions = [subscription for subscription in self._subscriptions if not subscription.is_closed]
+            subscriptions, listeners = list(self._subscriptions), list(self._listeners)
+        for subscription in subscriptions:
+            if subscription.accepts(event):
+                subscription.push(event)
+        for callback, kinds in listeners:
+            if not kinds is None and not event.kind in kinds:
+                continue
+            try:
+                if inspect.iscoroutinefunction(callback):
+                    task = asyncio.get_running_loop().create_task(callback(event))
+                    self._tasks.add(task) # Keep a reference until the listener finished.
+                    task.add_done_callback(self._finish_listener)
+                else:
+                    callback(event)
+            except Exception as error:
+                if self.logging: # pragma: no cover
+                    self._logger.error(f"Photon event listener '{callback}' failed! ({error})")
+
+    def _finish_listener(self: "EventBus", task: asyncio.Task) -> None:
+        """Releases a finished coroutine listener and retrieves its error, so it is never reported as unhandled."""
+        self._tasks.discard(task)
+        error = None if task.cancelled() else task.exception()
+        if not error is None and self.logging: # pragma: no cover
+            self._logger.error(f"Photon event listener failed! ({error})")
+
+    def close(self: "EventBus") -> None:
+        """Closes every subscription, which ends their iterators once their buffered events were consumed."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
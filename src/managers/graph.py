@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for remembering which photon modules import
+# each other so that a change can be followed to every affected photon.
+# #########################################################################
+from types import CodeType, ModuleType
+from typing import Optional
+import threading
+import sysconfig
+import ast
+import dis
+import sys
+import os
+
+class DependencyGraph():
+    """Records the import graph between photon modules and orders the reloads a change requires."""
+    constant_loads: tuple[str, ...] = ("LOAD_CONST", "LOAD_SMALL_INT")
+
+    def __init__(self: "DependencyGraph") -> None:
+        """
+        Initializes a new, empty :class:`DependencyGraph` instance.
+
+        Notes
+        ----------
+        - Every node is the absolute path of a module file. An edge points from a module to each module it imports.
+        - Modules of the standard library, of installed packages, and of Luminal itself are never recorded, since\
+        they don't change while photons are being watched.
+        """
+        self._dependencies: dict[str, set[str]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        excluded = [path for key, path in sysconfig.get_paths().items() if key in ("stdlib", "platstdlib", "purelib", "platlib")]
+        excluded.append(os.path.dirname(os.path.dirname(__file__))) # The library package itself.
+        self._excluded: tuple[str, ...] = tuple(set(os.path.join(os.path.abspath(path), "") for path in excluded))
+
+    def __len__(self: "DependencyGraph") -> int:
+        """
+        Returns the number of modules which have recorded dependencies.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of recorded modules.
+        """
+        return len(self._dependencies)
+
+    def __contains__(self: "DependencyGraph", filepath: str) -> bool:
+        """
+        Returns a flag indicating if the dependencies of a module were recorded.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the module file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the module was recorded, ``False`` otherwise.
+        """
+        return os.path.abspath(filepath) in self._dependencies
+
+    def _get_module_file(self: "DependencyGraph", module: Optional[ModuleType]) -> Optional[str]:
+        """
+        Returns the source file of a module if it can change while photons are watched.
+
+        Parameters
+        ----------
+        module : Optional[:class:`ModuleType`]
+            The module to locate.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The absolute path of the source file, or ``None`` for built-in, installed, and standard modules.
+        """
+        filepath = getattr(module, "__file__", None) if isinstance(module, ModuleType) else None
+        if not isinstance(filepath, str) or not filepath.endswith(".py"):
+            return None
+        filepath = os.path.abspath(filepath)
+        return None if filepath.startswith(self._excluded) else filepath
+
+    @staticmethod
+    def _get_import_level(instructions: list[dis.Instruction], index: int) -> Optional[int]:
+        """
+        Returns the relative import level of an ``IMPORT_NAME`` instruction.
+
+        Parameters
+        ----------
+        instructions : :class:`list[dis.Instruction]`
+            The instructions of a code object.
+        index : :class:`int`
+            The position of the ``IMPORT_NAME`` instruction.
+
+        Returns
+        ----------
+        Optional[:class:`int`]
+            The level, or ``None`` if the two constants it consumes can't be found.
+
+        Notes
+        ----------
+        - ``IMPORT_NAME`` pops the level and the ``fromlist``, which are loaded as constants in that order. Other\
+        instructions may sit between them depending on the Python version, so the constants are searched for\
+        instead of being expected at a fixed offset.
+        """
+        constants = [instruction.argval for instruction in reversed(instructions[:index])
+                     if instruction.opname in DependencyGraph.constant_loads][:2]
+        if len(constants) < 2 or not isinstance(constants[1], int):
+            return None
+        return constants[1]
+
+    @staticmethod
+    def _get_code_imports(code: CodeType) -> Optional[set[str]]:
+        """
+        Collects the names of every absolute import executed by a code object and its nested functions and classes.
+
+        Parameters
+        ----------
+        code : :class:`CodeType`
+            The compiled code of a module.
+
+        Returns
+        ----------
+        Optional[:class:`set[str]`]
+            The imported module names, including the names imported from them, or ``None`` if the bytecode\
+            doesn't follow a known layout and the source has to be parsed instead.
+        """
+        names: set[str] = set()
+        pending: list[CodeType] = [code]
+        while pending:
+            current = pending.pop()
+            instructions = list(dis.get_instructions(current))
+            module: Optional[str] = None
+            for index, instruction in enumerate(instructions):
+                if instruction.opname == "IMPORT_NAME":
+                    level = DependencyGraph._get_import_level(instructions, index)
+                    if level is None:
+                        return None
+                    module = instruction.argval if level == 0 else None # Relative imports are skipped.
+                    if not module is None:
+                        parts = module.split(".")
+                        names.update(".".join(parts[:count]) for count in range(1, len(parts) + 1))
+                elif instruction.opname == "IMPORT_FROM" and not module is None:
+                    names.add(f"{module}.{instruction.argval}")
+            pending.extend(constant for constant in current.co_consts if isinstance(constant, CodeType))
+        return names
+
+    def find_dependencies(self: "DependencyGraph",
+                          module: ModuleType,
+                          source: Optional[str|bytes] = None,
+                          code: Optional[CodeType] = None) -> set[str]:
+        """
+        Finds the files of every module an executed module imported.
+
+        Parameters
+        ----------
+        module : :class:`ModuleType`
+            The executed module.
+        source : Optional[:class:`str|bytes`]
+            The source code of the module. Defaults to ``None``, which reads it from the module file.
+        code : Optional[:class:`CodeType`]
+            The compiled code the module was executed from. Defaults to ``None``. If provided, the imports are\
+            read from its bytecode instead of parsing the source again.
+
+        Returns
+        ----------
+        :class:`set[str]`
+            The absolute paths of all imported module files, excluding the module itself.
+
+        Notes
+        ----------
+        - Dependencies are found from the ``import`` statements of the source, including those inside of functions,\
+        and from the module objects and the defining modules of the classes and functions in the module namespace.\
+        Imports which haven't been executed yet are ignored.
+        - The source is parsed whenever the bytecode can't be read reliably.
+        """
+        names: set[str] = set()
+        filepath = self._get_module_file(module)
+        tree = ast.Module(body=[], type_ignores=[])
+        imports = None if code is None else self._get_code_imports(code)
+        if not imports is None:
+            names.update(imports)
+        else:
+            try:
+                if source is None and not filepath is None:
+                    with open(filepath, "rb") as file:
+                        source = file.read()
+                tree = ast.parse(source or "")
+            except (OSError, SyntaxError, ValueError): # pragma: no cover
+                pass
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    parts = alias.name.split(".")
+                    names.update(".".join(parts[:index]) for index in range(1, len(parts) + 1))
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names.add(node.module)
+                names.update(f"{node.module}.{alias.name}" for alias in node.names)
+        modules = [sys.modules.get(name, None) for name in names]
+        for value in list(vars(module).values()):
+            if isinstance(value, ModuleType):
+                modules.append(value)
+            elif isinstance(getattr(value, "__module__", None), str):
+                modules.append(sys.modules.get(value.__module__, None))
+        files = set(self._get_module_file(dependency) for dependency in modules)
+        files.discard(None)
+        files.discard(filepath)
+        return files
+
+    def record(self: "DependencyGraph", filepath: str, dependencies: set[str]|list[str]) -> None:
+        """
+        Replaces the recorded dependencies of a module.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the module file.
+        dependencies : :class:`set[str]|list[str]`
+            The paths of all module files it imports.
+        """
+        filepath = os.path.abspath(filepath)
+        dependencies = set(os.path.abspath(dependency) for dependency in dependencies)
+        dependencies.discard(filepath)
+        with self._lock:
+            for dependency in self._dependencies.get(filepath, set()).difference(dependencies):
+                self._dependents.get(dependency, set()).discard(filepath)
+            for dependency in dependencies:
+                self._dependents.setdefault(dependency, set()).add(filepath)
+            self._dependencies[filepath] = dependencies
+
+    def discard(self: "DependencyGraph", filepath: str) -> bool:
+        """
+        Forgets the recorded dependencies of a module. Modules importing it keep their edges.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the module file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the module was recorded, ``False`` otherwise.
+        """
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            dependencies = self._dependencies.pop(filepath, None)
+            for dependency in dependencies or set():
+                self._dependents.get(dependency, set()).discard(filepath)
+            return not dependencies is None
+
+    def get_dependencies(self: "DependencyGraph", filepath: str) -> set[str]:
+        """
+        Returns the modules a module imports directly.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the module file.
+
+        Returns
+        ----------
+        :class:`set[str]`
+            The absolute paths of the imported module files.
+        """
+        with self._lock:
+            return set(self._dependencies.get(os.path.abspath(filepath), set()))
+
+    def get_dependents(self: "DependencyGraph", filepath: str) -> set[str]:
+        """
+        Returns the modules which import a module directly.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the module file.
+
+        Returns
+        ----------
+        :class:`set[str]`
+            The absolute paths of the importing module files.
+        """
+        with self._lock:
+            return set(self._dependents.get(os.path.abspath(filepath), set()))
+
+    def get_affected(self: "DependencyGraph", filepaths: list[str]) -> set[str]:
+        """
+        Returns the changed modules together with every module which imports them, directly or indirectly.
+
+        Parameters
+        ----------
+        filepaths : :class:`list[str]`
+            The paths of the changed module files.
+
+        Returns
+        ----------
+        :class:`set[str]`
+            The absolute paths of all affected module files.
+        """
+        affected: set[str] = set()
+        pending: list[str] = [os.path.abspath(filepath) for filepath in filepaths]
+        with self._lock:
+            while pending:
+                filepath = pending.pop()
+                if not filepath in affected:
+                    affected.add(filepath)
+                    pending.extend(self._dependents.get(filepath, set()))
+        return affected
+
+    def get_reload_order(self: "DependencyGraph", filepaths: list[str]) -> list[list[str]]:
+        """
+        Orders the modules affected by a change so that every module is reloaded after the modules it imports.
+
+        Parameters
+        ----------
+        filepaths : :class:`list[str]`
+            The paths of the changed module files.
+
+        Returns
+        ----------
+        :class:`list[list[str]]`
+            The affected module files grouped into stages. The modules within a stage don't depend on each\
+            other and can be reloaded concurrently, while each stage must wait for the one before it.
+
+        Notes
+        ----------
+        - Modules which import each other in a cycle are reloaded together in a final stage.
+        """
+        affected = self.get_affected(filepaths)
+        with self._lock:
+            remaining = {filepath: self._dependencies.get(filepath, set()).intersection(affected)
+                         for filepath in affected}
+        stages: list[list[str]] = []
+        while remaining:
+            stage = sorted(filepath for filepath, dependencies in remaining.items() if not dependencies)
+            if not stage: # Only import cycles are left.
+                stages.append(sorted(remaining))
+                break
+            stages.append(stage)
+            for filepath in stage:
+                del remaining[filepath]
+            for dependencies in remaining.values():
+                dependencies.difference_update(stage)
+        return stages
@@ -15,19 +15,86 @@ from ..errors.cleanup import (
     PhotonNotInitializedError
 )
 from ..managers.resolver import Resolver
+from ..managers.events import EventBus, PhotonEvent
+from ..managers.stats import LifecycleStats
 from ..interfaces.photon import IPhoton
-from ..tools.utils import SystemUtils
+from ..tools.utils import ChecksumEngine, DigestUtils, SystemUtils
 from ..tools.logger import Logger
+from typing import Any, Awaitable, Callable, Optional
 import threading
-import hashlib
 import asyncio
+import inspect
 import psutil
+import time
 import sys
 import os
 
+class AbsorptionResult():
+    """Describes how a single photon was stopped while it was being unloaded."""
+    def __init__(self: "AbsorptionResult",
+                 name: str,
+                 filepath: str,
+                 duration: float = 0.0,
+                 timed_out: bool = False,
+                 error: Optional[BaseException] = None) -> None:
+        """
+        Initializes a new :class:`AbsorptionResult` instance.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        filepath : :class:`str`
+            The path of the photon file.
+        duration : Optional[:class:`float`]
+            The number of seconds it took to stop the photon. Defaults to ``0.0``.
+        timed_out : Optional[:class:`bool`]
+            A flag indicating if the finalizer missed its deadline and the photon was force-stopped. Defaults to ``False``.
+        error : Optional[:class:`BaseException`]
+            The error raised while stopping the photon, if any. Defaults to ``None``.
+        """
+        self.name: str = name
+        self.filepath: str = filepath
+        self.duration: float = duration
+        self.timed_out: bool = timed_out
+        self.error: Optional[BaseException] = error
+
+    @property
+    def is_absorbed(self: "AbsorptionResult") -> bool:
+        """
+        Returns a flag indicating if the photon was stopped and removed from the registry.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if stopping the photon didn't raise an error, ``False`` otherwise.
+        """
+        return self.error is None
+
+    def __str__(self: "AbsorptionResult") -> str:
+        """
+        Returns the current :class:`AbsorptionResult` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`AbsorptionResult` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
 class Handler():
     """Wraps an :class:`IPhoton` or another inherited photon base class and provides access to local instance information."""
-    def __init__(self: "Handler", logging: bool, name: str, filepath: str, checksum: str, instance: IPhoton|object) -> None:
+    def __init__(self: "Handler",
+                 logging: bool,
+                 name: str,
+                 filepath: str,
+                 checksum: str,
+                 instance: IPhoton|object,
+                 signature: Optional[object] = None,
+                 materializer: Optional[Callable[["Handler"], Awaitable[type]]] = None,
+                 stats: Optional[LifecycleStats] = None,
+                 events: Optional[EventBus] = None) -> None:
         """
         Initializes a new instance of the :class:`Handler` class.
 
@@ -41,6 +108,17 @@ class Handler():
             File path where the :class:`Handler` instance is located.
         instance : :class:`IPhoton|object` 
             Either an instance of :Class:`IPhoton` or an instance of another type :class:`object`.
+            Lazy handlers pass ``None`` and receive their type from the ``materializer``.
+        signature : Optional[:class:`PhotonSignature`]
+            The statically discovered signature of the photon, if there is one. Defaults to ``None``.
+        materializer : Optional[:class:`Callable[[Handler], Awaitable[type]]`]
+            A coroutine function which imports the photon module and returns the photon type the first\
+            time the photon is accessed. Defaults to ``None``, which means the handler is not lazy.
+        stats : Optional[:class:`LifecycleStats`]
+            The statistics which receive the instantiation, finalize, and cleanup durations of the photon.\
+            Defaults to ``None``, which doesn't measure anything.
+        events : Optional[:class:`EventBus`]
+            The bus which receives the ``started`` and ``failed`` events of the photon. Defaults to ``None``.
 
         Notes
         ----------
@@ -59,6 +137,12 @@ class Handler():
         self._filepath: str = filepath
         self._checksum: str = checksum
         self._instance: IPhoton|object = instance
+        self._signature: Optional[object] = signature
+        self._materializer: Optional[Callable[["Handler"], Awaitable[type]]] = materializer
+        self._stats: Optional[LifecycleStats] = stats
+        self._events: Optional[EventBus] = events
+        self._initializing: Optional[asyncio.Task] = None
+        self._ready: bool = False
 
     def __str__(self) -> str:
         """
@@ -107,12 +191,84 @@ class Handler():
             The checksum of the original file containing the photon.
         """
         return self._checksum
+
+    @property
+    def is_lazy(self: "Handler") -> bool:
+        """
+        Returns a flag indicating if the photon is still waiting to be imported on first access.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon module hasn't been imported yet, ``False`` otherwise.
+        """
+        return self._materializer is not None and self._instance is None
+
+    @property
+    def is_started(self: "Handler") -> bool:
+        """
+        Returns a flag indicating if the photon has been instantiated.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon has been started, ``False`` otherwise.
+        """
+        return isinstance(self._instance, tuple)
+
+    @property
+    def is_ready(self: "Handler") -> bool:
+        """
+        Returns a flag indicating if the photon has been instantiated and its initializer has completed.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon is ready to be used, ``False`` otherwise.
+        """
+        return self.is_started and self._ready
+
+    @property
+    def instance(self: "Handler") -> Optional[IPhoton|object]:
+        """
+        Returns the running photon instance without starting or importing it.
+
+        Returns
+        ----------
+        Optional[:class:`IPhoton|object`]
+            The photon instance, or ``None`` if the photon hasn't been started or isn't ready yet.
+        """
+        return self._instance[0] if self.is_ready else None
+
+    @property
+    def metadata(self: "Handler") -> dict[str, Any]:
+        """
+        Returns the metadata of the photon, without importing it if it was statically discovered.
+
+        Returns
+        ----------
+        :class:`dict[str, Any]`
+            The ``name``, ``author``, ``version``, ``description``, and ``tags`` of the photon, or an empty\
+            dictionary if the photon isn't an :class:`IPhoton`.
+        """
+        if not self._signature is None:
+            return dict(getattr(self._signature, "metadata", {}))
+        photon_type = self._instance[1] if self.is_started else self._instance
+        if isinstance(photon_type, type) and issubclass(photon_type, IPhoton):
+            return {
+                "name": photon_type.__photon_name__,
+                "author": photon_type.photon_author,
+                "version": photon_type.photon_version,
+                "description": photon_type.photon_description,
+                "tags": photon_type.photon_tags
+            }
+        return {}
     
     @staticmethod
-    async def _get_checksum(filename: str, block: int = 2**20) -> str|None:
+    async def _get_checksum(filename: str, block: int = 2**20, algorithm: str = "sha512") -> str|None:
         """``|coro|``
 
-        Generates a calculated ``SHA512`` hash for a given file.
+        Generates a calculated ``SHA512`` hash, or another supported digest, for a given file.
 
         Parameters
         ----------
@@ -120,40 +276,47 @@ class Handler():
             The name of the file to generate the checksum for.
         block : Optional[:class:`int`]
             Chunk size to read and hash the file in bytes. Default is ``2^20``.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
 
         Returns
         ----------
         Optional[:class:`str`]
-            The calculated ``SHA512`` hash of the file, or ``None`` if there was an error generating the checksum.
+            The calculated hash of the file, or ``None`` if there was an error generating the checksum.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is not supported.
 
         Notes
         ----------
-        - This function generates a ``SHA512`` hash for a given file by reading the file in blocks and hashing each block.\
-        The generated hash is a digest checksum (a unique fixed-sized representation of the file content).\
-        The file is treated as a binary file (read in 'rb' mode) for proper handling of all types of files.
+        - This function generates a ``SHA512`` hash for a given file with the :class:`ChecksumEngine`, which hashes\
+        the whole file in a single executor job, so the event loop is never blocked and doesn't wake up per block.\
+        The generated hash is a digest checksum (a unique fixed-sized representation of the file content).
         - The reason ``SHA512`` was chosen is purely for the lack of collisions at runtime when performing dynamic checks.
         - If the specified file cannot be found or if there are any errors while generating the checksum, returns ``None``.
         
         """
+        DigestUtils.new(algorithm) # Unsupported algorithms are rejected before the file is checked.
         if not os.path.isfile(filename):
             return None
         try:
-            checksum = hashlib.sha512()
-            with open(filename, 'rb') as file:
-                loop = asyncio.get_running_loop()
-                while True:
-                    data = await loop.run_in_executor(None, file.read, block)
-                    if not data: break
-                    checksum.update(data)
-            return checksum.hexdigest()
+            return await ChecksumEngine.hash_file_async(filename, algorithm, block)
         except IOError as error: # pragma: no cover
             raise IOError(f"Checksum generation error: {error}")
     
-    async def _clear_module_references(self: "Handler") -> bool:
+    async def _clear_module_references(self: "Handler", release_modules: bool = True) -> bool:
         """``|coro|``
 
         Clears all references for the current handler module and its submodules in `sys.modules`.
 
+        Parameters
+        ----------
+        release_modules : Optional[:class:`bool`]
+            If ``False``, only the instance is released and ``sys.modules`` is left alone, e.g. because a newer\
+            version of the module already replaced it. Defaults to ``True``.
+
         Returns
         ----------
         :class:`bool`
@@ -168,11 +331,16 @@ class Handler():
         try:
             await SystemUtils.continue_async()
             self._instance = None
-            resolved_name = self._resolver.resolve_path(self._filepath)[0]
-            sys.modules.pop(resolved_name, None)
-            for module in list(sys.modules.keys()):
-                if SystemUtils.is_submodule(self._name, module):
-                    del sys.modules[module] # pragma: no cover
+            self._initializing = None
+            self._ready = False
+            if not release_modules:
+                return True
+            with LifecycleStats.timer(self._stats, self._filepath, "cleanup"):
+                resolved_name = self._resolver.resolve_path(self._filepath)[0]
+                sys.modules.pop(resolved_name, None)
+                for module in list(sys.modules.keys()):
+                    if SystemUtils.is_submodule(self._name, module):
+                        del sys.modules[module] # pragma: no cover
             return True
         except: return False # pragma: no cover
 
@@ -237,7 +405,7 @@ class Handler():
             if self.logging:# pragma: no cover
                 self._logger.error("Photon child processes could not be terminated!")
 
-    async def _stop(self: "Handler", force_stop: bool = False) -> None:
+    async def _stop(self: "Handler", force_stop: bool = False, release_modules: bool = True) -> None:
         """``|coro|``
 
         This function stops the running :class:`IPhoton` instance, halting all the child threads and processes of the instance 
@@ -249,12 +417,18 @@ class Handler():
         ----------
         force_stop : Optional[:class:`bool`] 
             A boolean flag indicating whether to forcefully stop the photon instance. Default is ``False``.
+        release_modules : Optional[:class:`bool`]
+            If ``False``, the photon module is left in ``sys.modules``, e.g. when a reloaded version replaced it.\
+            Default is ``True``.
 
         Raises
         ----------
         PhotonNotInitializedError
             If the photon has not been initialized.
         """
+        if self.is_lazy: # Nothing was ever imported or instantiated.
+            self._materializer = None
+            return
         if isinstance(self._instance, tuple):
             current_instance = self._instance[0]
             if force_stop: await self._force_stop()
@@ -263,14 +437,112 @@ class Handler():
                     finalizer = getattr(current_instance, "finalize")
                     if callable(finalizer): # pragma: no branch
                         try: 
-                            await finalizer()
+                            with LifecycleStats.timer(self._stats, self._filepath, "finalize", self._name):
+                                await finalizer()
                         except FinalizerNotImplementedError as error:
                             raise error
                         except Exception as error: # pragma: no cover
                             raise error
-            await self._clear_module_references()
+            await self._clear_module_references(release_modules)
         else: raise PhotonNotInitializedError("The photon has not been initialized.")
     
+    async def materialize(self: "Handler") -> bool:
+        """``|coro|``
+
+        Imports the module of a lazy photon and binds its type to the current :class:`Handler` without starting it.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon type is available, ``False`` if it couldn't be imported.
+        """
+        if self.is_lazy:
+            photon_type = await self._materializer(self)
+            if self._instance is None and not photon_type is None: # Another caller may have finished first.
+                self._instance = photon_type
+        return not self._instance is None
+
+    async def get_instance(self: "Handler") -> Optional[IPhoton|object]:
+        """``|coro|``
+
+        Returns the running photon instance, importing and starting the photon first if necessary.
+
+        Returns
+        ----------
+        Optional[:class:`IPhoton|object`]
+            The photon instance, or ``None`` if the photon couldn't be imported or started.
+        """
+        if not self.is_started:
+            await self.start()
+        return self.instance
+
+    def _create_instance(self: "Handler", instance_type: type) -> IPhoton|object:
+        """
+        Instantiates the photon type. Subclasses override this to run the photon elsewhere.
+
+        Parameters
+        ----------
+        instance_type : :class:`type`
+            The photon type.
+
+        Returns
+        ----------
+        :class:`IPhoton|object`
+            The new photon instance.
+        """
+        return instance_type()
+
+    async def _initialize(self: "Handler") -> bool:
+        """``|coro|``
+
+        Awaits the asynchronous ``initialize()`` hook of the photon instance, if it has one, and marks the photon as ready.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon is ready, ``False`` if its initializer raised an error.
+
+        Notes
+        ----------
+        - Only coroutine functions are awaited, so a synchronous ``initialize()`` method of a class which isn't\
+        an :class:`IPhoton` is never called by accident.
+        - A photon whose initializer failed keeps its instance, so its finalizer can still release whatever was\
+        set up, but it is never marked as ready until it is reloaded.
+        """
+        initializer = getattr(self._instance[0], "initialize", None)
+        if inspect.iscoroutinefunction(initializer):
+            try:
+                await initializer()
+            except Exception as error:
+                if self.logging: # pragma: no cover
+                    self._logger.error(f"Photon '{self._name}' could not be initialized! ({error})")
+                return False
+        self._ready = True
+        return True
+
+    async def _run_initializer(self: "Handler", started: float) -> bool:
+        """``|coro|``
+
+        Initializes the photon through :func:`_initialize()` and reports whether it started.
+
+        Parameters
+        ----------
+        started : :class:`float`
+            The :func:`time.perf_counter()` timestamp at which the photon started being instantiated.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon is ready, ``False`` otherwise.
+        """
+        ready = await self._initialize()
+        if not ready and not self._stats is None:
+            self._stats.count(self._filepath, "failures")
+        if not self._events is None and self._events.active:
+            self._events.emit(PhotonEvent("started" if ready else "failed", self._filepath, self._name,
+                                          time.perf_counter() - started))
+        return ready
+
     async def start(self: "Handler") -> None:
         """``|coro|``
 
@@ -280,15 +552,26 @@ class Handler():
         ----------
         - If already started, it checks if it's a :class:`tuple`. If the instance is not a :class:`tuple`, it\
         initializes the ``IPhoton`` instance and stores it as a tuple with a second value set to ``True``.
+        - Lazy photons are imported by calling :func:`materialize()` before they are instantiated.
+        - The ``initialize()`` hook of the instance is awaited afterward. Callers which start the photon while\
+        it is still initializing wait for the same initializer instead of running it again.
         """
         await SystemUtils.continue_async()
+        await self.materialize()
         if not self._instance is None:
             if type(self._instance) is not tuple: # pragma: no branch
                 try:
+                    started = time.perf_counter()
                     instance_type = self._instance
-                    instance = self._instance()
+                    with LifecycleStats.timer(self._stats, self._filepath, "instantiation", self._name):
+                        instance = self._create_instance(instance_type)
                     self._instance = (instance, instance_type)
                 except Exception as error: # pragma: no cover
                     if self.logging:
                         self._logger.error(f"Photon started in partial-mode due to the following: {error}")
-                        self._instance = (None, None)
\ No newline at end of file
+                        self._instance = (None, None)
+                if self.is_started and not self._instance[0] is None:
+                    self._initializing = asyncio.ensure_future(self._run_initializer(started))
+        initializing = self._initializing
+        if not initializing is None and initializing.get_loop() is asyncio.get_running_loop():
+            await initializing
\ No newline at end of file
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# ########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for statically discovering photons and their
+# metadata from source files by parsing them instead of executing them.
+# #########################################################################
+from ..interfaces.photon import IPhoton
+from typing import Any, Optional
+import builtins
+import inspect
+import ast
+
+class PhotonSignature():
+    """Describes a photon class which was discovered in a source file without importing it."""
+    def __init__(self: "PhotonSignature",
+                 name: str,
+                 class_name: str,
+                 filepath: str,
+                 bases: list[str],
+                 metadata: dict[str, Any],
+                 is_photon: bool,
+                 lineno: int) -> None:
+        """
+        Initializes a new :class:`PhotonSignature` instance.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name the photon will be registered under once it is loaded.
+        class_name : :class:`str`
+            The name of the class as it is defined in the source file.
+        filepath : :class:`str`
+            The path of the source file containing the class.
+        bases : :class:`list[str]`
+            The resolved names of the base classes of the class.
+        metadata : :class:`dict[str, Any]`
+            The photon metadata, e.g. ``name``, ``author``, ``version``, ``description``, and ``tags``.
+        is_photon : :class:`bool`
+            A flag indicating if the class derives from :class:`IPhoton`.
+        lineno : :class:`int`
+            The line on which the class is defined.
+        """
+        self.name: str = name
+        self.class_name: str = class_name
+        self.filepath: str = filepath
+        self.bases: list[str] = bases
+        self.metadata: dict[str, Any] = metadata
+        self.is_photon: bool = is_photon
+        self.lineno: int = lineno
+
+    def __str__(self: "PhotonSignature") -> str:
+        """
+        Returns the current :class:`PhotonSignature` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`PhotonSignature` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+class Inspector():
+    """Discovers photons by parsing Python source files with :mod:`ast`, without running any of their code."""
+    metadata_keywords: tuple[str, ...] = ("name", "author", "version", "description", "tags")
+
+    def __init__(self: "Inspector", photon_base: type = IPhoton, other_classes: list[str] = []) -> None:
+        """
+        Initializes a new :class:`Inspector` instance.
+
+        Parameters
+        ----------
+        photon_base : Optional[:class:`type`]
+            The base class that all photons of the system will inherit from. Defaults to :class:`IPhoton`.
+        other_classes : Optional[:class:`list[str]`]
+            A list of additional class names to discover instead of subclasses of ``photon_base``. Defaults to ``[]``.
+
+        Notes
+        ----------
+        - Base classes are matched by name, following ``import ... as ...`` aliases and attribute access such as\
+        ``photon.IPhoton``. Classes deriving from another photon defined earlier in the same file are discovered too.
+        - Classes which are created dynamically, or whose base class is only reachable through a star import\
+        under a different name, cannot be seen statically.
+        - A class deriving from a base which is neither a builtin nor defined in the same file, such as an\
+        intermediate photon imported from another module, makes the result inconclusive instead of empty.
+        """
+        self._photon_base: type = photon_base
+        self._other_classes: list[str] = list(other_classes)
+
+    @staticmethod
+    def _resolve_name(node: ast.expr, aliases: dict[str, str]) -> Optional[str]:
+        """
+        Resolves the name of a base class expression, following import aliases.
+
+        Parameters
+        ----------
+        node : :class:`ast.expr`
+            The base class expression of a class definition.
+        aliases : :class:`dict[str, str]`
+            A mapping of local names to the names they were imported as.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The resolved class name, or ``None`` if the expression isn't a plain or dotted name.
+        """
+        if isinstance(node, ast.Name):
+            return aliases.get(node.id, node.id)
+        if isinstance(node, ast.Attribute):
+            return node.attr
+        if isinstance(node, ast.Subscript): # Generic bases such as ``Base[T]``.
+            return Inspector._resolve_name(node.value, aliases)
+        return None
+
+    @staticmethod
+    def _get_aliases(tree: ast.Module) -> dict[str, str]:
+        """
+        Collects all top-level ``import ... as ...`` and ``from ... import ... as ...`` aliases of a module.
+
+        Parameters
+        ----------
+        tree : :class:`ast.Module`
+            The parsed module.
+
+        Returns
+        ----------
+        :class:`dict[str, str]`
+            A mapping of local names to the names they were imported as.
+        """
+        aliases: dict[str, str] = {}
+        for node in tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.asname:
+                        aliases[alias.asname] = alias.name.split(".")[-1]
+        return aliases
+
+    def _get_metadata(self: "Inspector", node: ast.ClassDef, is_photon: bool) -> dict[str, Any]:
+        """
+        Extracts the photon metadata of a class definition, applying the same defaults as :class:`IPhotonMeta`.
+
+        Parameters
+        ----------
+        node : :class:`ast.ClassDef`
+            The class definition.
+        is_photon : :class:`bool`
+            A flag indicating if the class derives from :class:`IPhoton`.
+
+        Returns
+        ----------
+        :class:`dict[str, Any]`
+            The metadata of the class. Keyword values which aren't literals are returned as ``None``.
+        """
+        keywords: dict[str, Any] = {}
+        for keyword in node.keywords:
+            if keyword.arg in self.metadata_keywords:
+                try: keywords[keyword.arg] = ast.literal_eval(keyword.value)
+                except ValueError: keywords[keyword.arg] = None
+        if not is_photon:
+            return keywords
+        description = keywords.get("description", None)
+        if description is None:
+            description = inspect.cleandoc(ast.get_docstring(node, clean=False) or "")
+        return {
+            "name": keywords.get("name", node.name),
+            "author": keywords.get("author", "Unknown"),
+            "version": keywords.get("version", "0.0.0"),
+            "description": description,
+            "tags": keywords.get("tags", ["luminal", "photon"])
+        }
+
+    def inspect_source(self: "Inspector", source: str|bytes, filepath: str = "<photon>") -> Optional[list[PhotonSignature]]:
+        """
+        Discovers all photons defined in the provided source code.
+
+        Parameters
+        ----------
+        source : :class:`str|bytes`
+            The Python source code to inspect.
+        filepath : Optional[:class:`str`]
+            The path the source was read from, used for the signatures and syntax errors. Defaults to ``<photon>``.
+
+        Returns
+        ----------
+        Optional[:class:`list[PhotonSignature]`]
+            The discovered photons, ordered by class name just like :func:`dir()` orders an imported module, or\
+            ``None`` if a class derives from a base that cannot be resolved without importing the source.
+
+        Raises
+        ----------
+        SyntaxError
+            If the source code cannot be parsed.
+        """
+        tree = ast.parse(source, filename=filepath)
+        aliases = self._get_aliases(tree)
+        base_name: str = self._photon_base.__name__
+        derived: set[str] = {base_name}
+        photons: set[str] = {IPhoton.__name__}
+        known: set[str] = {base_name, IPhoton.__name__, *dir(builtins)}
+        signatures: list[PhotonSignature] = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            resolved = [self._resolve_name(base, aliases) for base in node.bases]
+            bases = [name for name in resolved if name]
+            is_derived = node.name != base_name and any(base in derived for base in bases)
+            if not self._other_classes and not is_derived and any(not base in known for base in resolved):
+                return None # The class might derive from a photon defined in another module.
+            known.add(node.name)
+            is_photon = any(base in photons for base in bases)
+            if is_derived: derived.add(node.name)
+            if is_photon: photons.add(node.name)
+            if self._other_classes and node.name in self._other_classes or \
+                (not self._other_classes and is_derived):
+                metadata = self._get_metadata(node, is_photon)
+                signatures.append(PhotonSignature(node.name, node.name, filepath, bases,
+                                                  metadata, is_photon, node.lineno))
+        return sorted(signatures, key=lambda signature: signature.class_name)
+
+    def inspect_file(self: "Inspector", filepath: str) -> Optional[list[PhotonSignature]]:
+        """
+        Discovers all photons defined in a Python source file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the source file.
+
+        Returns
+        ----------
+        Optional[:class:`list[PhotonSignature]`]
+            The discovered photons, ordered by class name, or ``None`` if the file has to be imported to tell.
+
+        Raises
+        ----------
+        OSError
+            If the file cannot be read.
+        SyntaxError
+            If the source code cannot be parsed.
+        """
+        with open(filepath, "rb") as file:
+            return self.inspect_source(file.read(), filepath)
@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for running selected photons in worker processes
+# and forwarding calls to them, so compute photons can use every CPU core.
+# #########################################################################
+from ..errors.system import PhotonProcessError
+from ..managers.handler import Handler
+from ..managers.events import EventBus
+from ..managers.stats import LifecycleStats
+from ..interfaces.photon import IPhoton
+from multiprocessing.connection import Connection
+from typing import Any, Awaitable, Callable, Optional
+import importlib.util as util
+import multiprocessing
+import threading
+import asyncio
+import inspect
+import sys
+
+def _serve_photon(connection: Connection, filepath: str, module_name: str, class_name: str) -> None:
+    """
+    Hosts a single photon instance inside of a worker process until the parent asks it to stop.
+
+    Parameters
+    ----------
+    connection : :class:`Connection`
+        The worker end of the duplex pipe to the parent.
+    filepath : :class:`str`
+        The path of the photon file.
+    module_name : :class:`str`
+        The name the photon module is imported under.
+    class_name : :class:`str`
+        The name of the photon class inside of the module.
+
+    Notes
+    ----------
+    - Every request is a tuple whose first item names the operation, and every reply is either\
+    ``("result", value)`` or ``("error", exception)``. Coroutines returned by the photon are run to\
+    completion on the event loop of the worker before the reply is sent.
+    - The worker exits on its own when the parent closes its end of the pipe.
+    """
+    loop = asyncio.new_event_loop()
+    instance: Any = None
+    def _resolve(value: Any) -> Any:
+        return loop.run_until_complete(value) if inspect.isawaitable(value) else value
+    while True:
+        try: message = connection.recv()
+        except (EOFError, OSError): break # The parent is gone.
+        operation = message[0]
+        try:
+            if operation == "start":
+                spec = util.spec_from_file_location(module_name, filepath)
+                module = util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                instance = getattr(module, class_name)()
+                initializer = getattr(instance, "initialize", None)
+                if inspect.iscoroutinefunction(initializer):
+                    loop.run_until_complete(initializer())
+                reply = ("result", {name: inspect.iscoroutinefunction(member)
+                                    for name, member in inspect.getmembers(type(instance), callable)
+                                    if not name.startswith("_") and not inspect.isclass(member)})
+            elif operation == "call":
+                reply = ("result", _resolve(getattr(instance, message[1])(*message[2], **message[3])))
+            elif operation == "get":
+                reply = ("result", getattr(instance, message[1]))
+            elif operation == "finalize":
+                finalizer = getattr(instance, "finalize", None)
+                reply = ("result", _resolve(finalizer()) if callable(finalizer) else None)
+            else: # Anything else stops the worker.
+                connection.send(("result", None))
+                break
+        except Exception as error:
+            reply = ("error", error)
+        try:
+            connection.send(reply)
+        except Exception as error: # The result or error cannot be pickled.
+            connection.send(("error", PhotonProcessError(f"The reply of '{operation}' could not be sent back! "
+                                                         f"({type(error).__name__}: {error})")))
+    loop.close()
+    connection.close()
+
+class PhotonProcess():
+    """Runs a single photon instance in a worker process and forwards requests to it over a duplex pipe."""
+    start_method: str = "spawn"
+
+    def __init__(self: "PhotonProcess", name: str, filepath: str, module_name: str, class_name: str) -> None:
+        """
+        Initializes a new :class:`PhotonProcess` instance. The worker process is created by :func:`start()`.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        filepath : :class:`str`
+            The path of the photon file.
+        module_name : :class:`str`
+            The name the photon module is imported under inside of the worker.
+        class_name : :class:`str`
+            The name of the photon class inside of the module.
+
+        Notes
+        ----------
+        - Workers are created with the ``spawn`` start method, so they never inherit the threads, locks, or\
+        event loop of the loader, and imports of the photon module never leak into the parent.
+        - Requests travel over a :func:`multiprocessing.Pipe`, a socket pair carrying pickled messages, without\
+        a manager process or queue feeder threads in between. Requests to the same worker are serialized.
+        """
+        self._name: str = name
+        self._filepath: str = filepath
+        self._module_name: str = module_name
+        self._class_name: str = class_name
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._connection: Optional[Connection] = None
+        self._methods: dict[str, bool] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __str__(self: "PhotonProcess") -> str:
+        """
+        Returns the current :class:`PhotonProcess` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`PhotonProcess` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+    @property
+    def pid(self: "PhotonProcess") -> Optional[int]:
+        """
+        Returns the process id of the worker.
+
+        Returns
+        ----------
+        Optional[:class:`int`]
+            The process id, or ``None`` if the worker was never started.
+        """
+        return None if self._process is None else self._process.pid
+
+    @property
+    def is_alive(self: "PhotonProcess") -> bool:
+        """
+        Returns a flag indicating if the worker process is running.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the worker is running, ``False`` otherwise.
+        """
+        return not self._process is None and self._process.is_alive()
+
+    @property
+    def methods(self: "PhotonProcess") -> dict[str, bool]:
+        """
+        Returns the public methods of the photon running in the worker.
+
+        Returns
+        ----------
+        :class:`dict[str, bool]`
+            The name of every method and a flag indicating if it is a coroutine function.
+        """
+        return dict(self._methods)
+
+    def _spawn(self: "PhotonProcess") -> None:
+        """
+        Creates the worker process and the pipe connecting the parent to it.
+        """
+        context = multiprocessing.get_context(self.start_method)
+        connection, worker_connection = context.Pipe(duplex=True)
+        self._process = context.Process(target=_serve_photon,
+                                        args=(worker_connection, self._filepath, self._module_name, self._class_name),
+                                        name=f"luminal-{self._name}",
+                                        daemon=True)
+        self._process.start()
+        worker_connection.close() # The worker owns its end now.
+        self._connection = connection
+
+    def request(self: "PhotonProcess", *message: Any) -> Any:
+        """
+        Sends a request to the worker and blocks until it replies.
+
+        Parameters
+        ----------
+        *message : :class:`Any`
+            The operation followed by its arguments, all of which must be picklable.
+
+        Returns
+        ----------
+        :class:`Any`
+            The result of the operation.
+
+        Raises
+        ----------
+        PhotonProcessError
+            If the worker isn't running or exits before it replies.
+        Exception
+            Any error raised by the photon inside of the worker.
+        """
+        with self._lock:
+            if self._connection is None:
+                raise PhotonProcessError(f"The worker process of photon '{self._name}' is not running!")
+            try:
+                self._connection.send(message)
+                status, value = self._connection.recv()
+            except (EOFError, OSError) as error:
+                raise PhotonProcessError(f"The worker process of photon '{self._name}' exited unexpectedly!") from error
+        if status == "error":
+            raise value
+        return value
+
+    async def request_async(self: "PhotonProcess", *message: Any) -> Any:
+        """``|coro|``
+
+        Sends a request to the worker on the default executor without blocking the event loop.
+
+        Parameters
+        ----------
+        *message : :class:`Any`
+            The operation followed by its arguments, all of which must be picklable.
+
+        Returns
+        ----------
+        :class:`Any`
+            The result of the operation.
+
+        Raises
+        ----------
+        PhotonProcessError
+            If the worker isn't running or exits before it replies.
+        Exception
+            Any error raised by the photon inside of the worker.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.request(*message))
+
+    async def start(self: "PhotonProcess") -> dict[str, bool]:
+        """``|coro|``
+
+        Creates the worker process, which imports the photon module, instantiates the photon, and awaits its\
+        ``initialize()`` hook.
+
+        Returns
+        ----------
+        :class:`dict[str, bool]`
+            The public methods of the photon and whether each of them is a coroutine function.
+
+        Raises
+        ----------
+        PhotonProcessError
+            If the worker exits before the photon is ready.
+        Exception
+            Any error raised while importing, instantiating, or initializing the photon.
+        """
+        if self._connection is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._spawn)
+        self._methods = await self.request_async("start")
+        return self.methods
+
+    async def finalize(self: "PhotonProcess") -> Any:
+        """``|coro|``
+
+        Calls the finalizer of the photon inside of the worker, if it has one.
+
+        Returns
+        ----------
+        :class:`Any`
+            The result of the finalizer.
+        """
+        return await self.request_async("finalize")
+
+    async def stop(self: "PhotonProcess", timeout: float = 1.0) -> None:
+        """``|coro|``
+
+        Asks the worker to exit, and terminates it if it doesn't exit in time.
+
+        Parameters
+        ----------
+        timeout : Optional[:class:`float`]
+            The number of seconds to wait for the worker to exit. Defaults to ``1.0``.
+        """
+        if self.is_alive:
+            try: await asyncio.wait_for(self.request_async("stop"), timeout)
+            except (asyncio.TimeoutError, PhotonProcessError): pass
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.terminate, timeout)
+
+    def terminate(self: "PhotonProcess", timeout: float = 1.0) -> None:
+        """
+        Terminates the worker immediately, without finalizing the photon, and closes the pipe.
+
+        Parameters
+        ----------
+        timeout : Optional[:class:`float`]
+            The number of seconds to wait for the worker to exit before it is killed. Defaults to ``1.0``.
+
+        Notes
+        ----------
+        - Closing the pipe wakes up any request that is still waiting for the worker with a :class:`PhotonProcessError`.
+        """
+        process, connection = self._process, self._connection
+        if not process is None:
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout)
+            if process.is_alive(): # pragma: no cover
+                process.kill()
+                process.join(timeout)
+        if not connection is None:
+            connection.close()
+        self._connection = None
+        self._methods = {}
+
+class PhotonProxy():
+    """Stands in for a photon instance which runs in a worker process, forwarding every public method call to it."""
+    def __init__(self: "PhotonProxy", process: PhotonProcess) -> None:
+        """
+        Initializes a new :class:`PhotonProxy` instance.
+
+        Parameters
+        ----------
+        process : :class:`PhotonProcess`
+            The worker process running the photon.
+
+        Notes
+        ----------
+        - Coroutine methods of the photon are exposed as coroutine methods which wait for the worker on the\
+        default executor, so awaiting them never blocks the event loop. Synchronous methods block until the\
+        worker replies, exactly like calling the photon directly.
+        - Other public attributes are fetched from the worker on every access. Arguments and results must be picklable.
+        """
+        self._process: PhotonProcess = process
+
+    def __getattr__(self: "PhotonProxy", name: str) -> Any:
+        """
+        Returns a forwarding method, or the current value of an attribute of the photon.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the attribute.
+
+        Returns
+        ----------
+        :class:`Any`
+            A callable for methods, otherwise the attribute value inside of the worker.
+
+        Raises
+        ----------
+        AttributeError
+            If the attribute is private or doesn't exist on the photon.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        methods = self._process.methods
+        if not name in methods:
+            return self._process.request("get", name)
+        if methods[name]:
+            async def _forward(*args: Any, **kwargs: Any) -> Any:
+                return await self._process.request_async("call", name, args, kwargs)
+        else:
+            def _forward(*args: Any, **kwargs: Any) -> Any:
+                return self._process.request("call", name, args, kwargs)
+        _forward.__name__ = name
+        return _forward
+
+    def __repr__(self: "PhotonProxy") -> str:
+        """
+        Returns the current :class:`PhotonProxy` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            The name of the photon class and the process id of its worker.
+        """
+        return f"<PhotonProxy of '{self._process._class_name}' in process {self._process.pid}>"
+
+class IsolatedHandler(Handler):
+    """A :class:`Handler` whose photon is instantiated in a worker process and used through a :class:`PhotonProxy`."""
+    def __init__(self: "IsolatedHandler",
+                 logging: bool,
+                 name: str,
+                 filepath: str,
+                 checksum: str,
+                 instance: IPhoton|object,
+                 signature: Optional[object] = None,
+                 materializer: Optional[Callable[[Handler], Awaitable[type]]] = None,
+                 stats: Optional[LifecycleStats] = None,
+                 events: Optional[EventBus] = None) -> None:
+        """
+        Initializes a new instance of the :class:`IsolatedHandler` class.
+
+        Parameters
+        ----------
+        logging : :class:`bool`
+            Flag to initialize logging or not.
+        name : :class:`str`
+            The name of the :class:`Handler`.
+        filepath : :class:`str`
+            File path where the :class:`Handler` instance is located.
+        instance : :class:`IPhoton|object`
+            The photon type, which is only used for metadata in the parent. Lazy handlers pass ``None``.
+        signature : Optional[:class:`PhotonSignature`]
+            The statically discovered signature of the photon, if there is one. Defaults to ``None``.
+        materializer : Optional[:class:`Callable[[Handler], Awaitable[type]]`]
+            A coroutine function which imports the photon module on first access. Defaults to ``None``.
+        stats : Optional[:class:`LifecycleStats`]
+            The statistics which receive the lifecycle durations of the photon. Defaults to ``None``.
+        events : Optional[:class:`EventBus`]
+            The bus which receives the ``started`` and ``failed`` events of the photon. Defaults to ``None``.
+
+        Notes
+        ----------
+        - Starting the photon spawns its worker, which runs ``initialize()``. Unloading it runs ``finalize()``\
+        inside of the worker and then stops the worker, while a forced stop terminates the worker outright,\
+        which also ends every thread and child process the photon started.
+        - A reload replaces the handler, and therefore the worker, like any other photon.
+        """
+        super().__init__(logging, name, filepath, checksum, instance, signature, materializer, stats, events)
+        self._process: Optional[PhotonProcess] = None
+
+    @property
+    def process(self: "IsolatedHandler") -> Optional[PhotonProcess]:
+        """
+        Returns the worker process of the photon.
+
+        Returns
+        ----------
+        Optional[:class:`PhotonProcess`]
+            The worker process, or ``None`` if the photon hasn't been started.
+        """
+        return self._process
+
+    def _create_instance(self: "IsolatedHandler", instance_type: type) -> PhotonProxy:
+        """
+        Creates the worker process of the photon and returns the proxy standing in for its instance.
+
+        Parameters
+        ----------
+        instance_type : :class:`type`
+            The photon type.
+
+        Returns
+        ----------
+        :class:`PhotonProxy`
+            The proxy of the photon, which becomes usable once the worker is initialized.
+        """
+        module_name = self._resolver.resolve_path(self._filepath)[0]
+        self._process = PhotonProcess(self._name, self._filepath, module_name, instance_type.__name__)
+        return PhotonProxy(self._process)
+
+    async def _initialize(self: "IsolatedHandler") -> bool:
+        """``|coro|``
+
+        Starts the worker process, which instantiates and initializes the photon, and marks the photon as ready.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the photon is ready, ``False`` if its worker couldn't start it.
+        """
+        try:
+            await self._process.start()
+        except Exception as error:
+            if self.logging: # pragma: no cover
+                self._logger.error(f"Photon '{self._name}' could not be started in its worker process! ({error})")
+            return False
+        self._ready = True
+        return True
+
+    async def _force_stop(self: "IsolatedHandler") -> None:
+        """``|coro|``
+
+        Terminates the worker process of the photon without finalizing it.
+        """
+        if not self._process is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._process.terminate)
+
+    async def _stop(self: "IsolatedHandler", force_stop: bool = False, release_modules: bool = True) -> None:
+        """``|coro|``
+
+        Finalizes the photon inside of its worker, unless ``force_stop`` is ``True``, and stops the worker.
+
+        Parameters
+        ----------
+        force_stop : Optional[:class:`bool`]
+            A boolean flag indicating whether to terminate the worker without finalizing. Default is ``False``.
+        release_modules : Optional[:class:`bool`]
+            If ``False``, the photon module is left in the ``sys.modules`` of the parent. Default is ``True``.
+
+        Raises
+        ----------
+        PhotonNotInitializedError
+            If the photon has not been initialized.
+        FinalizerNotImplementedError
+            If the photon doesn't implement its finalizer. The worker is stopped regardless.
+        """
+        if not self.is_started or self._process is None:
+            return await super()._stop(force_stop, release_modules)
+        process = self._process
+        try:
+            if force_stop: await self._force_stop()
+            elif process.is_alive:
+                with LifecycleStats.timer(self._stats, self.filepath, "finalize", self.name):
+                    await process.finalize()
+        finally:
+            await process.stop()
+            self._process = None
+            await self._clear_module_references(release_modules)
@@ -11,25 +11,56 @@
 # #########################################################################
 from ..errors.threads import ThreadManagerAlreadyRunningError
 from ..errors.system import DirectoryNotFoundError
-from ..errors.cleanup import PhotonNotFoundError
-from ..managers.threads import ThreadManager
+from ..errors.cleanup import PhotonCollisionError, PhotonNotFoundError
+from ..managers.threads import CancellableThread, ThreadManager
 from ..managers.tracer import LoopTrace
 from ..managers.resolver import Resolver
-from ..managers.handler import Handler
+from ..managers.bytecode import BytecodeCache
+from ..managers.graph import DependencyGraph
+from ..managers.manifest import Manifest
+from ..managers.merkle import MerkleIndex
+from ..managers.quarantine import Quarantine
+from ..managers.registry import Registry
+from ..managers.inspector import Inspector, PhotonSignature
+from ..managers.handler import AbsorptionResult, Handler
+from ..managers.isolation import IsolatedHandler
+from ..managers.events import EventBus, PhotonEvent, Subscription
+from ..managers.stats import LifecycleStats
 from ..interfaces.photon import IPhoton
-from ..tools.utils import SystemUtils
+from ..tools.checksums import Fingerprints
+from ..tools.inotify import Inotify
+from ..tools.utils import DigestUtils, SystemUtils
 from ..tools.logger import Logger
-from typing import Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, Type
 from types import ModuleType
 import importlib.util as util
+import contextvars
+import contextlib
 import asyncio
 import inspect
+import time
 import sys
 import os
 
 class Loader():
     """Allows management of photons and how they are loaded, unloaded, reloaded, and monitored."""
-    def __init__(self: "Loader", logging: bool = False, suppress_errors: bool = False) -> None:
+    watch_engines: tuple[str, ...] = ("auto", "inotify", "polling")
+    unwind_grace: float = 1.0 # Seconds a cancelled finalizer may take to unwind before it is force-stopped.
+    token_interval: float = 0.05 # Seconds between checks of the watcher thread's cancellation token while waiting.
+    _staging: contextvars.ContextVar[Optional[tuple["Loader", list[Handler]]]] = contextvars.ContextVar("staging", default=None)
+
+    def __init__(self: "Loader",
+                 logging: bool = False,
+                 suppress_errors: bool = False,
+                 workers: int = 1,
+                 manifest: Optional[str] = None,
+                 static_discovery: bool = False,
+                 lazy: bool = False,
+                 algorithm: str = "sha512",
+                 bytecode_cache: Optional[str] = None,
+                 isolated: Optional[list[str]] = None,
+                 collect_stats: bool = False) -> None:
         """
         Initializes a new :class:`Loader` instance.
 
@@ -40,28 +71,100 @@ class Loader():
         suppress_errors : Optional[:class:`bool`]
             If ``True``, suppresses errors that occur during loading and unloading of photons.
             Defaults to ``False``, which will raise errors if they occur.
+        workers : Optional[:class:`int`]
+            The maximum number of photon modules which may be imported concurrently. Defaults to ``1``,\
+            which loads every photon sequentially on the calling thread.
+        manifest : Optional[:class:`str`]
+            The path of a discovery manifest which remembers the checksum and discovered classes of every\
+            photon file between restarts. Unchanged files are then only stat'ed instead of hashed, and files\
+            which are known to contain no photons are never imported. Defaults to ``None``, which disables it.
+        static_discovery : Optional[:class:`bool`]
+            If ``True``, every photon file is parsed with an :class:`Inspector` before it is imported, and files\
+            which don't define any photons are never executed. Defaults to ``False``.
+        lazy : Optional[:class:`bool`]
+            If ``True``, photons are registered from their statically discovered signatures and are only\
+            imported and instantiated when they are first accessed or explicitly warmed. Defaults to ``False``.
+        algorithm : Optional[:class:`str`]
+            The checksum algorithm used to detect changes to photon files, e.g. ``blake2b``, ``sha256``, ``sha1``,\
+            or ``crc32``. Defaults to ``sha512``. See :class:`DigestUtils` for every supported algorithm.
+        bytecode_cache : Optional[:class:`str`]
+            The directory of a :class:`BytecodeCache` which keeps the compiled code of every photon version by the\
+            ``sha256`` digest of its source, regardless of ``algorithm``, so photons which were loaded before are never compiled again, even after a restart. It should\
+            be located outside of the photon tree. Defaults to ``None``, which compiles photons on every import.
+        isolated : Optional[:class:`list[str]`]
+            The names of photons, or paths of photon files, which are instantiated in their own worker process\
+            and used through a :class:`PhotonProxy`, so CPU-bound photons run on separate cores instead of sharing\
+            the GIL of the loader. Defaults to ``None``, which runs every photon in the loader's process.
+        collect_stats : Optional[:class:`bool`]
+            If ``True``, the duration of every lifecycle phase of every photon is recorded and returned by\
+            :func:`stats()`. Defaults to ``False``, which only costs a ``None`` check per phase.
 
         Raises
         ----------
         TypeError
             If types of the input arguments are not as expected.
+        ValueError
+            If ``workers`` is less than one or the checksum algorithm is not supported.
+
+        Notes
+        ----------
+        - The algorithm only decides how the loader and its watcher notice that a photon changed. A cheap algorithm\
+        such as ``crc32`` is fine for watching trusted files, while integrity checks should keep using ``sha512``\
+        through :func:`SystemUtils.get_file_checksum()`.
         """
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError("The number of workers must be an integer!")
+        if workers < 1:
+            raise ValueError("The number of workers must be at least one!")
+        if not manifest is None and not isinstance(manifest, str):
+            raise TypeError("The manifest path must be a string!")
+        if not bytecode_cache is None and not isinstance(bytecode_cache, str):
+            raise TypeError("The bytecode cache directory must be a string!")
+        if not isolated is None and (not isinstance(isolated, (list, tuple, set)) or \
+                                     not all(isinstance(entry, str) for entry in isolated)):
+            raise TypeError("The isolated photons must be a list of names or file paths!")
+        if not isinstance(static_discovery, bool):
+            raise TypeError("The static discovery flag must be a boolean!")
+        if not isinstance(lazy, bool):
+            raise TypeError("The lazy flag must be a boolean!")
+        if not isinstance(collect_stats, bool):
+            raise TypeError("The statistics flag must be a boolean!")
+        if not isinstance(algorithm, str):
+            raise TypeError("The checksum algorithm must be a string!")
+        if not DigestUtils.is_supported(algorithm):
+            raise ValueError(f"The checksum algorithm '{algorithm}' is not supported!")
         self.logging = logging
         self.suppress_errors = suppress_errors
+        self.workers: int = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._manifest: Optional[Manifest] = Manifest(manifest) if manifest else None
+        self.algorithm: str = algorithm
+        self._fingerprints: Fingerprints = Fingerprints(algorithm=algorithm)
+        self._bytecode: Optional[BytecodeCache] = BytecodeCache(bytecode_cache) if bytecode_cache else None
+        self._indexes: dict[str, MerkleIndex] = {}
+        self._isolated: set[str] = set(isolated or [])
+        self._isolated.update(os.path.abspath(entry) for entry in isolated or []) # File paths match in any form.
+        self._graph: DependencyGraph = DependencyGraph()
+        self._quarantine: Quarantine = Quarantine()
+        self._stats: Optional[LifecycleStats] = LifecycleStats() if collect_stats else None
+        self._events: EventBus = EventBus(logging)
+        self._loading_depth: int = 0
+        self.static_discovery: bool = static_discovery
+        self.lazy: bool = lazy
         self._logger: Logger = Logger(__name__)
         self._resolver: Resolver = Resolver()
         self._threads: ThreadManager = ThreadManager()
-        self._photons: dict[str, Handler] = dict()
+        self._photons: Registry = Registry()
         self._is_watching: bool = False
 
     @property
-    def photons(self: "Loader") -> dict[str, "Handler"]:
+    def photons(self: "Loader") -> Registry:
         """
         Returns a dictionary of photon names and corresponding :class:`Handler` objects.
 
         Returns
         ----------
-        :class:`Dict[str, Handler]`
+        :class:`Registry`
             A dictionary containing photon names as keys and their corresponding :class:`Handler` objects as values.
 
         Notes
@@ -70,10 +173,406 @@ class Loader():
         - The photon name is the name assigned to the photon instance in its definition.
         - The :class:`Handler` objects contain information about the photon, including its name, file path,\
         and the :class:`IPhoton` based class itself.
+        - The :class:`Registry` also indexes every photon by file path, module name, and base class, e.g.\
+        :func:`photons.get_by_filepath()`, without scanning the other photons.
 
         """
         return self._photons
 
+    @property
+    def manifest(self: "Loader") -> Optional[Manifest]:
+        """
+        Returns the discovery manifest of the current :class:`Loader` instance, if one was provided.
+
+        Returns
+        ----------
+        Optional[:class:`Manifest`]
+            The discovery manifest, or ``None`` if the loader was created without one.
+        """
+        return self._manifest
+
+    @property
+    def bytecode_cache(self: "Loader") -> Optional[BytecodeCache]:
+        """
+        Returns the bytecode cache of the current :class:`Loader` instance, if one was provided.
+
+        Returns
+        ----------
+        Optional[:class:`BytecodeCache`]
+            The bytecode cache, or ``None`` if the loader was created without one.
+        """
+        return self._bytecode
+
+    @property
+    def dependencies(self: "Loader") -> DependencyGraph:
+        """
+        Returns the import graph between every module imported by the current :class:`Loader` instance.
+
+        Returns
+        ----------
+        :class:`DependencyGraph`
+            The graph used to reload every photon affected by a change, in dependency order.
+        """
+        return self._graph
+
+    @property
+    def quarantine(self: "Loader") -> Quarantine:
+        """
+        Returns the photon files which failed to import and are held back from being retried.
+
+        Returns
+        ----------
+        :class:`Quarantine`
+            The quarantine of the loader. Its ``entries`` describe every failed file, and :func:`Quarantine.release()`\
+            allows a file to be retried right away.
+        """
+        return self._quarantine
+
+    @property
+    def fingerprints(self: "Loader") -> Fingerprints:
+        """
+        Returns the stat-keyed checksum cache shared by the loader and its watcher.
+
+        Returns
+        ----------
+        :class:`Fingerprints`
+            The fingerprint cache of the current :class:`Loader` instance.
+        """
+        return self._fingerprints
+
+    async def _get_photon_checksum(self: "Loader", photon_path: str) -> str|None:
+        """``|coro|``
+
+        Returns the checksum of a photon file, reusing a fingerprinted or manifest checksum when the file is unchanged.
+
+        Parameters
+        ----------
+        photon_path : :class:`str`
+            The absolute path of the photon file.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The checksum of the photon file, or ``None`` if the file doesn't exist.
+        """
+        with LifecycleStats.timer(self._stats, photon_path, "checksum"):
+            try: stat = os.stat(photon_path)
+            except OSError: return None
+            known = None if self._manifest is None else self._manifest.get_checksum(photon_path, self.algorithm, stat)
+            checksum = self._fingerprints.lookup(photon_path, stat) or known
+            if checksum is None:
+                checksum = await Handler._get_checksum(photon_path, algorithm=self.algorithm)
+            if not self._manifest is None and known is None and not checksum is None:
+                self._manifest.update(photon_path, checksum=checksum, algorithm=self.algorithm, stat=stat)
+            if not checksum is None: # Seed the watcher so its first pass doesn't hash again.
+                self._fingerprints.store(photon_path, checksum, stat)
+            return checksum
+
+    async def _prefetch_checksums(self: "Loader", filepaths: list[str]) -> int:
+        """``|coro|``
+
+        Hashes every listed file whose checksum isn't known yet in one parallel batch on the default executor.
+
+        Parameters
+        ----------
+        filepaths : :class:`list[str]`
+            The paths of the module files which are about to be emitted.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of files which were hashed.
+
+        Notes
+        ----------
+        - Files which are already fingerprinted, or which the manifest still describes, are skipped, so an\
+        unchanged tree is only stat'ed.
+        - The checksums land in the fingerprint cache, where :func:`_get_photon_checksum()` picks them up\
+        instead of hashing each photon on its own.
+        - With ``collect_stats``, the duration of the batch is split evenly between the hashed files.
+        """
+        def _prefetch() -> int:
+            pending: list[str] = []
+            for filepath in filepaths:
+                try: stat = os.stat(filepath)
+                except OSError: continue
+                if not self._fingerprints.lookup(filepath, stat) is None:
+                    continue
+                if not self._manifest is None and not self._manifest.lookup(filepath, stat) is None:
+                    continue
+                pending.append(filepath)
+            if len(pending) > 1: # A single file is hashed when it is needed.
+                started = time.perf_counter()
+                self._fingerprints.get_checksums(pending)
+                if not self._stats is None:
+                    elapsed = (time.perf_counter() - started) / len(pending)
+                    for filepath in pending:
+                        self._stats.record(filepath, "checksum", elapsed)
+                return len(pending)
+            return 0
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _prefetch)
+
+    async def _inspect_photon(self: "Loader",
+                              photon_path: str,
+                              photon_base: type,
+                              other_classes: list[str]) -> Optional[list[PhotonSignature]]:
+        """``|coro|``
+
+        Statically discovers the photons of a source file without importing it.
+
+        Parameters
+        ----------
+        photon_path : :class:`str`
+            The absolute path of the photon file.
+        photon_base : :class:`type`
+            The base class that all photons of the system will inherit from.
+        other_classes : :class:`list[str]`
+            A list of additional classes to discover instead of subclasses of ``photon_base``.
+
+        Returns
+        ----------
+        Optional[:class:`list[PhotonSignature]`]
+            The discovered photons, or ``None`` if the file couldn't be read or parsed, or a class derives from\
+            a base which can only be resolved by importing the file. In that case the file should be imported as\
+            usual so that its photons and errors are reported the same way.
+        """
+        inspector = Inspector(photon_base, other_classes)
+        try:
+            with LifecycleStats.timer(self._stats, photon_path, "scan"):
+                if self.workers > 1:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(self._get_executor(), inspector.inspect_file, photon_path)
+                return inspector.inspect_file(photon_path)
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+    def _save_manifest(self: "Loader") -> None:
+        """
+        Persists the discovery manifest to disk if the :class:`Loader` has one and it changed.
+        """
+        if not self._manifest is None:
+            self._manifest.save()
+
+    def _get_merkle_index(self: "Loader", photons_directory: str) -> MerkleIndex:
+        """
+        Returns the Merkle index of a photons directory, creating it on first use.
+
+        Parameters
+        ----------
+        photons_directory : :class:`str`
+            The path of the photons directory.
+
+        Returns
+        ----------
+        :class:`MerkleIndex`
+            The index of the directory, which shares the ``fingerprints`` cache of the loader.
+        """
+        root = os.path.abspath(photons_directory)
+        if not root in self._indexes:
+            self._indexes[root] = MerkleIndex(photons_directory, self._fingerprints)
+        return self._indexes[root]
+
+    async def _refresh_index(self: "Loader", index: MerkleIndex, paths: Optional[list[str]] = None) -> list[str]:
+        """``|coro|``
+
+        Brings a Merkle index up to date on the default executor, so stat'ing and hashing never block the event loop.
+
+        Parameters
+        ----------
+        index : :class:`MerkleIndex`
+            The index to refresh.
+        paths : Optional[:class:`list[str]`]
+            The files or directories which are known to have changed. Defaults to ``None``, which polls the whole tree.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The paths of all added, modified, and removed files.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, index.refresh, paths)
+
+    def _create_watcher(self: "Loader", photons_directory: str, engine: str) -> Optional[Inotify]:
+        """
+        Creates an inotify watcher for a photons directory if the requested engine allows it.
+
+        Parameters
+        ----------
+        photons_directory : :class:`str`
+            The path of the photons directory.
+        engine : :class:`str`
+            One of the ``watch_engines`` of the :class:`Loader`.
+
+        Returns
+        ----------
+        Optional[:class:`Inotify`]
+            A watcher for the whole tree, or ``None`` if the directory should be polled instead.
+
+        Raises
+        ----------
+        OSError
+            If the ``inotify`` engine was requested explicitly but the tree cannot be watched.
+        """
+        if engine == "polling" or (engine == "auto" and not Inotify.is_supported()):
+            return None
+        watcher: Optional[Inotify] = None
+        try:
+            watcher = Inotify()
+            watcher.watch_tree(photons_directory)
+            return watcher
+        except OSError as error: # pragma: no cover
+            if not watcher is None: watcher.close()
+            if engine == "inotify":
+                raise error
+            if self.logging:
+                self._logger.warning(f"Falling back to polling '{photons_directory}' — {error}")
+            return None
+
+    def _purge_modules(self: "Loader", filepaths: list[str]) -> list[str]:
+        """
+        Removes the modules defined by the provided files from ``sys.modules``, so they are executed again on their next import.
+
+        Parameters
+        ----------
+        filepaths : :class:`list[str]`
+            The paths of the module files.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The names of all purged modules.
+        """
+        filepaths = set(os.path.abspath(filepath) for filepath in filepaths)
+        purged = [name for name, module in list(sys.modules.items())
+                  if isinstance(getattr(module, "__file__", None), str) and os.path.abspath(module.__file__) in filepaths]
+        for name in purged:
+            sys.modules.pop(name, None)
+        return purged
+
+    def _get_executor(self: "Loader") -> ThreadPoolExecutor:
+        """
+        Returns the worker pool used for concurrently importing photon modules, creating it on first use.
+
+        Returns
+        ----------
+        :class:`ThreadPoolExecutor`
+            A pool which is bounded by the ``workers`` count of the current :class:`Loader` instance.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="luminal-loader")
+        return self._executor
+
+    def _count_event(self: "Loader", filepath: str, event: str) -> None:
+        """
+        Counts a lifecycle event of a photon file if statistics are collected.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        event : :class:`str`
+            One of ``loads``, ``reloads``, or ``failures``.
+        """
+        if not self._stats is None:
+            self._stats.count(filepath, event)
+
+    def _emit_event(self: "Loader",
+                    kind: str,
+                    filepath: str,
+                    name: Optional[str] = None,
+                    duration: Optional[float] = None,
+                    error: Optional[BaseException] = None) -> None:
+        """
+        Publishes a lifecycle event, unless nobody subscribed to any.
+
+        Parameters
+        ----------
+        kind : :class:`str`
+            The kind of the event, see :attr:`PhotonEvent.kinds`.
+        filepath : :class:`str`
+            The path of the photon file.
+        name : Optional[:class:`str`]
+            The name of the photon. Defaults to ``None``.
+        duration : Optional[:class:`float`]
+            The number of seconds the operation took. Defaults to ``None``.
+        error : Optional[:class:`BaseException`]
+            The error of a ``failed`` event. Defaults to ``None``.
+        """
+        if self._events.active:
+            self._events.emit(PhotonEvent(kind, filepath, name, duration, error))
+
+    def _register_photon(self: "Loader", handler: Handler) -> bool:
+        """
+        Adds a handler to the photon registry unless its name belongs to a photon of another file.
+
+        Parameters
+        ----------
+        handler : :class:`Handler`
+            The handler of the photon.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the handler was registered, ``False`` if its name collided.
+
+        Notes
+        ----------
+        - The photon which was registered first keeps its name, so loading a second file can never silently\
+        replace a running photon. The collision is logged and the new photon is skipped.
+        - While a reload stages the new version of a file, its handlers are only collected, and the registry\
+        keeps serving the previous version until :func:`_reload_photon()` swaps them in.
+        """
+        try:
+            staging = self._staging.get()
+            if not staging is None and staging[0] is self:
+                self._photons.check(handler.name, handler)
+                staging[1].append(handler)
+                return True
+            self._photons[handler.name] = handler
+            return True
+        except PhotonCollisionError as error:
+            if self.logging:
+                if not self.suppress_errors:
+                    self._logger.error(f"{error} -> Skipping it.")
+            return False
+
+    def _create_handler(self: "Loader",
+                        name: str,
+                        photon_path: str,
+                        checksum: Optional[str],
+                        instance: Optional[type],
+                        signature: Optional[PhotonSignature] = None,
+                        materializer: Optional[Callable[[Handler], Awaitable[Optional[type]]]] = None) -> Handler:
+        """
+        Creates the handler of a photon, which runs in a worker process if the photon is isolated.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        photon_path : :class:`str`
+            The absolute path of the photon module.
+        checksum : Optional[:class:`str`]
+            The checksum of the photon module.
+        instance : Optional[:class:`type`]
+            The photon type, or ``None`` for lazy photons.
+        signature : Optional[:class:`PhotonSignature`]
+            The statically discovered signature of the photon. Defaults to ``None``.
+        materializer : Optional[:class:`Callable[[Handler], Awaitable[Optional[type]]]`]
+            The coroutine function which imports a lazy photon. Defaults to ``None``.
+
+        Returns
+        ----------
+        :class:`Handler`
+            An :class:`IsolatedHandler` if the name or file of the photon was listed in ``isolated``,\
+            otherwise a regular :class:`Handler`.
+        """
+        isolated = name in self._isolated or os.path.abspath(photon_path) in self._isolated
+        handler_type = IsolatedHandler if isolated else Handler
+        return handler_type(self.logging, name, photon_path, checksum, instance,
+                            signature=signature, materializer=materializer, stats=self._stats, events=self._events)
+
     async def _validate_module(self: "Loader",
                                 imported_module: ModuleType,
                                 photon_path: str,
@@ -109,26 +608,115 @@ class Loader():
         """
         photon_found: bool = False
         photon_attributes: list[Handler] = []
-        for entry in dir(imported_module): # Check if the module is subclassed as a Photon.
-            attribute: type = getattr(imported_module, entry)
-            if inspect.isclass(attribute):
-                if other_classes and attribute.__name__ in other_classes or \
-                    (not other_classes and issubclass(attribute, photon_base) and \
-                     attribute != photon_base):
-                    if issubclass(attribute, IPhoton):
-                        name = attribute.photon_name
-                    else:
-                        name = attribute.__name__
-                    checksum = await Handler._get_checksum(photon_path)
-                    handler = Handler(self.logging, name, photon_path, checksum, attribute)
-                    self._photons[name] = handler
-                    photon_attributes.append(handler)
-                    photon_found = True
+        discovered: list[str] = []
+        checksum: Optional[str] = None
+        with LifecycleStats.timer(self._stats, photon_path, "validation"):
+            for entry in dir(imported_module): # Check if the module is subclassed as a Photon.
+                attribute: type = getattr(imported_module, entry)
+                if inspect.isclass(attribute):
+                    if other_classes and attribute.__name__ in other_classes or \
+                        (not other_classes and issubclass(attribute, photon_base) and \
+                         attribute != photon_base):
+                        if issubclass(attribute, IPhoton):
+                            name = attribute.photon_name
+                        else:
+                            name = attribute.__name__
+                        if checksum is None: # Every class in the file shares the same checksum.
+                            checksum = await self._get_photon_checksum(photon_path)
+                        handler = self._create_handler(name, photon_path, checksum, attribute)
+                        if not self._register_photon(handler):
+                            continue
+                        photon_attributes.append(handler)
+                        discovered.append(attribute.__name__)
+                        photon_found = True
+        if not self._manifest is None and not imported_module is None: # Failed imports discover nothing.
+            self._manifest.update(photon_path,
+                                  classes=discovered,
+                                  photon_base=photon_base,
+                                  other_classes=other_classes)
         if not photon_found: # Check if the module is an actual Photon.
             del imported_module
             return False
         return photon_attributes
 
+    async def _defer_module(self: "Loader",
+                            photon_path: str,
+                            photon_base: type,
+                            other_classes: list[str] = []) -> Optional[list[Handler]|bool]:
+        """``|coro|``
+
+        Registers lazy handlers for every statically discovered photon of a module without importing it.
+
+        Parameters
+        ----------
+        photon_path : :class:`str`
+            The absolute path of the photon module.
+        photon_base : :class:`type`
+            The base class that all photons of the system will inherit from.
+        other_classes : Optional[:class:`list[str]`]
+            A list of additional classes to check for in the module. Defaults to ``[]``.
+
+        Returns
+        ----------
+        Optional[:class:`Union[List[Handler], bool]`]
+            A list of lazy :class:`Handler` objects, ``False`` if the module doesn't define any photons,\
+            or ``None`` if the module couldn't be parsed or inspected conclusively and has to be imported eagerly instead.
+
+        Notes
+        ----------
+        - A module whose classes derive from bases imported from other modules is never deferred, since only\
+        importing it tells whether those classes are photons.
+        """
+        signatures = await self._inspect_photon(photon_path, photon_base, other_classes)
+        if signatures is None:
+            return None
+        if len(signatures) == 0:
+            return False
+        handlers: list[Handler] = []
+        checksum = await self._get_photon_checksum(photon_path)
+        with LifecycleStats.timer(self._stats, photon_path, "validation"):
+            for signature in signatures:
+                handler = self._create_handler(signature.name, photon_path, checksum, None,
+                                               signature=signature, materializer=self._materialize_photon)
+                if self._register_photon(handler):
+                    handlers.append(handler)
+        return handlers
+
+    async def _materialize_photon(self: "Loader", handler: Handler) -> Optional[type]:
+        """``|coro|``
+
+        Imports the module of a lazy photon, unless a sibling photon already did, and returns the photon type.
+
+        Parameters
+        ----------
+        handler : :class:`Handler`
+            The lazy handler which is being accessed for the first time.
+
+        Returns
+        ----------
+        Optional[:class:`type`]
+            The photon type, or ``None`` if the module couldn't be imported or no longer defines the class.
+        """
+        filepath = os.path.abspath(handler.filepath)
+        resolved_name = self._resolver.resolve_path(handler.filepath)[0]
+        module = sys.modules.get(resolved_name, None)
+        if module is None or os.path.abspath(getattr(module, "__file__", "") or "") != filepath:
+            directory = os.path.dirname(filepath)
+            self._resolver.normalize_paths(directory) # Relative imports need the photon directory.
+            started = time.perf_counter()
+            try:
+                module = await self._import_module(handler.filepath)
+                self._emit_event("imported" if module else "failed", handler.filepath, duration=time.perf_counter() - started)
+            except Exception as error: # pragma: no cover
+                if self.logging:
+                    self._logger.error(f"Lazy photon '{handler.name}' couldn't be imported! ({error})")
+                self._emit_event("failed", handler.filepath, handler.name, time.perf_counter() - started, error)
+                module = None
+            finally:
+                self._resolver.reset_paths(directory)
+        class_name = getattr(handler._signature, "class_name", handler.name)
+        return getattr(module, class_name, None) if module else None
+
     async def _import_module(self: "Loader", module_path: str) -> ModuleType:
         """``|coro|``
 
@@ -153,6 +741,11 @@ class Loader():
         Notes
         ----------
         - The imported module is added to the ``sys.modules`` dictionary for future reference, and is also returned.
+        - When the :class:`Loader` has more than one worker, the module is executed on the worker pool so that\
+        independent photons can be imported concurrently without blocking the event loop.
+        - The modules imported by the module are recorded in the ``dependencies`` graph.
+        - With a ``bytecode_cache``, the module is executed from the cached code of its current contents, and\
+        only compiled if that version of the file was never imported before.
         - If an error occurs while importing the module and the logging property is set, the error will be logged.
         - If ``suppress_errors`` is set, the error will be skipped.
 
@@ -165,9 +758,22 @@ class Loader():
             if module_spec:
                 imported_module = util.module_from_spec(module_spec)
                 if module_spec.loader:
+                    def _execute_module() -> None:
+                        with LifecycleStats.timer(self._stats, module_path, "exec_module"):
+                            if self._bytecode is None:
+                                module_spec.loader.exec_module(imported_module)
+                                code = None
+                            else: # Known versions of the file are executed without being compiled again.
+                                code = self._bytecode.compile(module_path)
+                                exec(code, imported_module.__dict__)
+                        self._graph.record(module_path, self._graph.find_dependencies(imported_module, code=code))
                     resolved_name = self._resolver.resolve_path(module_path)[0]
                     sys.modules[resolved_name] = imported_module
-                    module_spec.loader.exec_module(imported_module)
+                    if self.workers > 1: # Read, compile, and execute the module on the worker pool.
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(self._get_executor(), _execute_module)
+                    else:
+                        _execute_module()
                     return imported_module
                 else: # pragma: no cover
                     raise ModuleNotFoundError(f"No loader found for module '{module_name}'")
@@ -187,7 +793,43 @@ class Loader():
                     self._logger.error(f"Syntax error for '{module_path}'! ({error}) -> Skipping it.")
             raise error
 
-    async def _scan_module(self: "Loader", path: str) -> tuple[str, bool, bool]:
+    async def _attempt_import(self: "Loader", module_path: str) -> Optional[ModuleType]:
+        """``|coro|``
+
+        Imports a photon module, quarantining the file if the import fails and releasing it once it succeeds.
+
+        Parameters
+        ----------
+        module_path : :class:`str`
+            The path of the module to be imported.
+
+        Returns
+        ----------
+        Optional[:class:`ModuleType`]
+            The imported module, or ``None`` if one of its own imports couldn't be found.
+
+        Raises
+        ----------
+        Any exception raised by :func:`_import_module()`, after the file was quarantined.
+        """
+        started = time.perf_counter()
+        try: imported_module = await self._import_module(module_path)
+        except Exception as error:
+            self._count_event(module_path, "failures")
+            self._emit_event("failed", module_path, duration=time.perf_counter() - started, error=error)
+            self._quarantine.record(module_path, await self._get_photon_checksum(module_path), error)
+            raise error
+        if imported_module is None:
+            error = ModuleNotFoundError(f"'{module_path}' imports a module which couldn't be found.")
+            self._count_event(module_path, "failures")
+            self._emit_event("failed", module_path, duration=time.perf_counter() - started, error=error)
+            self._quarantine.record(module_path, await self._get_photon_checksum(module_path), error)
+        else:
+            self._emit_event("imported", module_path, duration=time.perf_counter() - started)
+            self._quarantine.release(module_path)
+        return imported_module
+
+    async def _scan_module(self: "Loader", path: str, entry: Optional[os.DirEntry] = None) -> tuple[str, bool, bool]:
         """``|coro|``
 
         Determines if the provided path is a package or module.
@@ -196,6 +838,9 @@ class Loader():
         ----------
         path : :class:`str`
             Absolute path of the file or directory to be checked.
+        entry : Optional[:class:`os.DirEntry`]
+            The directory entry of the path, if it came from :func:`os.scandir()`. Its cached file type is\
+            used instead of issuing another system call. Defaults to ``None``.
 
         Returns
         ----------
@@ -218,10 +863,10 @@ class Loader():
 
         """
         is_dir, packages_only = False, True
-        if os.path.isdir(path):
+        if entry.is_dir() if entry else os.path.isdir(path):
             is_dir = True
             return(path, is_dir, packages_only)
-        elif os.path.isfile(path): # pragma: no branch
+        elif entry.is_file() if entry else os.path.isfile(path): # pragma: no branch
             if path.endswith(".py"):
                 module_name: Optional[str] = inspect.getmodulename(path)
                 if module_name and module_name != "__init__": # pragma: no branch
@@ -254,16 +899,22 @@ class Loader():
         is in fact a package.
         - The second element of the returned tuple, ``packages_only`` is a boolean value that indicates whether there\
         are only packages in the directory.
+        - ``packages_only`` is computed over every entry, so it doesn't depend on the order of the listing.
 
         """
         packages_only: bool = True
         modules: list[tuple[str, bool]] = []
-        try: paths: list[str] = os.listdir(path)
+        try:
+            with os.scandir(path) as scanner: # Sorted for a deterministic load order.
+                entries: list[os.DirEntry] = sorted(scanner, key=lambda entry: entry.name)
         except OSError: # pragma: no cover
-            paths = [] # Ignore unreadable directories.
-        for entry in paths:
-            entry = os.path.join(path, entry)
-            module_path, is_dir, packages_only = await self._scan_module(entry)
+            entries = [] # Ignore unreadable directories.
+        for entry in entries:
+            started = time.perf_counter()
+            module_path, is_dir, only_packages = await self._scan_module(os.path.join(path, entry.name), entry)
+            packages_only = packages_only and only_packages # Only true if every entry is a directory.
+            if not self._stats is None and not is_dir:
+                self._stats.record(module_path, "scan", time.perf_counter() - started)
             modules.append((module_path, is_dir))
         return (modules, packages_only)
 
@@ -295,8 +946,7 @@ class Loader():
         if isinstance(photon, str):
             if not os.path.exists(photon) or not os.path.isfile(photon):
                 raise PhotonNotFoundError(f"{photon}")
-            handlers = [h for h in self._photons.values() if photon in h.filepath]
-            return handlers
+            return self._photons.get_by_filepath(photon)
         if isinstance(photon, Handler):
             return photon
     
@@ -352,6 +1002,7 @@ class Loader():
         >>> photon = await loader._emit_photon('photons/hello_world.py', IPhoton, ["Other_class1", "Other_class2"])
         """
         try:
+            started = time.perf_counter()
             photons: list[Handler] = []
             module_ready = isinstance(photon_path, tuple)
             module_path, is_dir, packages_only = photon_path if module_ready else await self._scan_module(photon_path)
@@ -361,18 +1012,30 @@ class Loader():
                                                             photon_base,
                                                             other_classes,
                                                             recursive))
+                return photons # A directory is never a photon module itself.
             resolved_name = self._resolver.resolve_path(module_path)
             photon = self._photons.get(resolved_name, None)
             if not photon is None:
                 if self.logging: # pragma: no cover
                     self._logger.warning(f"Photon '{module_path}' is already loaded!")
                     return None
+            elif not self._manifest is None and self._manifest.is_barren(module_path, photon_base, other_classes):
+                return photons # The unchanged file is already known to contain no photons.
+            elif self.static_discovery and await self._inspect_photon(module_path, photon_base, other_classes) == []:
+                return photons # The source doesn't define any photons, so it never has to run.
             else:
-                photon_module = await self._import_module(module_path)
-                validated = await self._validate_module(photon_module, module_path,
-                                                        photon_base, other_classes)
+                validated = await self._defer_module(module_path, photon_base, other_classes) if self.lazy else None
+                if validated is None: # Eagerly import anything that isn't deferred.
+                    photon_module = await self._attempt_import(module_path)
+                    validated = await self._validate_module(photon_module, module_path,
+                                                            photon_base, other_classes)
                 if isinstance(validated, list):
                     if len(validated) > 0:
+                        staging = self._staging.get()
+                        if staging is None or not staging[0] is self: # Reloads are counted once they're swapped in.
+                            self._count_event(module_path, "loads")
+                            for handler in validated:
+                                self._emit_event("discovered", module_path, handler.name, time.perf_counter() - started)
                         if self.logging: # pragma: no cover
                             self._logger.success(f"Successfully loaded photon — '{module_path}'!")
                         if len(validated) == 1:
@@ -422,6 +1085,12 @@ class Loader():
         ----------
         Any exceptions raised by the called :func:`_emit_photon()` method.
 
+        Notes
+        ----------
+        - Up to ``workers`` photons are emitted at the same time. The resulting handlers are merged into the\
+        ``_photons`` registry in the sorted order of the directory listing, regardless of which import finished first.
+        - Before any photon is emitted, the modules whose checksums aren't known yet are hashed in one parallel batch.
+
         See Also
         ----------
         :func:`_emit_photon()`
@@ -432,22 +1101,46 @@ class Loader():
         >>> loader = Loader()
         >>> photons = await loader._emit_photons("photons_directory", IPhoton, ["Other_class1", "Other_class2"])
         """
+        async def _bounded_emission(module_path: str, is_dir: bool) -> Handler|list[Handler]|None:
+            async with semaphore:
+                return await self._emit_photon(photon_path=(module_path, is_dir, packages_only),
+                                               photon_base=photon_base,
+                                               other_classes=other_classes,
+                                               recursive=recursive)
         photons: list[Handler] = []
         modules, packages_only = await self._find_modules(photons_directory)
-        for module_path, is_dir in modules:
-            photon_path = (module_path, is_dir, packages_only)
-            emission = await self._emit_photon(photon_path=photon_path,
-                                                photon_base=photon_base,
-                                                other_classes=other_classes,
-                                                recursive=recursive)
+        await self._prefetch_checksums([module_path for module_path, is_dir in modules if not is_dir])
+        semaphore = asyncio.Semaphore(self.workers)
+        emissions = await asyncio.gather(*[_bounded_emission(module_path, is_dir) for module_path, is_dir in modules])
+        for emission in emissions: # Gathered results keep the order of the directory listing.
             if not emission is None:
                 if isinstance(emission, list):
                     photons.extend(emission)
                 else:
                     photons.append(emission)
+        for photon in photons: # Re-insert so the registry order doesn't depend on completion order.
+            self._photons.pop(photon.name, None)
         self._photons.update({photon.name: photon for photon in photons})
         return photons
     
+    async def _start_photons(self: "Loader", photons: list[Handler], concurrency: Optional[int] = None) -> None:
+        """``|coro|``
+
+        Starts several photons at once so that their ``initialize()`` hooks overlap.
+
+        Parameters
+        ----------
+        photons : :class:`list[Handler]`
+            The handlers of the photons to start.
+        concurrency : Optional[:class:`int`]
+            The maximum number of photons starting at once. Defaults to ``None``, which starts every photon at once.
+        """
+        async def _start_photon(photon: Handler) -> None:
+            async with semaphore:
+                await photon.start()
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else contextlib.nullcontext()
+        await asyncio.gather(*[_start_photon(photon) for photon in photons])
+    
     async def _absorb_photon(self: "Loader", photon: Handler|str, force_stop: bool = False, suppress_finalizer_log: bool = False) -> bool:
         """``|coro|``
 
@@ -469,12 +1162,14 @@ class Loader():
             Indicating whether the photon was successfully stopped and removed.
         """
         async def _halt_photon(_photon: Handler):
+            started = time.perf_counter()
             try:
                 await _photon._stop(force_stop=force_stop)
             except Exception as error:
                 if not suppress_finalizer_log:
                     raise error
             self._photons.pop(_photon.name, None)
+            self._emit_event("unloaded", _photon.filepath, _photon.name, time.perf_counter() - started)
         result = await self._check_photon(photon)
         if not result is None:
             if result == photon:
@@ -486,34 +1181,101 @@ class Loader():
                 return True
         return False
 
-    async def _absorb_photons(self: "Loader", photons: list[Handler|str], force_stop: bool = False) -> list[str]:
+    async def _absorb_photons(self: "Loader",
+                              photons: list[Handler|str],
+                              force_stop: bool = False,
+                              concurrency: Optional[int] = None,
+                              timeout: Optional[float] = None,
+                              deadline: Optional[float] = None) -> tuple[list[str], list[AbsorptionResult]]:
         """``|coro|``
 
-        Stops and removes a list of photons from the loader's registry.
+        Stops and removes a list of photons from the loader's registry, running their finalizers concurrently.
         If a given photon is a string, it is looked up in the registry by filepath.
-        The method returns a list of successful photon filepaths that were stopped and absorbed.
         
         Parameters
         ----------
         photons : :class:`list[Handler|str]`
             A list of :class:`Handler` objects representing photons, or a list of :class:`str` \
             names of the photons in the photon registry.
+        force_stop : :class:`bool`
+            A flag which allows a photon to be immediately halted and collected without calling its finalizer.
+        concurrency : Optional[:class:`int`]
+            The maximum number of finalizers running at once. Defaults to ``None``, which runs every finalizer at once.
+        timeout : Optional[:class:`float`]
+            The number of seconds each finalizer may take. Defaults to ``None``, which waits indefinitely.
+        deadline : Optional[:class:`float`]
+            The number of seconds all finalizers may take together. Defaults to ``None``, which waits indefinitely.
         
         Returns
         ----------
-        :class:`list[str]`
-            A list of successful photon filepaths that were stopped and absorbed.
+        :class:`tuple[list[str], list[AbsorptionResult]]`
+            A list of successful photon filepaths that were stopped and absorbed, and the result of every\
+            stopped photon in the order the photons were provided.
+
+        Notes
+        ----------
+        - A photon whose finalizer misses its timeout, or the global deadline, has its finalizer cancelled and is\
+        force-stopped instead. Photons which are still waiting for a free slot when the deadline passes are\
+        force-stopped without calling their finalizers at all.
+        - Finalizers can only be cancelled while they are awaiting, so a finalizer which blocks the event loop\
+        still delays every other photon.
+        - A cancelled finalizer may take up to ``unwind_grace`` seconds to run its ``finally`` and ``except`` blocks\
+        before the photon is force-stopped. Errors raised while it unwinds are discarded.
+        - Every photon is resolved before the first one is stopped, so an unknown filepath leaves all photons running.
         """
         def _update_absorption_list(photon_list: list[str], filepath: str):
             if not filepath in photon_list: photon_list.append(filepath)
             return photon_list
-        absorbed_photons = []
+        async def _halt_photon(handler: Handler) -> AbsorptionResult:
+            async with semaphore:
+                result = AbsorptionResult(handler.name, handler.filepath)
+                started = time.perf_counter()
+                limit = timeout
+                if not expiry is None:
+                    remaining = max(expiry - time.monotonic(), 0.0)
+                    limit = remaining if limit is None else min(limit, remaining)
+                try:
+                    if limit is None or limit > 0:
+                        stopping = asyncio.ensure_future(handler._stop(force_stop=force_stop))
+                        done, _ = await asyncio.wait([stopping], timeout=limit)
+                        if done: stopping.result()
+                        else: # The finalizer unwinds before it is force-stopped, so its cleanup can't race it.
+                            stopping.cancel()
+                            unwound, _ = await asyncio.wait([stopping], timeout=self.unwind_grace)
+                            if unwound: await asyncio.gather(stopping, return_exceptions=True)
+                            else: stopping.add_done_callback(lambda task: task.cancelled() or task.exception())
+                        result.timed_out = not done
+                    else: result.timed_out = True # The deadline passed while waiting for a free slot.
+                    if result.timed_out:
+                        if self.logging: # pragma: no cover
+                            self._logger.warning(f"Photon '{handler.name}' didn't finalize in time and is being force-stopped!")
+                        if handler.is_started: await handler._force_stop()
+                        await handler._clear_module_references()
+                except Exception as error:
+                    result.error = error
+                result.duration = time.perf_counter() - started
+                if result.is_absorbed:
+                    self._photons.pop(handler.name, None)
+                    self._emit_event("unloaded", handler.filepath, handler.name, result.duration)
+                return result
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else contextlib.nullcontext()
+        expiry = None if deadline is None else time.monotonic() + deadline
+        requests: list[tuple[Handler|str, list[Handler]]] = []
+        handlers: dict[int, Handler] = {}
         for photon in photons:
-            if await self._absorb_photon(photon, force_stop): # pragma: no branch
+            result = await self._check_photon(photon)
+            resolved = result if isinstance(result, list) else [result]
+            requests.append((photon, resolved))
+            handlers.update((id(handler), handler) for handler in resolved)
+        results = await asyncio.gather(*[_halt_photon(handler) for handler in handlers.values()])
+        outcomes = {id(handler): result for handler, result in zip(handlers.values(), results)}
+        absorbed_photons = []
+        for photon, resolved in requests:
+            if all(outcomes[id(handler)].is_absorbed for handler in resolved):
                 if isinstance(photon, Handler):
                     _update_absorption_list(absorbed_photons, photon.filepath)
                 else: _update_absorption_list(absorbed_photons, photon)
-        return absorbed_photons
+        return (absorbed_photons, list(results))
     
     async def _revert_photon(self: "Loader", 
                              validated_photon: Handler|list[Handler], 
@@ -563,6 +1325,29 @@ class Loader():
             if self.logging: # pragma: no cover
                 self._logger.warning("The photon was perturbed and may not function correctly, if at all.")
 
+    async def _retire_photon(self: "Loader", handler: Handler) -> None:
+        """``|coro|``
+
+        Finalizes a photon which was replaced by a newer version, without touching the modules of that version.
+
+        Parameters
+        ----------
+        handler : :class:`Handler`
+            The handler of the replaced photon.
+
+        Notes
+        ----------
+        - Errors of the finalizer are suppressed, like unloading a photon during a reload always did, and the\
+        handler releases its instance either way.
+        """
+        try:
+            await handler._stop(release_modules=False)
+        except Exception as error:
+            if self.logging and handler.is_started: # pragma: no cover
+                self._logger.warning(f"The previous version of '{handler.name}' didn't finalize cleanly! ({error})")
+        finally:
+            await handler._clear_module_references(release_modules=False)
+
     async def _reload_photon(self: "Loader", photon: Handler|str) -> Handler|list[Handler]:
         """``|coro|``
         
@@ -579,34 +1364,27 @@ class Loader():
             - If a single photon is provided, it returns the updated :class:`Handler` object.
             - If multiple photons are provided or the photon to be reloaded has multiple handlers,
             - it returns a list of the updated :class:`Handler` objects.
+            - If the new version couldn't be imported or started, the previous handler(s) are returned.
         
         Raises
         ----------
         Any exception that may occur during:
             - :func:`self._check_photon()`
-            - :func:`_absorb_photon(validated_photon)`
             - :func:`_emit_photon(photon)`
-            - :func:`_revert_photon(validated_photon, validated_modules)`
         
         Notes
         ----------
-        This function reloads a photon handler or an entire photon atomically and returns the updated :class:`Handler` object(s).\
-        The function starts by validating the provided photon by calling the :func:`_check_photon(photon)` function.\
-        Once the validation is complete, this function collects all the validated modules for the photon across the system.
-        
-        Depending on the number of validated photons i.e., whether a single :class:`Handler` object or a list of them is provided,\
-        the function iterates through each of them and collects all validated modules for each.\
-        It then calls the :func:`_absorb_photon(validated_photon)` function to atomically update the photon(s).\
-        After an atomic update of the photon(s), it returns the updated :class:`Handler` object(s) by calling the \
-        :func:`_emit_photon(photon)` function.
-
-        In case any exception occurs during the atomic update,\
-        this function calls the :func:`_revert_photon(validated_photon, validated_modules)`\
-        function to fall back to the previous working state.
-
-        - Please note that any exception that is raised during any defined calls in this function is propagated back to the caller.\
-        The exceptions may arise due to coding bugs, configuration issues, or other environmental reasons.
-
+        This function reloads every photon of a file with double buffering, so the registry never lacks the photon.
+
+        - The new version is imported and validated side by side with the running one. Its handlers are staged\
+        instead of registered, and every photon whose previous version was started is instantiated and\
+        initialized before anything is torn down.
+        - Only once the new version is ready are the registry entries swapped, without yielding to the event\
+        loop in between, so concurrent callers see either the old or the new photon but never a missing one.\
+        The previous instances are finalized after the swap.
+        - If the new version fails to import, or one of its photons fails to start, the staged photons are\
+        stopped, the previous modules are restored, and the previous version simply keeps running.
+        - A handler which was already replaced by reloading its file resolves to its replacement.
         """
         def _get_validated_modules(photon_name: str) -> dict:
             modules = {
@@ -615,17 +1393,54 @@ class Loader():
                 if SystemUtils.is_submodule(photon_name, name)
             }
             return modules
-        validated_photon, validated_modules = await self._check_photon(photon), dict()
-        if isinstance(validated_photon, list):
-            for _photon in validated_photon:
-                cluster = _get_validated_modules(_photon.name)
-                validated_modules.update(cluster)
-        else:
-            cluster = _get_validated_modules(validated_photon.name)
-            validated_modules.update(cluster)
+        if isinstance(photon, Handler) and not self._photons.get(photon.name, None) in (None, photon):
+            current = self._photons[photon.name]
+            if Registry.normalize(current.filepath) == Registry.normalize(photon.filepath):
+                return current # A sibling's reload already replaced this handler.
+        validated_photon = await self._check_photon(photon)
         photon = photon.filepath if isinstance(photon, Handler) else photon
-        await self._absorb_photon(validated_photon, suppress_finalizer_log=True)
-        return await self._emit_photon(photon)
+        cluster = list(validated_photon) if isinstance(validated_photon, list) else [validated_photon]
+        cluster.extend(handler for handler in self._photons.get_by_filepath(photon) if not handler in cluster)
+        previous_modules: dict[str, ModuleType] = {}
+        with LifecycleStats.timer(self._stats, photon, "cleanup"):
+            resolved_name = self._resolver.resolve_path(photon)[0]
+            if resolved_name in sys.modules:
+                previous_modules[resolved_name] = sys.modules[resolved_name]
+            for _photon in cluster:
+                previous_modules.update(_get_validated_modules(_photon.name))
+            for name in previous_modules: # Helper modules are imported again from the photon directory.
+                sys.modules.pop(name, None)
+        running = [_photon.name for _photon in cluster # Photons that were in use stay warm after a reload.
+                   if _photon.is_started or (self.lazy and not _photon.is_lazy)]
+        started = time.perf_counter()
+        staged: list[Handler] = []
+        token = self._staging.set((self, staged))
+        directory = os.path.abspath(os.path.normpath(os.path.dirname(photon)))
+        self._resolver.normalize_paths(directory) # Purged helper modules are imported from the photon directory.
+        try: reloaded = await self._emit_photon(photon)
+        finally:
+            self._resolver.reset_paths(directory)
+            self._staging.reset(token)
+        replacements = [handler for handler in staged if handler.name in running]
+        await self._start_photons(replacements)
+        if reloaded is None or not all(handler.is_ready for handler in replacements):
+            for handler in replacements:
+                await self._retire_photon(handler)
+            sys.modules.update(previous_modules)
+            if self.logging: # pragma: no cover
+                self._logger.warning(f"Photon '{photon}' couldn't be reloaded! -> Keeping the previous version.")
+            return validated_photon
+        names = set(handler.name for handler in staged)
+        for handler in cluster: # Swap every entry at once, without awaiting in between.
+            if not handler.name in names and self._photons.get(handler.name, None) is handler:
+                self._photons.pop(handler.name, None)
+        for handler in staged:
+            self._register_photon(handler)
+        self._count_event(photon, "reloads")
+        for handler in staged:
+            self._emit_event("reloaded", handler.filepath, handler.name, time.perf_counter() - started)
+        await asyncio.gather(*[self._retire_photon(handler) for handler in cluster])
+        return reloaded
         
     async def _reload_photons(self: "Loader", photons: list[Handler|str]) -> list[Handler]:
         """``|coro|``
@@ -655,20 +1470,35 @@ class Loader():
         them onto the handlers list. If the result of the :func:`_reload_photon(photon)` function call returns a single :class:`Handler`\
         object, this function appends the single :class:`Handler` object onto the handlers list.
         
+        - Photons are grouped by their file. Up to ``workers`` files are reloaded at the same time, while the photons\
+        of a single file are always reloaded one after another.
         - Please note that any exception that is raised during the :func:`_reload_photon(photon)` function call is immediately propagated\
         back to the caller. The exceptions may arise due to coding bugs, configuration issues, or other environmental reasons.
 
         """
+        async def _bounded_reload(cluster: list[Handler|str]) -> list[Handler|list[Handler]]:
+            async with semaphore:
+                return [await self._reload_photon(photon) for photon in cluster]
         handlers = []
+        clusters: dict[str, list[Handler|str]] = {}
         for photon in photons:
-            result = await self._reload_photon(photon)
+            filepath = photon.filepath if isinstance(photon, Handler) else photon
+            clusters.setdefault(os.path.abspath(filepath), []).append(photon)
+        semaphore = asyncio.Semaphore(self.workers)
+        reloads = await asyncio.gather(*[_bounded_reload(cluster) for cluster in clusters.values()])
+        for result in [result for cluster in reloads for result in cluster]:
             if isinstance(result, list):
                 handlers.extend(result)
             if isinstance(result, Handler):
                 handlers.append(result)
         return handlers
 
-    async def _observe_photons(self: "Loader", photons_directory: str, loop_trace: LoopTrace = None) -> bool:
+    async def _observe_photons(self: "Loader",
+                               photons_directory: str,
+                               loop_trace: LoopTrace = None,
+                               engine: str = "auto",
+                               debounce: float = 0.25,
+                               max_delay: float = 5.0) -> bool:
         """``|coro|``
 
         Observes photons for changes by continuously calculating their checksum and reloading when a change is detected.
@@ -679,6 +1509,12 @@ class Loader():
             The path to the photons directory which needs to be monitored.
         loop_trace : :class:`LoopTrace`
             An optional trace object to keep track of loop iterations and allow testing of infinite loops, defaults to ``None``.
+        engine : Optional[:class:`str`]
+            How changes are detected: ``inotify`` events, ``polling``, or ``auto`` which prefers events. Defaults to ``auto``.
+        debounce : Optional[:class:`float`]
+            The number of seconds the tree must stay unchanged before a batch of changes is processed. Defaults to ``0.25``.
+        max_delay : Optional[:class:`float`]
+            The maximum number of seconds a batch is held back while changes keep arriving. Defaults to ``5.0``.
             
         Returns
         ----------
@@ -708,44 +1544,121 @@ class Loader():
         - The function then pauses for one second by calling the :func:`SystemUtils.continue_async(1)` function before resuming with the\
         next cycle. In case the ``loop_trace`` parameter is provided, this function evaluates the provided loop tasks by calling the\
         :func:`loop_trace.evalutate_tasks()` function.
+        - Checksums are served by the ``fingerprints`` cache, so only files whose stat signature changed are hashed again.
+        - The directory itself is tracked by a :class:`MerkleIndex`, so only the files it reports as added, modified, or removed\
+        are loaded or checked for reloading. The index only lists directories again when their ``mtime_ns`` changed, so finding\
+        new files never walks the whole tree, and loaded photon paths are only collected into a set when something changed.
+        - When the directory is watched through inotify, the function waits for up to one second for file system events instead\
+        of pausing, and only refreshes the paths they are about, so an idle tree costs nothing and changes are seen immediately.
+        - Once a change is seen, the function keeps collecting changes until none arrive for ``debounce`` seconds, or ``max_delay``\
+        seconds have passed, so files written in several steps are never imported half-written.
+        - A burst of changes across many photons is loaded and reloaded as a single batch.
+        - Files which fail to import are quarantined. They are only tried again once their contents change, or when their\
+        backoff elapses, which doubles after every failure. See the ``quarantine`` property.
+        - Photons loaded from outside of the directory are checked on every cycle, and photons whose files were deleted are unloaded.
+        - A change is followed through the ``dependencies`` graph. Every photon which imports a changed module, directly or\
+        indirectly, is reloaded too, after the modules it imports. Changed helper modules which aren't photons are purged from\
+        ``sys.modules`` so that their dependents import the new version, and independent photons are reloaded concurrently.
+        - When the function runs on the watcher thread, it also stops once the thread's cancellation token is cancelled,\
+        so halting the thread never has to interrupt it. The token is checked every ``token_interval`` seconds while the\
+        function waits for changes or for a batch to settle.
         - Please note that any exception that is raised during any defined calls in this function is propagated back to the caller.\
         The exceptions may arise due to coding bugs, configuration issues, or other environmental reasons.
 
         """
-        def _get_loaded_photon_paths() -> list[str]:
-            return list(set([photon.filepath for photon in self.photons.values()]))
-        def _get_unloaded_photon_paths(z: list[str]) -> list[str]:
-            filepaths = [f"{r}{y}{f}" for r, d, ff in os.walk(x) for f in ff if f.endswith(".py")]
-            return [filepath for filepath in filepaths if not filepath in z]
+        def _locate_photon(filepath: str) -> tuple[str, bool]:
+            if not filepath in locations: # Resolved once per file instead of on every cycle.
+                locations[filepath] = (os.path.abspath(filepath), index.is_within(filepath))
+            return locations[filepath]
+        def _get_loaded_photon_paths() -> set[str]:
+            return self._photons.filepaths
+        def _is_quarantined(filepath: str) -> bool:
+            if not filepath in self._quarantine: return False
+            if not os.path.isfile(filepath): # Deleted files have nothing left to retry.
+                self._quarantine.release(filepath)
+                return False
+            return self._quarantine.is_quarantined(filepath, self._fingerprints.get_checksum(filepath))
+        def _get_unloaded_photon_paths(changes: list[str]) -> list[str]:
+            retries = [filepath for filepath in self._quarantine.get_due() if index.is_within(filepath)]
+            candidates = list(dict.fromkeys(os.path.abspath(filepath) for filepath in changes + retries))
+            if not candidates: return [] # Nothing was added, so the loaded photons don't have to be collected.
+            return [filepath for filepath in candidates if not self._photons.has_filepath(filepath)
+                    and os.path.isfile(filepath) and not _is_quarantined(filepath)]
         async def _start_inactive_photons() -> None:
-            for photon in self.photons.values(): await photon.start()
+            await self._start_photons([photon for photon in self.photons.values() # Lazy photons wait for their first use.
+                                       if not photon.is_lazy and not photon.is_started])
         async def _load_photons_by_string(filepaths: list[str]) -> Handler:
             return [await self._emit_photon(filepath) for filepath in filepaths]
-        async def _reload_changed_photons() -> None:
+        async def _reload_changed_photons(changes: list[str]) -> None:
             _logger = Logger(__name__)
-            _photons_to_reload = []
-            _photons = self.photons.copy()
-            for photon in _photons.values():
-                checksum = SystemUtils.get_file_checksum(photon.filepath)
-                if checksum != photon.checksum:
-                    _photons_to_reload.append(photon)
-            reloaded = await self._reload_photons(_photons_to_reload)
+            _photons_to_absorb, reloaded = [], []
+            _changes = set(os.path.abspath(filepath) for filepath in changes)
+            _photon_paths = _get_loaded_photon_paths() if _changes else set()
+            _changed = _changes.difference(_photon_paths) # The index only reports helpers whose contents changed.
+            for photon in list(self.photons.values()):
+                filepath, is_within = _locate_photon(photon.filepath)
+                if is_within and not filepath in _changes:
+                    continue # The Merkle index already knows this file didn't change.
+                checksum = self._fingerprints.get_checksum(photon.filepath)
+                if checksum is None and not os.path.exists(photon.filepath):
+                    _photons_to_absorb.append(photon) # The photon was deleted, so there is nothing to reload.
+                elif checksum != photon.checksum:
+                    _changed.add(os.path.abspath(photon.filepath))
+            for photon in _photons_to_absorb:
+                await self._absorb_photon(photon, suppress_finalizer_log=True)
+                self._graph.discard(photon.filepath)
+            if _changed and not _changes: # Only photons outside of the directory changed.
+                _photon_paths = _get_loaded_photon_paths()
+            for stage in self._graph.get_reload_order(list(_changed)):
+                self._purge_modules([filepath for filepath in stage if not filepath in _photon_paths])
+                _stage = self._photons.get_by_filepaths(stage)
+                if _stage: reloaded.extend(await self._reload_photons(_stage))
             for entry in reloaded:
                 if self.logging: # pragma: no cover
                     _logger.private(f"Successfully reloaded '{entry.filepath}'!")
-        x = photons_directory
-        y = SystemUtils.get_system_delimiter()
-        while self._is_watching: # pragma: no branch
-            z = _get_loaded_photon_paths()
-            a = _get_unloaded_photon_paths(z)
-            await _load_photons_by_string(a)
-            await _reload_changed_photons()
-            await _start_inactive_photons()
-            #* This is mostly for unit testing...
-            if loop_trace: # pragma: no branch
-                try: await loop_trace.evalutate_tasks()
-                except RuntimeError: break # More than likely from unit tests.
-            await SystemUtils.continue_async(1)
+        async def _wait_for_changes(timeout: float) -> list[str]:
+            deadline = time.monotonic() + timeout
+            events: list = []
+            while True: # Waits in slices on the watcher thread, so a cancelled token is noticed while waiting too.
+                remaining = max(deadline - time.monotonic(), 0)
+                step = remaining if token is None else min(remaining, self.token_interval)
+                if watcher is None: await SystemUtils.continue_async(step)
+                else: events = await watcher.wait(step)
+                if not token is None and token.is_cancelled:
+                    return []
+                if events or time.monotonic() >= deadline:
+                    break
+            if watcher is None:
+                return await self._refresh_index(index)
+            return await self._refresh_index(index, Inotify.get_changed_paths(events)) # ``None`` means events were lost.
+        async def _settle_changes(changes: list[str]) -> list[str]:
+            batch = dict.fromkeys(changes)
+            deadline = time.monotonic() + max_delay
+            while debounce > 0 and time.monotonic() < deadline:
+                settled = await _wait_for_changes(min(debounce, max(deadline - time.monotonic(), 0)))
+                if not settled: break # The tree has been quiet for a whole debounce window.
+                batch.update(dict.fromkeys(settled))
+            return list(batch)
+        index = self._get_merkle_index(photons_directory)
+        watcher = self._create_watcher(index.root, engine)
+        locations: dict[str, tuple[str, bool]] = {}
+        changes = await self._refresh_index(index)
+        token = CancellableThread.current_token() # Set when the loop runs on the watcher thread.
+        try:
+            while self._is_watching and (token is None or not token.is_cancelled): # pragma: no branch
+                a = _get_unloaded_photon_paths(changes)
+                await _load_photons_by_string(a)
+                await _reload_changed_photons(changes)
+                await _start_inactive_photons()
+                self._save_manifest()
+                #* This is mostly for unit testing...
+                if loop_trace: # pragma: no branch
+                    try: await loop_trace.evalutate_tasks()
+                    except RuntimeError: break # More than likely from unit tests.
+                changes = await _wait_for_changes(1)
+                if changes: changes = await _settle_changes(changes)
+        finally:
+            if not watcher is None: watcher.close()
         return True
 
     async def load_photon(self: "Loader", 
@@ -808,6 +1721,7 @@ class Loader():
                                             other_classes,
                                             recursive)
         self._resolver.reset_paths(os.path.dirname(photon_path))
+        self._save_manifest()
         return photons
     
     async def load_photons(self: "Loader", 
@@ -864,13 +1778,315 @@ class Loader():
         if os.path.isfile(photons_directory):
             raise DirectoryNotFoundError("The provided path is a file and not a photon directory!")
         self._resolver.normalize_paths(photons_directory)
-        photons: list[Handler] = await self._emit_photons(photons_directory,
-                                                            photon_base,
-                                                            other_classes,
-                                                            recursive)
+        self._loading_depth += 1
+        try:
+            photons: list[Handler] = await self._emit_photons(photons_directory,
+                                                                photon_base,
+                                                                other_classes,
+                                                                recursive)
+        finally:
+            self._loading_depth -= 1
         self._resolver.reset_paths(photons_directory)
+        if self._loading_depth == 0: # Nested packages are saved once by the outermost call.
+            self._save_manifest()
         return photons
     
+    async def discover_photons(self: "Loader",
+                               photons_directory: str,
+                               photon_base: type=IPhoton,
+                               other_classes: list[str] = [],
+                               recursive: bool = False) -> list[PhotonSignature]:
+        """``|coro|``
+
+        Builds a catalog of every photon within a directory by parsing the photon sources, without importing\
+        or executing any of them.
+
+        Parameters
+        ----------
+        photons_directory : :class:`str`
+            Represents the path to the directory containing the photon modules to be discovered.
+        photon_base : Optional[:class:`type`]
+            An optional base class type for photon modules to be discovered. Defaults to :class:`IPhoton`.
+        other_classes : Optional[:class:`list[str]`]
+            An optional list of string names of other classes to discover from the photons. Defaults to ``[]``.
+        recursive : Optional[:class:`bool`]
+            A flag that indicates whether to search for photon modules recursively under the provided directory path. Defaults to ``False``.
+
+        Returns
+        ----------
+        :class:`list[PhotonSignature]`
+            A signature for every discovered photon, containing its name, file path, base classes, and metadata.
+
+        Raises
+        ----------
+        DirectoryNotFoundError
+            If the provided photon path doesn't exist, or is a file.
+
+        Notes
+        ----------
+        - Directories are followed under the same rules as :func:`load_photons()`. Files which cannot be\
+        read or parsed are skipped.
+
+        Examples
+        ----------
+        >>> catalog = await discover_photons("photons/")
+        >>> [signature.name for signature in catalog]
+        ['Alpha', 'Omega']
+        """
+        if not isinstance(photons_directory, str):
+            raise TypeError("The photons directory must be a string!")
+        if not isinstance(photon_base, type):
+            raise TypeError("The photon base must be a valid class type!")
+        if not isinstance(other_classes, list):
+            raise TypeError("Other classes must be defined as a list!")
+        else:
+            if any(not isinstance(element, str) for element in other_classes):
+                raise TypeError("All classes must be defined as a list of strings!")
+        if not isinstance(recursive, bool):
+            raise TypeError("The recursive flag must be a boolean!")
+        if not os.path.exists(photons_directory):
+            raise DirectoryNotFoundError("The provided photon directory doesn't exist!")
+        if os.path.isfile(photons_directory):
+            raise DirectoryNotFoundError("The provided path is a file and not a photon directory!")
+        signatures: list[PhotonSignature] = []
+        modules, packages_only = await self._find_modules(photons_directory)
+        for module_path, is_dir in modules:
+            if is_dir:
+                if recursive or packages_only:
+                    signatures.extend(await self.discover_photons(module_path, photon_base,
+                                                                  other_classes, recursive))
+                continue
+            discovered = await self._inspect_photon(module_path, photon_base, other_classes)
+            if discovered:
+                signatures.extend(discovered)
+        return signatures
+
+    async def get_root_digest(self: "Loader", photons_directory: str) -> Optional[str]:
+        """``|coro|``
+
+        Returns the Merkle root digest of every photon file within a directory and its subdirectories.
+
+        Parameters
+        ----------
+        photons_directory : :class:`str`
+            Represents the path to the photons directory.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The root digest of the directory, or ``None`` if it disappeared while being indexed.
+
+        Raises
+        ----------
+        TypeError
+            If the ``photons_directory`` argument is not a string.
+        DirectoryNotFoundError
+            If the provided photon path doesn't exist, or is a file.
+
+        Notes
+        ----------
+        - The digest only depends on the names and contents of the photon files, so two hosts can compare\
+        their photon trees by comparing digests, as long as both loaders use the same checksum ``algorithm``.
+        - The index is kept between calls and shared with :func:`watch_photons()`, so only files whose stat\
+        signature changed are hashed again.
+
+        Examples
+        ----------
+        >>> local = await loader.get_root_digest("photons/")
+        >>> local == remote
+        True
+        """
+        if not isinstance(photons_directory, str):
+            raise TypeError("The photons directory must be a string!")
+        if not os.path.exists(photons_directory):
+            raise DirectoryNotFoundError("The provided photon directory doesn't exist!")
+        if os.path.isfile(photons_directory):
+            raise DirectoryNotFoundError("The provided path is a file and not a photon directory!")
+        index = self._get_merkle_index(photons_directory)
+        await self._refresh_index(index)
+        return index.root_digest
+
+    def subscribe(self: "Loader",
+                  kinds: Optional[list[str]] = None,
+                  buffer: int = 256,
+                  drop: str = "oldest") -> Subscription:
+        """
+        Subscribes to the lifecycle events of every photon, which are consumed as an asynchronous iterator.
+
+        Parameters
+        ----------
+        kinds : Optional[:class:`list[str]`]
+            The event kinds to receive, any of ``discovered``, ``imported``, ``started``, ``reloaded``, ``failed``,\
+            and ``unloaded``. Defaults to ``None``, which receives every event.
+        buffer : Optional[:class:`int`]
+            The maximum number of events waiting to be consumed by the subscriber. Defaults to ``256``.
+        drop : Optional[:class:`str`]
+            Which event is dropped once the buffer is full, either the ``oldest`` waiting event or the ``newest``\
+            incoming one. Defaults to ``oldest``.
+
+        Returns
+        ----------
+        :class:`Subscription`
+            The subscription, which stops receiving events once it is closed.
+
+        Raises
+        ----------
+        TypeError
+            If ``buffer`` is not an integer.
+        ValueError
+            If ``buffer`` is less than one, or ``drop`` or one of the ``kinds`` is unknown.
+
+        Notes
+        ----------
+        - ``imported`` and ``failed`` import events describe a whole photon file and have no ``name``. Every other\
+        event belongs to a single photon. Every event carries its ``timestamp`` and the ``duration`` of the\
+        operation which caused it.
+        - Events are only created while somebody is subscribed, and publishing never waits for a subscriber.\
+        A subscriber which falls behind loses events according to ``drop`` and can check :attr:`Subscription.dropped`.
+
+        Examples
+        ----------
+        >>> async with loader.subscribe(["discovered", "reloaded", "unloaded"]) as events:
+        ...     async for event in events:
+        ...         routes.update(event.name, event.kind)
+        """
+        return self._events.subscribe(kinds, buffer, drop)
+
+    def add_listener(self: "Loader", callback: Callable[[PhotonEvent], Any], kinds: Optional[list[str]] = None) -> None:
+        """
+        Registers a function, or coroutine function, which is called with every future lifecycle event.
+
+        Parameters
+        ----------
+        callback : :class:`Callable[[PhotonEvent], Any]`
+            The function receiving every event.
+        kinds : Optional[:class:`list[str]`]
+            The event kinds to receive. Defaults to ``None``, which receives every event.
+
+        Raises
+        ----------
+        TypeError
+            If ``callback`` is not callable.
+        ValueError
+            If one of the ``kinds`` is unknown.
+
+        Notes
+        ----------
+        - Listeners are called on the thread which published the event, e.g. the watcher thread, and errors\
+        which they raise are suppressed. See :func:`EventBus.add_listener()`.
+        """
+        self._events.add_listener(callback, kinds)
+
+    def remove_listener(self: "Loader", callback: Callable[[PhotonEvent], Any]) -> bool:
+        """
+        Stops calling a function which was registered with :func:`add_listener()`.
+
+        Parameters
+        ----------
+        callback : :class:`Callable[[PhotonEvent], Any]`
+            The registered function.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the listener was removed, ``False`` if it wasn't registered.
+        """
+        return self._events.remove_listener(callback)
+
+    def stats(self: "Loader") -> dict[str, Any]:
+        """
+        Returns a snapshot of how long every lifecycle phase took for every photon and photon file.
+
+        Returns
+        ----------
+        :class:`dict[str, Any]`
+            A dictionary with an ``enabled`` flag, the ``window`` of the recent aggregates, and two dictionaries,\
+            ``photons`` keyed by the name of every registered photon and ``files`` keyed by the path of every\
+            photon file which was ever processed. Each entry holds the ``loads``, ``reloads``, and ``failures``\
+            counts and the ``phases`` which were recorded for it, see :func:`LifecycleStats.snapshot()`.
+
+        Notes
+        ----------
+        - Statistics are only collected if the loader was created with ``collect_stats``. Otherwise, the\
+        snapshot is empty.
+        - The phases are ``scan``, ``checksum``, ``exec_module``, ``validation``, ``instantiation``, ``finalize``,\
+        and ``cleanup``. Each one has cumulative aggregates and ``recent`` aggregates over the last ``window``\
+        durations, all in seconds.
+        - Files which failed to import don't have a photon, so they only show up in ``files``.
+
+        Examples
+        ----------
+        >>> loader = Loader(collect_stats=True)
+        >>> await loader.load_photons("photons/")
+        >>> slowest = max(loader.stats()["photons"].items(), key=lambda item: item[1]["phases"]["exec_module"]["max"])
+        """
+        if self._stats is None:
+            return {"enabled": False, "window": None, "photons": {}, "files": {}}
+        photons = {handler.name: {"filepath": handler.filepath, **self._stats.snapshot(handler.filepath, handler.name)}
+                   for handler in list(self._photons.values())}
+        files = {filepath: self._stats.snapshot(filepath) for filepath in self._stats.filepaths()}
+        return {"enabled": True, "window": self._stats.window, "photons": photons, "files": files}
+
+    async def warm(self: "Loader",
+                   photons: Optional[list[Handler|str]] = None,
+                   concurrency: Optional[int] = None) -> list[Handler]:
+        """``|coro|``
+
+        Imports and starts lazy photons ahead of their first use.
+
+        Parameters
+        ----------
+        photons : Optional[:class:`list[Handler|str]`]
+            The photon handlers, names, or filepaths to warm. Defaults to ``None``, which warms every photon.
+        concurrency : Optional[:class:`int`]
+            The maximum number of photons starting at once. Defaults to ``None``, which starts every photon at once.
+
+        Returns
+        ----------
+        :class:`list[Handler]`
+            The handlers of all photons that are now ready.
+
+        Raises
+        ----------
+        TypeError
+            If ``photons`` is not a list of :class:`Handler` objects or strings, or ``concurrency`` isn't an integer.
+        ValueError
+            If ``concurrency`` is less than one.
+
+        Notes
+        ----------
+        - A string is first looked up as a photon name and otherwise treated as the filepath of a photon file,\
+        in which case every photon of that file is warmed.
+        - The ``initialize()`` hooks of the photons are awaited concurrently, and only photons whose initializer\
+        completed are returned.
+
+        Examples
+        ----------
+        >>> loader = Loader(lazy=True)
+        >>> await loader.load_photons("photons/")
+        >>> await loader.warm(["Alpha", "photons/omega.py"])
+        """
+        if photons is None:
+            photons = list(self._photons.values())
+        if not isinstance(photons, list):
+            raise TypeError("Photons must be defined as a list of photon Handler objects or strings!")
+        if any(not isinstance(photon, str) and not isinstance(photon, Handler) for photon in photons):
+            raise TypeError("Photons must be defined as a list of photon Handler objects or strings!")
+        if not concurrency is None and (not isinstance(concurrency, int) or isinstance(concurrency, bool)):
+            raise TypeError("The start concurrency must be an integer!")
+        if not concurrency is None and concurrency < 1:
+            raise ValueError("The start concurrency must be at least one!")
+        handlers: list[Handler] = []
+        for photon in photons:
+            if isinstance(photon, str):
+                handler = self._photons.get(photon, None)
+                handlers.extend([handler] if handler else await self._check_photon(photon))
+            else:
+                handlers.append(photon)
+        handlers = list(dict.fromkeys(handlers))
+        await self._start_photons(handlers, concurrency)
+        return [handler for handler in handlers if handler.is_ready]
+
     async def unload_photon(self: "Loader", photon: Handler|str, force_stop: bool = False) -> bool:
         """``|coro|``
 
@@ -908,7 +2124,13 @@ class Loader():
             raise TypeError("The force stop flag must be a boolean value!")
         return await self._absorb_photon(photon, force_stop)
 
-    async def unload_photons(self: "Loader", photons: list[Handler|str], force_stop: bool = False) -> list[str]:
+    async def unload_photons(self: "Loader",
+                             photons: list[Handler|str],
+                             force_stop: bool = False,
+                             concurrency: Optional[int] = None,
+                             timeout: Optional[float] = None,
+                             deadline: Optional[float] = None,
+                             report: bool = False) -> list[str]|list[AbsorptionResult]:
         """``|coro|``
         
         Stops and unloads a collection of photons from the loader's photon registry by calling their finalizers, if any, \
@@ -926,11 +2148,37 @@ class Loader():
             A list of photon handler objects or filepaths to be unloaded.
         force_stop : :class:`bool`
             A flag which allows a photon to be immediately halted and collected without calling its finalizer.
+        concurrency : Optional[:class:`int`]
+            The maximum number of finalizers running at once. Defaults to ``None``, which runs every finalizer at once.
+        timeout : Optional[:class:`float`]
+            The number of seconds each finalizer may take before its photon is force-stopped. Defaults to ``None``,\
+            which waits indefinitely.
+        deadline : Optional[:class:`float`]
+            The number of seconds the whole unload may take before every remaining photon is force-stopped.\
+            Defaults to ``None``, which waits indefinitely.
+        report : Optional[:class:`bool`]
+            A flag which returns an :class:`AbsorptionResult` for every stopped photon instead of the filepaths.\
+            Defaults to ``False``.
 
         Returns
         ----------
-        :class:`list[str]`
-            A list containing the filepaths of all unloaded photons.
+        :class:`list[str]|list[AbsorptionResult]`
+            A list containing the filepaths of all unloaded photons, or the result of every stopped photon\
+            if ``report`` is set.
+
+        Raises
+        ----------
+        PhotonNotFoundError
+            If a filepath does not exist.
+        FinalizerNotImplementedError
+            If a finalizer is not implemented and ``report`` is not set. Every other photon is still unloaded.
+
+        Notes
+        ----------
+        - Finalizers run concurrently, so unloading is bounded by the slowest finalizer rather than by the sum\
+        of all of them. The ``timeout`` and ``deadline`` bound it further, and every photon which missed them is\
+        reported as ``timed_out`` after being force-stopped.
+        - With ``report`` set, errors raised by finalizers are recorded in the results instead of being raised.
 
         Examples
         ----------
@@ -938,6 +2186,9 @@ class Loader():
         ['photons/a.py', 'photons/a.py']
         >>> await unload_photons(['photons/a.py', 'photons/b.py'], force_stop=True)
         ['photons/a.py', 'photons/b.py']
+        >>> results = await unload_photons([handler1, handler2], concurrency=4, timeout=2, deadline=10, report=True)
+        >>> [result.name for result in results if result.timed_out]
+        ['Omega']
         """
         if not isinstance(photons, list):
             raise TypeError("Photons must be defined as a list of photon Handler objects or strings!")
@@ -946,7 +2197,24 @@ class Loader():
                 raise TypeError("Photons must be defined as a list of photon Handler objects or strings!")
         if not isinstance(force_stop, bool):
             raise TypeError("The force stop flag must be a boolean value!")
-        return await self._absorb_photons(photons, force_stop)
+        if not concurrency is None and (not isinstance(concurrency, int) or isinstance(concurrency, bool)):
+            raise TypeError("The finalizer concurrency must be an integer!")
+        if not concurrency is None and concurrency < 1:
+            raise ValueError("The finalizer concurrency must be at least one!")
+        for limit in (timeout, deadline):
+            if not limit is None and (not isinstance(limit, (int, float)) or isinstance(limit, bool)):
+                raise TypeError("The finalizer timeout and deadline must be numbers!")
+            if not limit is None and limit < 0:
+                raise ValueError("The finalizer timeout and deadline cannot be negative!")
+        if not isinstance(report, bool):
+            raise TypeError("The report flag must be a boolean value!")
+        absorbed, results = await self._absorb_photons(photons, force_stop, concurrency, timeout, deadline)
+        if report:
+            return results
+        for result in results:
+            if not result.error is None:
+                raise result.error
+        return absorbed
 
     async def reload_photon(self: "Loader", photon: Handler|str) -> Handler|list[Handler]:
         """``|coro|``
@@ -965,11 +2233,11 @@ class Loader():
 
         Notes
         ----------
-        This function makes a copy of both the loader's ``self._photons``, 
-        and the related ``sys.modules``. After which the provided photon will 
-        be unloaded, loaded again, and then returned as a freshly updated photon 
-        :class:`Handler` object. If any errors, in either unloading or loading,
-        all photons will revert to their original states.
+        This function imports and starts the new version of the photon side by side
+        with the running one, swaps the registry entries once it is ready, and only
+        then finalizes the previous instance, so the photon is never missing from
+        ``photons``. If the new version fails to import or start, the previous
+        version keeps running and its handler is returned.
 
         Examples
         ----------
@@ -980,7 +2248,9 @@ class Loader():
         """
         if not isinstance(photon, Handler) and not isinstance(photon, str):
             raise TypeError("The photon must be a Handler object or a filepath string!")
-        return await self._reload_photon(photon)
+        photons = await self._reload_photon(photon)
+        self._save_manifest()
+        return photons
 
     async def reload_photons(self: "Loader", photons: list[Handler|str]) -> list[Handler]:
         """``|coro|``
@@ -994,11 +2264,10 @@ class Loader():
 
         Notes
         ----------
-        This function makes a copy of both the loader's ``self._photons``, 
-        and the related ``sys.modules``. After which the provided photons will 
-        be unloaded, loaded again, and then returned as freshly updated photon 
-        :class:`Handler` objects. If any errors, in either unloading or loading,
-        all photons will revert to their original states.
+        Every photon is reloaded like :func:`reload_photon()`: the new version is
+        imported and started side by side with the running one, swapped into
+        ``photons`` once it is ready, and the previous instance is finalized last.
+        Photons whose new version fails keep running their previous version.
         
         Examples
         ----------
@@ -1012,9 +2281,15 @@ class Loader():
         else:
             if any(not isinstance(photon, str) and not isinstance(photon, Handler) for photon in photons):
                 raise TypeError("Photons must be defined as a list of photon Handler objects or strings!")
-        return await self._reload_photons(photons)
+        photons = await self._reload_photons(photons)
+        self._save_manifest()
+        return photons
 
-    async def watch_photons(self: "Loader", photons_directory: str) -> None:
+    async def watch_photons(self: "Loader",
+                            photons_directory: str,
+                            engine: str = "auto",
+                            debounce: float = 0.25,
+                            max_delay: float = 5.0) -> None:
         """``|coro|``
 
         Creates a thread manager and spawns a new thread to monitor photons in a given directory\
@@ -1024,11 +2299,21 @@ class Loader():
         ----------
         photons_directory : :class:`str`
             The directory path to the photons folder which needs to be monitored.
+        engine : Optional[:class:`str`]
+            How changes are detected. ``inotify`` reacts to file system events on Linux, ``polling`` checks the\
+            tree every second, and ``auto`` uses inotify when it is available and polls otherwise. Defaults to ``auto``.
+        debounce : Optional[:class:`float`]
+            The number of seconds the tree must stay unchanged before changed photons are loaded and reloaded as\
+            one batch. Defaults to ``0.25``, and ``0`` processes every change as soon as it is seen.
+        max_delay : Optional[:class:`float`]
+            The maximum number of seconds a batch is held back while changes keep arriving. Defaults to ``5.0``.
             
         Raises
         ----------
         TypeError
-            If the ``photons_directory`` argument is not a string.
+            If the ``photons_directory`` or ``engine`` argument is not a string, or a delay is not a number.
+        ValueError
+            If the engine is unknown, ``inotify`` was requested on a platform without it, or a delay is negative.
         DirectoryNotFoundError
             If the ``photons_directory`` argument is not a valid directory.
         ThreadManagerAlreadyRunning
@@ -1049,9 +2334,20 @@ class Loader():
 
         """
         def _start_watching(directory: str) -> None: # pragma: no cover
-            asyncio.run(self._observe_photons(directory)) 
+            asyncio.run(self._observe_photons(directory, engine=engine, debounce=debounce, max_delay=max_delay))
         if not isinstance(photons_directory, str):
             raise TypeError("The photons directory must be a string!")
+        if not isinstance(engine, str):
+            raise TypeError("The watch engine must be a string!")
+        if not engine in self.watch_engines:
+            raise ValueError(f"The watch engine must be one of {', '.join(self.watch_engines)}!")
+        if engine == "inotify" and not Inotify.is_supported(): # pragma: no cover
+            raise ValueError("The inotify watch engine is not supported on this platform!")
+        for delay in (debounce, max_delay):
+            if not isinstance(delay, (int, float)) or isinstance(delay, bool):
+                raise TypeError("The debounce and maximum delay must be numbers!")
+            if delay < 0:
+                raise ValueError("The debounce and maximum delay cannot be negative!")
         if not os.path.exists(photons_directory) or os.path.isfile(photons_directory):
             raise DirectoryNotFoundError("The photons directory should be a real directory!")
         if self._is_watching:
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# ########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for persisting what was discovered about each
+# photon file so that unchanged files can skip scanning and hashing when a
+# loader is restarted.
+# #########################################################################
+from typing import Optional
+import threading
+import json
+import os
+
+class Manifest():
+    """Keeps an on-disk record of photon files, their stat signatures, checksums, and discovered classes."""
+    version: int = 1
+
+    def __init__(self: "Manifest", filepath: str) -> None:
+        """
+        Initializes a new :class:`Manifest` instance and reads any previously saved entries.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The location of the manifest file. It is created on the first call to :func:`save()`.
+
+        Notes
+        ----------
+        - Every entry is keyed by the absolute path of a photon file and stores its ``inode``, ``mtime_ns``,\
+        ``size``, ``checksum`` and the ``algorithm`` it was calculated with, the names of the discovered\
+        ``classes``, and the ``base`` class they were discovered with.
+        - An unreadable or incompatible manifest file is ignored and will be overwritten on the next save.
+        """
+        self._filepath: str = os.path.abspath(filepath)
+        self._entries: dict[str, dict] = {}
+        self._touched: set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+        self._dirty: bool = False
+        self.load()
+
+    @property
+    def filepath(self: "Manifest") -> str:
+        """
+        Returns the location of the manifest file.
+
+        Returns
+        ----------
+        :class:`str`
+            The absolute path of the manifest file.
+        """
+        return self._filepath
+
+    @property
+    def entries(self: "Manifest") -> dict[str, dict]:
+        """
+        Returns a copy of all entries currently held by the manifest.
+
+        Returns
+        ----------
+        :class:`dict[str, dict]`
+            The manifest entries keyed by the absolute path of each photon file.
+        """
+        with self._lock:
+            return {path: dict(entry) for path, entry in self._entries.items()}
+
+    @staticmethod
+    def get_signature(stat: os.stat_result) -> tuple[int, int, int]:
+        """
+        Returns the part of a stat result which decides if a file must be scanned again.
+
+        Parameters
+        ----------
+        stat : :class:`os.stat_result`
+            The stat result of a photon file.
+
+        Returns
+        ----------
+        :class:`tuple[int, int, int]`
+            The ``inode``, ``mtime_ns``, and ``size`` of the file.
+        """
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def get_base_name(photon_base: type) -> str:
+        """
+        Returns the fully qualified name of a photon base class as it is stored in the manifest.
+
+        Parameters
+        ----------
+        photon_base : :class:`type`
+            The base class used when discovering photons.
+
+        Returns
+        ----------
+        :class:`str`
+            The module and qualified name of the base class.
+        """
+        return f"{photon_base.__module__}.{photon_base.__qualname__}"
+
+    def load(self: "Manifest") -> bool:
+        """
+        Reads the manifest file from disk and replaces all entries held in memory.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if a compatible manifest was read, ``False`` otherwise.
+        """
+        try:
+            with open(self._filepath, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.version:
+                return False
+            with self._lock:
+                self._entries = dict(data.get("entries", {}))
+                self._dirty = False
+            return True
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def save(self: "Manifest") -> bool:
+        """
+        Writes all entries to the manifest file if anything changed since the last save.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the manifest file was written, ``False`` if there was nothing to write or it failed.
+
+        Notes
+        ----------
+        - Entries that were not looked up or updated during this session and no longer exist on disk are pruned.
+        - The file is written to a temporary location first and then moved into place so that a crash can never\
+        leave a partially written manifest behind.
+        """
+        with self._lock:
+            for path in [path for path in self._entries if not path in self._touched]:
+                if not os.path.isfile(path):
+                    del self._entries[path]
+                    self._dirty = True
+            if not self._dirty:
+                return False
+            data = {"version": self.version, "entries": self._entries}
+            temporary = f"{self._filepath}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+                with open(temporary, "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                os.replace(temporary, self._filepath)
+                self._dirty = False
+                return True
+            except OSError: # pragma: no cover
+                return False
+
+    def lookup(self: "Manifest", filepath: str, stat: Optional[os.stat_result] = None) -> Optional[dict]:
+        """
+        Returns the entry for a photon file if the file has not changed since it was recorded.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        stat : Optional[:class:`os.stat_result`]
+            An already known stat result for the file, which avoids another system call. Defaults to ``None``.
+
+        Returns
+        ----------
+        Optional[:class:`dict`]
+            The recorded entry, or ``None`` if there is no entry or the stat signature no longer matches.
+        """
+        filepath = os.path.abspath(filepath)
+        try: stat = stat or os.stat(filepath)
+        except OSError: return None
+        with self._lock:
+            self._touched.add(filepath)
+            entry = self._entries.get(filepath, None)
+            if entry is None:
+                return None
+            if (entry["inode"], entry["mtime_ns"], entry["size"]) != self.get_signature(stat):
+                return None
+            return dict(entry)
+
+    def update(self: "Manifest",
+               filepath: str,
+               checksum: Optional[str] = None,
+               algorithm: str = "sha512",
+               classes: Optional[list[str]] = None,
+               photon_base: Optional[type] = None,
+               other_classes: Optional[list[str]] = None,
+               stat: Optional[os.stat_result] = None) -> None:
+        """
+        Records the current state of a photon file, keeping previously stored values that aren't provided.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : Optional[:class:`str`]
+            The checksum of the file contents. Defaults to ``None``.
+        algorithm : Optional[:class:`str`]
+            The algorithm the checksum was calculated with. Defaults to ``sha512``.
+        classes : Optional[:class:`list[str]`]
+            The names of all classes discovered in the file. Defaults to ``None``.
+        photon_base : Optional[:class:`type`]
+            The base class that was used to discover the classes. Defaults to ``None``.
+        other_classes : Optional[:class:`list[str]`]
+            The additional class names that were used to discover the classes. Defaults to ``None``.
+        stat : Optional[:class:`os.stat_result`]
+            An already known stat result for the file. Defaults to ``None``.
+
+        Notes
+        ----------
+        - If the stat signature of the file changed since the existing entry was recorded, the previous\
+        checksum and classes are discarded rather than merged.
+        """
+        filepath = os.path.abspath(filepath)
+        try: stat = stat or os.stat(filepath)
+        except OSError: return
+        inode, mtime_ns, size = self.get_signature(stat)
+        with self._lock:
+            self._touched.add(filepath)
+            entry = self._entries.get(filepath, None)
+            if entry is None or (entry["inode"], entry["mtime_ns"], entry["size"]) != (inode, mtime_ns, size):
+                entry = {"inode": inode, "mtime_ns": mtime_ns, "size": size,
+                         "checksum": None, "algorithm": None, "classes": None, "base": None, "other_classes": []}
+            if not checksum is None:
+                entry["checksum"] = checksum
+                entry["algorithm"] = algorithm
+            if not classes is None:
+                entry["classes"] = list(classes)
+                entry["base"] = self.get_base_name(photon_base) if photon_base else None
+                entry["other_classes"] = sorted(other_classes or [])
+            self._entries[filepath] = entry
+            self._dirty = True
+
+    def get_checksum(self: "Manifest",
+                     filepath: str,
+                     algorithm: str = "sha512",
+                     stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Returns the recorded checksum of an unchanged photon file if it was calculated with the provided algorithm.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        algorithm : Optional[:class:`str`]
+            The algorithm the checksum must have been calculated with. Defaults to ``sha512``.
+        stat : Optional[:class:`os.stat_result`]
+            An already known stat result for the file. Defaults to ``None``.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The recorded checksum, or ``None`` if the file changed or was hashed with another algorithm.
+        """
+        entry = self.lookup(filepath, stat)
+        if entry is None or entry.get("algorithm", "sha512") != algorithm:
+            return None
+        return entry["checksum"]
+
+    def discard(self: "Manifest", filepath: str) -> bool:
+        """
+        Removes the entry of a photon file from the manifest.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if an entry was removed, ``False`` otherwise.
+        """
+        with self._lock:
+            if self._entries.pop(os.path.abspath(filepath), None) is None:
+                return False
+            self._dirty = True
+            return True
+
+    def is_barren(self: "Manifest", filepath: str, photon_base: type, other_classes: list[str]) -> bool:
+        """
+        Determines whether an unchanged photon file is already known to contain no photons.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        photon_base : :class:`type`
+            The base class that photons are being discovered with.
+        other_classes : :class:`list[str]`
+            The additional class names that photons are being discovered with.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the file is unchanged and a previous discovery with the same base class and\
+            additional classes found nothing, ``False`` otherwise.
+        """
+        entry = self.lookup(filepath)
+        if entry is None or entry["classes"] is None:
+            return False
+        return entry["classes"] == [] and \
+            entry["base"] == self.get_base_name(photon_base) and \
+            entry["other_classes"] == sorted(other_classes)
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for keeping a Merkle tree of photon directories
+# so that changes can be located without hashing the whole tree again.
+# #########################################################################
+from ..tools.checksums import Fingerprints
+from ..tools.utils import DigestUtils
+from typing import Optional
+import threading
+import stat as stats
+import os
+
+class MerkleIndex():
+    """Maintains a digest for every photon file and directory, where each directory digest is built from its children."""
+    ignored_directories: tuple[str, ...] = ("__pycache__",)
+
+    def __init__(self: "MerkleIndex",
+                 root: str,
+                 fingerprints: Optional[Fingerprints] = None,
+                 extensions: tuple[str, ...] = (".py",)) -> None:
+        """
+        Initializes a new :class:`MerkleIndex` instance. The tree is built on the first call to :func:`refresh()`.
+
+        Parameters
+        ----------
+        root : :class:`str`
+            The photons directory to index.
+        fingerprints : Optional[:class:`Fingerprints`]
+            The checksum cache used to hash files, which also decides the algorithm. Defaults to ``None``,\
+            which creates a private ``sha512`` cache.
+        extensions : Optional[:class:`tuple[str, ...]`]
+            The file extensions to include in the tree. Defaults to ``(".py",)``.
+
+        Notes
+        ----------
+        - A directory digest covers the kind, name, and digest of every child, but never the location of the root\
+        itself. Two hosts with identical photon trees therefore share the same :func:`root_digest`, as long as\
+        they use the same checksum algorithm.
+        - Hidden entries and ``__pycache__`` directories are never indexed.
+        """
+        self._root: str = os.path.normpath(root)
+        self._absolute_root: str = os.path.abspath(self._root)
+        self._fingerprints: Fingerprints = fingerprints or Fingerprints()
+        self._extensions: tuple[str, ...] = extensions
+        self._files: dict[str, tuple[tuple[int, ...], str]] = {}
+        self._directories: dict[str, tuple[tuple[int, int], list[tuple[str, bool]], str]] = {}
+        self._lock: threading.RLock = threading.RLock()
+
+    def __len__(self: "MerkleIndex") -> int:
+        """
+        Returns the number of files currently indexed.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of indexed files.
+        """
+        return len(self._files)
+
+    def __contains__(self: "MerkleIndex", path: str) -> bool:
+        """
+        Returns a flag indicating if a file or directory is currently indexed.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file or directory.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the path is indexed, ``False`` otherwise.
+        """
+        path = self._normalize(path)
+        return not path is None and (path in self._files or path in self._directories)
+
+    @property
+    def root(self: "MerkleIndex") -> str:
+        """
+        Returns the indexed photons directory.
+
+        Returns
+        ----------
+        :class:`str`
+            The normalized path of the root directory.
+        """
+        return self._root
+
+    @property
+    def algorithm(self: "MerkleIndex") -> str:
+        """
+        Returns the name of the algorithm used for every digest in the tree.
+
+        Returns
+        ----------
+        :class:`str`
+            The checksum algorithm.
+        """
+        return self._fingerprints.algorithm
+
+    @property
+    def root_digest(self: "MerkleIndex") -> Optional[str]:
+        """
+        Returns the digest of the whole photons directory as of the last :func:`refresh()`.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The root digest, or ``None`` if the tree wasn't built yet or the root doesn't exist.
+        """
+        return self.get_digest(self._root)
+
+    def _normalize(self: "MerkleIndex", path: str) -> Optional[str]:
+        """
+        Converts a path into the form it is indexed under.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            A relative or absolute path.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The indexed form of the path, or ``None`` if the path is outside of the root.
+        """
+        relative = os.path.relpath(os.path.abspath(path), self._absolute_root)
+        if relative == os.curdir:
+            return self._root
+        if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+            return None
+        return os.path.join(self._root, relative)
+
+    def is_within(self: "MerkleIndex", path: str) -> bool:
+        """
+        Returns a flag indicating if a path is located inside of the indexed root.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            A relative or absolute path.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the path is the root or one of its descendants, ``False`` otherwise.
+        """
+        return not self._normalize(path) is None
+
+    def get_digest(self: "MerkleIndex", path: str) -> Optional[str]:
+        """
+        Returns the digest of an indexed file or directory as of the last :func:`refresh()`.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file or directory.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The digest, or ``None`` if the path isn't indexed.
+        """
+        path = self._normalize(path)
+        with self._lock:
+            if path in self._directories:
+                return self._directories[path][2]
+            if path in self._files:
+                return self._files[path][1]
+            return None
+
+    def _list_children(self: "MerkleIndex", path: str) -> list[tuple[str, bool]]:
+        """
+        Lists the indexable children of a directory.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the directory.
+
+        Returns
+        ----------
+        :class:`list[tuple[str, bool]]`
+            The name of every child and a flag indicating if it is a directory, ordered by name.
+        """
+        children: list[tuple[str, bool]] = []
+        try:
+            with os.scandir(path) as scanner:
+                for entry in scanner:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        if not entry.name in self.ignored_directories:
+                            children.append((entry.name, True))
+                    elif entry.is_file() and entry.name.endswith(self._extensions):
+                        children.append((entry.name, False))
+        except OSError: # pragma: no cover
+            pass # Unreadable directories are indexed as empty.
+        return sorted(children)
+
+    def _combine(self: "MerkleIndex", children: list[tuple[str, bool, str]]) -> str:
+        """
+        Builds the digest of a directory from the digests of its children.
+
+        Parameters
+        ----------
+        children : :class:`list[tuple[str, bool, str]]`
+            The name, directory flag, and digest of every child, ordered by name.
+
+        Returns
+        ----------
+        :class:`str`
+            The digest of the directory.
+        """
+        digest = DigestUtils.new(self.algorithm)
+        for name, is_dir, child_digest in children:
+            digest.update(f"{'d' if is_dir else 'f'} {name} {child_digest}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _forget(self: "MerkleIndex", path: str, changes: list[str]) -> None:
+        """
+        Removes a file or a whole directory from the tree, recording every removed file as a change.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The indexed path of the file or directory.
+        changes : :class:`list[str]`
+            The list that changed file paths are appended to.
+        """
+        if not self._files.pop(path, None) is None:
+            changes.append(path)
+        node = self._directories.pop(path, None)
+        if not node is None:
+            for name, _ in node[1]:
+                self._forget(os.path.join(path, name), changes)
+
+    def _visit_file(self: "MerkleIndex",
+                    path: str,
+                    changes: list[str],
+                    stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Updates the digest of a file, only hashing it when its stat signature changed.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The indexed path of the file.
+        changes : :class:`list[str]`
+            The list that changed file paths are appended to.
+        stat : Optional[:class:`os.stat_result`]
+            An already known stat result for the file. Defaults to ``None``.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The digest of the file, or ``None`` if it no longer exists.
+        """
+        try: stat = stat or os.stat(path)
+        except OSError:
+            self._forget(path, changes)
+            return None
+        signature = Fingerprints.get_signature(stat)
+        cached = self._files.get(path, None)
+        if not cached is None and cached[0] == signature:
+            return cached[1]
+        digest = self._fingerprints.get_checksum(path)
+        if digest is None: # pragma: no cover
+            self._forget(path, changes)
+            return None
+        if cached is None or cached[1] != digest: # A touched but unchanged file isn't a change.
+            changes.append(path)
+        self._files[path] = (signature, digest)
+        return digest
+
+    def _visit_directory(self: "MerkleIndex",
+                         path: str,
+                         scope: Optional[tuple[set[str], set[str]]],
+                         changes: list[str]) -> Optional[str]:
+        """
+        Updates the digest of a directory from its children, descending only into children within the scope.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The indexed path of the directory.
+        scope : Optional[:class:`tuple[set[str], set[str]]`]
+            The paths to refresh and all of their ancestors, or ``None`` to refresh every descendant.
+        changes : :class:`list[str]`
+            The list that changed file paths are appended to.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The digest of the directory, or ``None`` if it no longer exists.
+        """
+        try: stat = os.stat(path)
+        except OSError: stat = None
+        if stat is None or not stats.S_ISDIR(stat.st_mode):
+            self._forget(path, changes)
+            return None
+        node = self._directories.get(path, None)
+        signature = (stat.st_ino, stat.st_mtime_ns)
+        if node is None or node[0] != signature: # Entries were added, removed, or renamed.
+            children = self._list_children(path)
+        else:
+            children = node[1]
+        if not node is None:
+            for name, is_dir in set(node[1]).difference(children):
+                self._forget(os.path.join(path, name), changes)
+        if not scope is None and path in scope[0]:
+            scope = None # Everything below a requested directory is refreshed.
+        files: dict[str, Optional[os.stat_result]] = {}
+        for name, is_dir in children:
+            child = os.path.join(path, name)
+            if not is_dir and (scope is None or not child in self._files or child in scope[1]):
+                try: files[child] = os.stat(child)
+                except OSError: files[child] = None
+        stale = [child for child, stat in files.items() if not stat is None and \
+                 self._files.get(child, (None,))[0] != Fingerprints.get_signature(stat)]
+        if len(stale) > 1: # Hash every changed file of the directory in parallel before visiting them.
+            self._fingerprints.get_checksums(stale)
+        digests: list[tuple[str, bool, str]] = []
+        for name, is_dir in children:
+            child = os.path.join(path, name)
+            cached = self._directories.get(child, None) if is_dir else self._files.get(child, None)
+            if not scope is None and not cached is None and not child in scope[1]:
+                digest = cached[-1] # The subtree is outside of the scope, so it is skipped entirely.
+            elif is_dir:
+                digest = self._visit_directory(child, scope, changes)
+            else:
+                digest = self._visit_file(child, changes, files.get(child, None))
+            if not digest is None:
+                digests.append((name, is_dir, digest))
+        digest = self._combine(digests)
+        self._directories[path] = (signature, children, digest)
+        return digest
+
+    def refresh(self: "MerkleIndex", paths: Optional[list[str]] = None) -> list[str]:
+        """
+        Brings the tree up to date and returns every file whose digest changed.
+
+        Parameters
+        ----------
+        paths : Optional[:class:`list[str]`]
+            The files or directories which are known to have changed, e.g. from file system events.\
+            Defaults to ``None``, which polls the whole tree.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The indexed paths of all added, modified, and removed files, ordered by path.
+
+        Notes
+        ----------
+        - Only the provided paths and the directories on the way to them are visited, and every other subtree\
+        keeps its digest without being touched. The cost is therefore proportional to the number of changed\
+        paths rather than the size of the tree.
+        - When polling, every entry is stat'ed, but files are only hashed when their stat signature changed,\
+        directories are only listed when their own mtime changed, and digests are only combined on the way up.
+        - The changed files of each directory are hashed together in parallel through\
+        :func:`Fingerprints.get_checksums()`.
+        - A file that was touched without its contents changing is not reported as a change.
+        """
+        with self._lock:
+            changes: list[str] = []
+            scope: Optional[tuple[set[str], set[str]]] = None
+            if not paths is None:
+                targets = set(path for path in map(self._normalize, paths) if not path is None)
+                if not targets:
+                    return changes
+                affected = set(targets)
+                for target in targets:
+                    while target != self._root:
+                        target = os.path.dirname(target)
+                        affected.add(target)
+                scope = (targets, affected)
+            self._visit_directory(self._root, scope, changes)
+            return sorted(changes)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for remembering photon files which failed to
+# import so that they are only retried when they change or are due again.
+# #########################################################################
+from typing import Optional
+import threading
+import time
+import os
+
+class QuarantineEntry():
+    """Describes a photon file which failed to import, along with when it may be retried."""
+    def __init__(self: "QuarantineEntry",
+                 filepath: str,
+                 checksum: Optional[str],
+                 error: str,
+                 failures: int,
+                 retry_at: float) -> None:
+        """
+        Initializes a new :class:`QuarantineEntry` instance.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The absolute path of the photon file.
+        checksum : Optional[:class:`str`]
+            The checksum of the contents which failed to import.
+        error : :class:`str`
+            A description of the last failure.
+        failures : :class:`int`
+            The number of consecutive failures of the file.
+        retry_at : :class:`float`
+            The :func:`time.monotonic()` timestamp after which the file may be retried.
+        """
+        self.filepath: str = filepath
+        self.checksum: Optional[str] = checksum
+        self.error: str = error
+        self.failures: int = failures
+        self.retry_at: float = retry_at
+
+    @property
+    def retry_in(self: "QuarantineEntry") -> float:
+        """
+        Returns the number of seconds until the file may be retried.
+
+        Returns
+        ----------
+        :class:`float`
+            The remaining backoff, or ``0`` if the file is already due.
+        """
+        return max(self.retry_at - time.monotonic(), 0.0)
+
+    def __str__(self: "QuarantineEntry") -> str:
+        """
+        Returns the current :class:`QuarantineEntry` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`QuarantineEntry` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+class Quarantine():
+    """A negative cache of photon files that failed to import, keyed by their path and checksum."""
+    def __init__(self: "Quarantine", backoff: float = 1.0, max_backoff: float = 300.0) -> None:
+        """
+        Initializes a new :class:`Quarantine` instance.
+
+        Parameters
+        ----------
+        backoff : Optional[:class:`float`]
+            The number of seconds to wait before retrying a file after its first failure. Defaults to ``1.0``.
+        max_backoff : Optional[:class:`float`]
+            The longest a file is ever held back, no matter how often it failed. Defaults to ``300.0``.
+
+        Raises
+        ----------
+        ValueError
+            If either duration is negative.
+
+        Notes
+        ----------
+        - The wait doubles after every consecutive failure, so a file which keeps failing for a reason outside of\
+        its own contents, e.g. a missing dependency, is retried less and less often.
+        - A file whose checksum changed is released immediately, since its new contents have never been tried.
+        """
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("The quarantine backoff cannot be negative!")
+        self._backoff: float = backoff
+        self._max_backoff: float = max_backoff
+        self._entries: dict[str, QuarantineEntry] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self: "Quarantine") -> int:
+        """
+        Returns the number of quarantined files.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of quarantined files.
+        """
+        return len(self._entries)
+
+    def __contains__(self: "Quarantine", filepath: str) -> bool:
+        """
+        Returns a flag indicating if a file is quarantined, regardless of its contents or backoff.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the file is quarantined, ``False`` otherwise.
+        """
+        return os.path.abspath(filepath) in self._entries
+
+    @property
+    def entries(self: "Quarantine") -> dict[str, QuarantineEntry]:
+        """
+        Returns every quarantined file.
+
+        Returns
+        ----------
+        :class:`dict[str, QuarantineEntry]`
+            The quarantine entries keyed by the absolute path of each photon file.
+        """
+        with self._lock:
+            return dict(self._entries)
+
+    def record(self: "Quarantine", filepath: str, checksum: Optional[str], error: BaseException|str) -> QuarantineEntry:
+        """
+        Quarantines a file after a failed import, extending its backoff if the same contents failed before.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : Optional[:class:`str`]
+            The checksum of the contents which failed to import.
+        error : :class:`BaseException|str`
+            The error which was raised, or a description of the failure.
+
+        Returns
+        ----------
+        :class:`QuarantineEntry`
+            The updated entry of the file.
+        """
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            entry = self._entries.get(filepath, None)
+            failures = entry.failures + 1 if not entry is None and entry.checksum == checksum else 1
+            delay = min(self._backoff * 2 ** (failures - 1), self._max_backoff)
+            entry = QuarantineEntry(filepath, checksum, str(error), failures, time.monotonic() + delay)
+            self._entries[filepath] = entry
+            return entry
+
+    def is_quarantined(self: "Quarantine", filepath: str, checksum: Optional[str]) -> bool:
+        """
+        Determines whether a file must still be skipped.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        checksum : Optional[:class:`str`]
+            The current checksum of the file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the same contents failed before and their backoff hasn't elapsed, ``False`` otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(filepath), None)
+            return not entry is None and entry.checksum == checksum and entry.retry_at > time.monotonic()
+
+    def get_due(self: "Quarantine") -> list[str]:
+        """
+        Returns every quarantined file whose backoff has elapsed.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The absolute paths of the files which may be retried now.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [filepath for filepath, entry in self._entries.items() if entry.retry_at <= now]
+
+    def release(self: "Quarantine", filepath: Optional[str] = None) -> bool:
+        """
+        Releases a file, or every file, from the quarantine.
+
+        Parameters
+        ----------
+        filepath : Optional[:class:`str`]
+            The path of the photon file. Defaults to ``None``, which releases every file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if anything was released, ``False`` otherwise.
+        """
+        with self._lock:
+            if filepath is None:
+                released = len(self._entries) > 0
+                self._entries.clear()
+                return released
+            return not self._entries.pop(os.path.abspath(filepath), None) is None
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module is responsible for keeping the registry of loaded photons
+# indexed by name, file path, module name, and base class at once.
+# #########################################################################
+from ..errors.cleanup import PhotonCollisionError
+from typing import Any, Iterable
+import os
+
+class Registry(dict):
+    """A dictionary of photon names and :class:`Handler` objects which also indexes every handler by file, module, and base class."""
+    def __init__(self: "Registry", *args: Any, **kwargs: Any) -> None:
+        """
+        Initializes a new :class:`Registry` instance, optionally filled like a :class:`dict`.
+
+        Notes
+        ----------
+        - Every mutation of the dictionary updates the secondary indexes as well, so looking photons up by\
+        :func:`get_by_filepath()`, :func:`get_by_module()`, or :func:`get_by_base()` is a constant time operation\
+        instead of a scan over every handler.
+        - A name can only be registered by the photons of one file at a time. Registering it from another file\
+        raises :class:`PhotonCollisionError` instead of silently replacing the loaded photon.
+        """
+        super().__init__()
+        self._filepaths: dict[str, dict[str, Any]] = {}
+        self._modules: dict[str, dict[str, Any]] = {}
+        self._bases: dict[str, dict[str, Any]] = {}
+        self._keys: dict[str, list[tuple[dict[str, dict[str, Any]], str]]] = {}
+        self.update(*args, **kwargs)
+
+    @staticmethod
+    def normalize(filepath: str) -> str:
+        """
+        Converts a file path into the form it is indexed under.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            A relative or absolute file path.
+
+        Returns
+        ----------
+        :class:`str`
+            The normalized absolute path.
+        """
+        return os.path.abspath(filepath)
+
+    @staticmethod
+    def get_module_name(filepath: str) -> str:
+        """
+        Returns the name a photon file is imported under.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+
+        Returns
+        ----------
+        :class:`str`
+            The file name without its extension.
+        """
+        return os.path.splitext(os.path.basename(filepath))[0]
+
+    @staticmethod
+    def get_base_names(handler: Any) -> list[str]:
+        """
+        Returns the names of the base classes a handler is indexed under.
+
+        Parameters
+        ----------
+        handler : :class:`Handler`
+            The handler of the photon.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The names of every base class of the photon except :class:`object`.
+
+        Notes
+        ----------
+        - Statically discovered photons are indexed under the bases written in their class definition, which\
+        keeps their entries stable when they are imported on first access.
+        """
+        signature = getattr(handler, "_signature", None)
+        if not signature is None:
+            return list(signature.bases)
+        photon_type = handler._instance[1] if isinstance(handler._instance, tuple) else handler._instance
+        if not isinstance(photon_type, type):
+            return []
+        return [base.__name__ for base in photon_type.__mro__[1:] if not base is object]
+
+    def _get_keys(self: "Registry", handler: Any) -> list[tuple[dict[str, dict[str, Any]], str]]:
+        """
+        Returns every secondary index entry of a handler.
+
+        Parameters
+        ----------
+        handler : :class:`Handler`
+            The handler of the photon.
+
+        Returns
+        ----------
+        :class:`list[tuple[dict[str, dict[str, Any]], str]]`
+            The index and key of each entry.
+        """
+        keys = [(self._filepaths, self.normalize(handler.filepath)),
+                (self._modules, self.get_module_name(handler.filepath))]
+        keys.extend((self._bases, base) for base in dict.fromkeys(self.get_base_names(handler)))
+        return keys
+
+    def _index(self: "Registry", name: str, handler: Any) -> None:
+        """
+        Adds a handler to the secondary indexes.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The registered name of the photon.
+        handler : :class:`Handler`
+            The handler of the photon.
+        """
+        self._keys[name] = self._get_keys(handler)
+        for index, key in self._keys[name]:
+            index.setdefault(key, {})[name] = handler
+
+    def _unindex(self: "Registry", name: str) -> None:
+        """
+        Removes a photon from the secondary indexes.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The registered name of the photon.
+
+        Notes
+        ----------
+        - The entries recorded when the photon was registered are removed, since a stopped handler no longer\
+        knows the type it was indexed under.
+        """
+        for index, key in self._keys.pop(name, []):
+            entries = index.get(key, {})
+            entries.pop(name, None)
+            if not entries:
+                index.pop(key, None)
+
+    def check(self: "Registry", name: str, handler: Any) -> bool:
+        """
+        Determines whether a handler could be registered under a photon name, without registering it.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        handler : :class:`Handler`
+            The handler of the photon.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the handler would replace a photon of the same file, ``False`` if the name is free.
+
+        Raises
+        ----------
+        PhotonCollisionError
+            If the name is already registered by a photon of another file.
+        """
+        existing = dict.get(self, name, None)
+        if existing is None:
+            return False
+        if self.normalize(existing.filepath) != self.normalize(handler.filepath):
+            raise PhotonCollisionError(f"The photon '{name}' of '{handler.filepath}' is already "
+                                       f"registered by '{existing.filepath}'!")
+        return True
+
+    def __setitem__(self: "Registry", name: str, handler: Any) -> None:
+        """
+        Registers a handler under a photon name.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        handler : :class:`Handler`
+            The handler of the photon.
+
+        Raises
+        ----------
+        PhotonCollisionError
+            If the name is already registered by a photon of another file.
+        """
+        if self.check(name, handler):
+            self._unindex(name)
+        dict.__setitem__(self, name, handler)
+        self._index(name, handler)
+
+    def __delitem__(self: "Registry", name: str) -> None:
+        """
+        Removes a photon name and its handler.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the photon.
+        """
+        dict.__delitem__(self, name)
+        self._unindex(name)
+
+    def __ior__(self: "Registry", other: Any) -> "Registry":
+        """Registers every handler of another mapping, like :func:`update()`."""
+        self.update(other)
+        return self
+
+    def pop(self: "Registry", name: str, *default: Any) -> Any:
+        """Removes a photon name and returns its handler, or the default if the name isn't registered."""
+        handler = dict.pop(self, name, *default)
+        self._unindex(name)
+        return handler
+
+    def popitem(self: "Registry") -> tuple[str, Any]:
+        """Removes and returns the most recently registered photon name and handler."""
+        name, handler = dict.popitem(self)
+        self._unindex(name)
+        return (name, handler)
+
+    def setdefault(self: "Registry", name: str, default: Any = None) -> Any:
+        """Registers a handler only if the name isn't registered yet, and returns the registered handler."""
+        if not name in self:
+            self[name] = default
+        return self[name]
+
+    def update(self: "Registry", *args: Any, **kwargs: Any) -> None:
+        """Registers every handler of a mapping or of keyword arguments, one at a time through :func:`__setitem__()`."""
+        for name, handler in dict(*args, **kwargs).items():
+            self[name] = handler
+
+    def clear(self: "Registry") -> None:
+        """Removes every photon and empties the secondary indexes."""
+        dict.clear(self)
+        self._filepaths.clear()
+        self._modules.clear()
+        self._bases.clear()
+        self._keys.clear()
+
+    def copy(self: "Registry") -> dict[str, Any]:
+        """
+        Returns a shallow snapshot of the registry.
+
+        Returns
+        ----------
+        :class:`dict[str, Handler]`
+            A plain dictionary of photon names and handlers which isn't affected by later changes.
+        """
+        return dict(self)
+
+    @property
+    def filepaths(self: "Registry") -> set[str]:
+        """
+        Returns the files of every registered photon.
+
+        Returns
+        ----------
+        :class:`set[str]`
+            The normalized absolute paths of all registered photon files.
+        """
+        return set(self._filepaths)
+
+    def has_filepath(self: "Registry", filepath: str) -> bool:
+        """
+        Returns a flag indicating if any photon of a file is registered.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if a photon of the file is registered, ``False`` otherwise.
+        """
+        return self.normalize(filepath) in self._filepaths
+
+    def get_by_filepath(self: "Registry", filepath: str) -> list[Any]:
+        """
+        Returns every photon defined in a file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The relative or absolute path of the photon file.
+
+        Returns
+        ----------
+        :class:`list[Handler]`
+            The handlers of the file in registration order.
+        """
+        return list(self._filepaths.get(self.normalize(filepath), {}).values())
+
+    def get_by_filepaths(self: "Registry", filepaths: Iterable[str]) -> list[Any]:
+        """
+        Returns every photon defined in any of several files.
+
+        Parameters
+        ----------
+        filepaths : :class:`Iterable[str]`
+            The relative or absolute paths of the photon files.
+
+        Returns
+        ----------
+        :class:`list[Handler]`
+            The handlers of the files, grouped by file in the order the files were provided.
+        """
+        handlers: list[Any] = []
+        for filepath in dict.fromkeys(self.normalize(filepath) for filepath in filepaths):
+            handlers.extend(self._filepaths.get(filepath, {}).values())
+        return handlers
+
+    def get_by_module(self: "Registry", module_name: str) -> list[Any]:
+        """
+        Returns every photon of the modules with a given name.
+
+        Parameters
+        ----------
+        module_name : :class:`str`
+            The name the photon files are imported under.
+
+        Returns
+        ----------
+        :class:`list[Handler]`
+            The handlers of the modules in registration order.
+        """
+        return list(self._modules.get(module_name, {}).values())
+
+    def get_by_base(self: "Registry", base: type|str) -> list[Any]:
+        """
+        Returns every photon which derives from a base class.
+
+        Parameters
+        ----------
+        base : :class:`type|str`
+            The base class, or the name of the base class.
+
+        Returns
+        ----------
+        :class:`list[Handler]`
+            The handlers of the derived photons in registration order.
+        """
+        return list(self._bases.get(base if isinstance(base, str) else base.__name__, {}).values())
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module records how long every stage of a photon's lifecycle takes
+# so that slow photons can be found without attaching a profiler.
+# #########################################################################
+from collections import deque
+from typing import Any, Optional
+import contextlib
+import threading
+import time
+import os
+
+class PhaseStats():
+    """Aggregates the durations of one lifecycle phase, both since the start and over a window of recent samples."""
+    def __init__(self: "PhaseStats", window: int) -> None:
+        """
+        Initializes a new :class:`PhaseStats` instance.
+
+        Parameters
+        ----------
+        window : :class:`int`
+            The number of recent durations which are kept for the recent aggregates.
+        """
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def record(self: "PhaseStats", seconds: float) -> None:
+        """
+        Adds a duration to the aggregates.
+
+        Parameters
+        ----------
+        seconds : :class:`float`
+            The duration of the phase in seconds.
+        """
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        self.recent.append(seconds)
+
+    def snapshot(self: "PhaseStats") -> dict[str, Any]:
+        """
+        Returns the cumulative and recent aggregates of the phase.
+
+        Returns
+        ----------
+        :class:`dict[str, Any]`
+            The ``count``, ``total``, ``mean``, ``min``, and ``max`` of every duration, plus a ``recent`` dictionary\
+            with the ``count``, ``mean``, ``p50``, ``p95``, and ``max`` of the recent window. Durations are in seconds.
+        """
+        recent = sorted(self.recent)
+        def _percentile(fraction: float) -> float:
+            return recent[min(int(fraction * len(recent)), len(recent) - 1)] if recent else 0.0
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+            "recent": {
+                "count": len(recent),
+                "mean": sum(recent) / len(recent) if recent else 0.0,
+                "p50": _percentile(0.5),
+                "p95": _percentile(0.95),
+                "max": recent[-1] if recent else 0.0
+            }
+        }
+
+    def __str__(self: "PhaseStats") -> str:
+        """
+        Returns the current :class:`PhaseStats` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`PhaseStats` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+class PhaseTimer():
+    """Measures a single phase with :func:`time.perf_counter()` and records it when the block exits."""
+    __slots__ = ("_stats", "_filepath", "_phase", "_photon", "_started")
+
+    def __init__(self: "PhaseTimer", stats: "LifecycleStats", filepath: str, phase: str, photon: Optional[str]) -> None:
+        """
+        Initializes a new :class:`PhaseTimer` instance.
+
+        Parameters
+        ----------
+        stats : :class:`LifecycleStats`
+            The statistics which receive the duration.
+        filepath : :class:`str`
+            The path of the photon file.
+        phase : :class:`str`
+            The name of the phase.
+        photon : Optional[:class:`str`]
+            The name of the photon, or ``None`` for phases which belong to the whole file.
+        """
+        self._stats: "LifecycleStats" = stats
+        self._filepath: str = filepath
+        self._phase: str = phase
+        self._photon: Optional[str] = photon
+        self._started: float = 0.0
+
+    def __enter__(self: "PhaseTimer") -> "PhaseTimer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self: "PhaseTimer", *exception: Any) -> None:
+        self._stats.record(self._filepath, self._phase, time.perf_counter() - self._started, self._photon)
+
+class LifecycleStats():
+    """Collects the duration of every lifecycle phase and the load, reload, and failure counts of every photon file."""
+    phases: tuple[str, ...] = ("scan", "checksum", "exec_module", "validation", "instantiation", "finalize", "cleanup")
+    events: tuple[str, ...] = ("loads", "reloads", "failures")
+    _untimed: contextlib.nullcontext = contextlib.nullcontext()
+
+    def __init__(self: "LifecycleStats", window: int = 128) -> None:
+        """
+        Initializes a new :class:`LifecycleStats` instance.
+
+        Parameters
+        ----------
+        window : Optional[:class:`int`]
+            The number of recent durations kept per phase for the recent aggregates. Defaults to ``128``.
+
+        Raises
+        ----------
+        ValueError
+            If ``window`` is less than one.
+
+        Notes
+        ----------
+        - ``scan``, ``checksum``, ``exec_module``, ``validation``, and ``cleanup`` belong to a photon file and are\
+        shared by every photon it defines, while ``instantiation`` and ``finalize`` are recorded per photon.
+        - Durations are recorded from the loader's worker threads as well, so every update holds a lock.
+        - ``validation`` includes resolving the checksum of the file when it wasn't prefetched.
+        """
+        if window < 1:
+            raise ValueError("The statistics window must be at least one!")
+        self._window: int = window
+        self._phases: dict[tuple[str, Optional[str]], dict[str, PhaseStats]] = {}
+        self._events: dict[str, dict[str, int]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def window(self: "LifecycleStats") -> int:
+        """
+        Returns the number of recent durations kept per phase.
+
+        Returns
+        ----------
+        :class:`int`
+            The size of the recent window.
+        """
+        return self._window
+
+    @staticmethod
+    def timer(stats: Optional["LifecycleStats"],
+              filepath: str,
+              phase: str,
+              photon: Optional[str] = None) -> PhaseTimer|contextlib.nullcontext:
+        """
+        Returns a context manager which measures a phase, or does nothing if no statistics are collected.
+
+        Parameters
+        ----------
+        stats : Optional[:class:`LifecycleStats`]
+            The statistics to record into, or ``None`` if collection is disabled.
+        filepath : :class:`str`
+            The path of the photon file.
+        phase : :class:`str`
+            The name of the phase.
+        photon : Optional[:class:`str`]
+            The name of the photon. Defaults to ``None``, which records the phase for the whole file.
+
+        Returns
+        ----------
+        :class:`PhaseTimer|contextlib.nullcontext`
+            A timer, or a shared no-op context manager when ``stats`` is ``None``.
+        """
+        if stats is None:
+            return LifecycleStats._untimed
+        return PhaseTimer(stats, filepath, phase, photon)
+
+    def record(self: "LifecycleStats", filepath: str, phase: str, seconds: float, photon: Optional[str] = None) -> None:
+        """
+        Records the duration of a phase.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        phase : :class:`str`
+            The name of the phase.
+        seconds : :class:`float`
+            The duration of the phase in seconds.
+        photon : Optional[:class:`str`]
+            The name of the photon. Defaults to ``None``, which records the phase for the whole file.
+        """
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            phases = self._phases.setdefault((filepath, photon), {})
+            if not phase in phases:
+                phases[phase] = PhaseStats(self._window)
+            phases[phase].record(seconds)
+
+    def count(self: "LifecycleStats", filepath: str, event: str, amount: int = 1) -> None:
+        """
+        Increments the counter of an event of a photon file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        event : :class:`str`
+            One of ``loads``, ``reloads``, or ``failures``.
+        amount : Optional[:class:`int`]
+            The amount to add. Defaults to ``1``.
+        """
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            events = self._events.setdefault(filepath, dict.fromkeys(self.events, 0))
+            events[event] += amount
+
+    def snapshot(self: "LifecycleStats", filepath: str, photon: Optional[str] = None) -> dict[str, Any]:
+        """
+        Returns the counters and phase aggregates of a photon file, or of a single photon.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the photon file.
+        photon : Optional[:class:`str`]
+            The name of a photon whose own phases are included. Defaults to ``None``, which only returns the\
+            phases of the file.
+
+        Returns
+        ----------
+        :class:`dict[str, Any]`
+            The ``loads``, ``reloads``, and ``failures`` counts, and a ``phases`` dictionary with the aggregates\
+            of every phase which was recorded at least once.
+        """
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            phases = dict(self._phases.get((filepath, None), {}))
+            if not photon is None:
+                phases.update(self._phases.get((filepath, photon), {}))
+            snapshot: dict[str, Any] = dict(self._events.get(filepath, dict.fromkeys(self.events, 0)))
+            snapshot["phases"] = {phase: phases[phase].snapshot() for phase in self.phases if phase in phases}
+        return snapshot
+
+    def filepaths(self: "LifecycleStats") -> list[str]:
+        """
+        Returns every photon file which has recorded statistics.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The paths of the files, in the order they were first recorded.
+        """
+        with self._lock:
+            keys = [filepath for filepath, _ in self._phases] + list(self._events)
+        return list(dict.fromkeys(keys))
+
+    def reset(self: "LifecycleStats") -> None:
+        """Forgets every recorded duration and counter."""
+        with self._lock:
+            self._phases.clear()
+            self._events.clear()
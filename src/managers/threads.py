@@ -10,32 +10,97 @@
 # ########################################################################
 from ..errors.threads import (
     NoThreadsFoundError, 
+    ThreadCancelledError,
     ThreadManagerAlreadyRunningError,
     ThreadLimitReachedError, 
+    ThreadQueueFullError,
+    ThreadPoolClosedError,
     ThreadsAlreadyRunningError
 )
 from ..tools.utils import TextUtils
-from typing import Any
+from concurrent.futures import Future
+from collections import deque
+from typing import Any, Callable, Optional
 import threading
 import _thread
+import ctypes
 import time
-import sys
 
-class TracedThread(threading.Thread): # pragma: no cover
+class CancellationToken():
+    """A flag which asks a thread to stop at its next convenient point, without tracing any of its code."""
+    def __init__(self: "CancellationToken") -> None:
+        """
+        Initializes a new :class:`CancellationToken` instance.
+        """
+        self._event: threading.Event = threading.Event()
+
+    @property
+    def is_cancelled(self: "CancellationToken") -> bool:
+        """
+        Returns a flag indicating if cancellation was requested.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the token was cancelled, ``False`` otherwise.
+        """
+        return self._event.is_set()
+
+    def cancel(self: "CancellationToken") -> None:
+        """
+        Requests cancellation. Threads notice it the next time they check the token.
+        """
+        self._event.set()
+
+    def raise_if_cancelled(self: "CancellationToken") -> None:
+        """
+        Ends the calling thread if cancellation was requested.
+
+        Raises
+        ----------
+        ThreadCancelledError
+            If the token was cancelled.
+        """
+        if self._event.is_set():
+            raise ThreadCancelledError("The thread has been cancelled!")
+
+    def wait(self: "CancellationToken", timeout: Optional[float] = None) -> bool:
+        """
+        Sleeps until cancellation is requested or the timeout passes, whichever comes first.
+
+        Parameters
+        ----------
+        timeout : Optional[:class:`float`]
+            The maximum number of seconds to wait. Defaults to ``None``, which waits until cancelled.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the token was cancelled, ``False`` if the timeout passed first.
+
+        Notes
+        ----------
+        - Loops which used to :func:`time.sleep()` between iterations should wait on the token instead, so a\
+        cancelled thread wakes up immediately.
+        """
+        return self._event.wait(timeout)
+
+class CancellableThread(threading.Thread):
     """
     Custom thread object that can be halted using the :func:`halt()` function.
 
-    This thread type extends the functionality of the standard :class:`threading.Thread` class to allow for the\
-    thread execution to be halted using the :func:`halt()` function. Once halted, the thread will immediately stop\
-    execution and expose any underlying pipes. This can be useful for debugging or other similar tasks.
-    
+    This thread type extends the functionality of the standard :class:`threading.Thread` class with a\
+    :class:`CancellationToken`. The thread's code checks the token cooperatively, and threads which don't\
+    are stopped by raising a :class:`ThreadCancelledError` inside of them as a last resort.
+
     Important
     ----------
-    This thread type is best utilized for small tasks that can be daemonized or terminated quickly.
+    Unlike tracing every line of the thread, checking a token costs nothing while the thread runs, so this thread\
+    type is suited for long-running and CPU-bound tasks as well.
     """
-    def __init__(self: "TracedThread", *args: tuple, **keywords: dict[str, Any]):
+    def __init__(self: "CancellableThread", *args: tuple, **keywords: dict[str, Any]):
         """
-        Initializes a new instance of the :class:`TracedThread` class with optional arguments forwarded to the
+        Initializes a new instance of the :class:`CancellableThread` class with optional arguments forwarded to the
         standard :class:`threading.Thread` class.
 
         Parameters
@@ -46,126 +111,355 @@ class TracedThread(threading.Thread): # pragma: no cover
             The keyword arguments of the initialized instance used in :class:`threading.Thread`.
         """
         threading.Thread.__init__(self, *args, **keywords)
-        self.halted: bool = False
+        self.token: CancellationToken = CancellationToken()
 
-    def __run(self: "TracedThread") -> None:
+    @property
+    def halted(self: "CancellableThread") -> bool:
         """
-        The control function for the :class:`TracedThread` that sets the global trace function and executes the thread's main function.
+        Returns a flag indicating if the thread was asked to halt.
 
-        Notes
+        Returns
         ----------
-        - This method is used to run the code in the thread, but with a global trace function set beforehand.
-        - The ``globaltrace`` attribute, set previously by the user, is set as the current trace function at runtime.
-        - The previous :func:`__run_backup()` method, i.e. the original hardcoded run method, is called here to execute the\
-        thread's main function.
-        - The second to last line overwrites the :func:`run()` method with the original method, effectively undoing any trace\
-        function set previously.
-        
+        :class:`bool`
+            ``True`` if the token of the thread was cancelled, ``False`` otherwise.
         """
-        sys.settrace(self.globaltrace)
-        self.__run_backup()
-        self.run = self.__run_backup
+        return self.token.is_cancelled
 
-    def start(self: "TracedThread") -> None:
+    def run(self: "CancellableThread") -> None:
         """
-        Starts the thread execution by invoking the :func:`Thread.start()` method, but not before setting the appropriate run method.
+        Runs the target of the thread, ending it quietly once it is cancelled.
 
         Notes
         ----------
-        - This method overrides the :func:`run()` method and replaces it with the :func:`__run()` method, which sets the global trace\
-        function and executes the thread's main function.
-        - The original run method is saved into the ``__run_backup`` attribute before it is swapped out.
-        - Finally, the :func:`threading.Thread.start()` method is called on the thread object itself to actually start the\
-        execution of the code.
+        - :class:`ThreadCancelledError` is only ignored by :mod:`threading` if it is exactly :class:`SystemExit`,\
+        so it is caught here instead of being reported as an unhandled error of the thread.
+        """
+        try: threading.Thread.run(self)
+        except ThreadCancelledError: pass # The thread was asked to stop.
 
+    @staticmethod
+    def current_token() -> Optional[CancellationToken]:
         """
-        self.__run_backup: object = self.run
-        self.run = self.__run     
-        threading.Thread.start(self)
+        Returns the cancellation token of the calling thread, so code running in it can check for cancellation\
+        without receiving the token as an argument.
 
-    def globaltrace(self: "TracedThread", frame: Any, event: Any, arg: Any) -> Any:
+        Returns
+        ----------
+        Optional[:class:`CancellationToken`]
+            The token of the current :class:`CancellableThread`, or ``None`` for any other thread.
         """
-        The global trace function for a ``TracedThread`` that replaces the default function.
+        return getattr(threading.current_thread(), "token", None)
+
+    def interrupt(self: "CancellableThread") -> bool:
+        """
+        Raises a :class:`ThreadCancelledError` inside of the thread, which stops it even if it never checks its token.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the error was scheduled, ``False`` if the thread isn't running.
+
+        Notes
+        ----------
+        - The error is delivered the next time the thread executes Python bytecode, so a thread which is blocked\
+        inside of a system call or C extension only stops once the call returns.
+        - ``finally`` blocks and context managers of the thread still run, but the thread cannot choose where it\
+        stops, so cooperative cancellation through :func:`halt()` should always be tried first.
+        """
+        if self.ident is None or not self.is_alive():
+            return False
+        scheduled = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self.ident),
+                                                               ctypes.py_object(ThreadCancelledError))
+        if scheduled > 1: # pragma: no cover
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self.ident), None)
+            return False
+        return scheduled == 1
+
+    def halt(self: "CancellableThread", timeout: Optional[float] = None) -> bool:
+        """
+        Asks the thread to stop by cancelling its token, and interrupts it if it doesn't stop in time.
 
         Parameters
         ----------
-        frame : :class:`Any`
-            The current thread frame.
-        event : :class:`Any` 
-            The event type (e.g. 'call', 'line', 'return', 'exception').
-        arg : :class:`Any` 
-            Event-specific arguments.
+        timeout : Optional[:class:`float`]
+            The number of seconds the thread may take to notice the cancellation before it is interrupted.\
+            Defaults to ``None``, which only cancels the token and returns immediately.
 
         Returns
         ----------
-        Optional[:class:`self.localtrace`]
-            If the event type is ``call``, ``self.localtrace`` is returned, otherwise :class:`None` is returned.
+        :class:`bool`
+            ``True`` if the thread stopped, or was only asked to stop, ``False`` if it is still running after\
+            it was interrupted and waited for once more.
 
         Notes
         ----------
-        - This method serves as the global trace function for the :class:`TracedThread` class.
-        - If the event type is ``call``, the trace function switches to ``self.localtrace`` which handles the local\
-        tracing inside the thread in a context-specific manner.
-        - If another event type is detected, :class:`None` is returned as there's no further action required.
+        - This function cancels the ``token`` of the :class:`CancellableThread` instance, after which its read-only\
+        ``halted`` property returns ``True``. Code running in the thread notices it through\
+        :func:`CancellationToken.raise_if_cancelled()` or :func:`CancellationToken.wait()`, and stops at a point of\
+        its own choosing.
+        - With a ``timeout``, a thread which is still alive afterward is stopped with :func:`interrupt()`.
+        """
+        self.token.cancel()
+        if timeout is None or not self.is_alive():
+            return True
+        self.join(timeout)
+        if self.is_alive() and self.interrupt():
+            self.join(timeout)
+        return not self.is_alive()
+
+TracedThread = CancellableThread # The previous name of the thread type, kept for compatibility.
+
+class WorkerPool():
+    """
+    A fixed set of persistent :class:`CancellableThread` workers which run submitted tasks from a bounded queue.
+
+    Important
+    ----------
+    Tasks are handed to threads which are already running, so short tasks submitted at a high rate don't pay\
+    for creating and starting a thread each time, and the queue applies backpressure instead of growing without bound.
+    """
+    policies: tuple[str, ...] = ("block", "fail", "drop")
+
+    def __init__(self: "WorkerPool", workers: int = 4, queue_size: int = 64, policy: str = "block") -> None:
+        """
+        Initializes a new :class:`WorkerPool` instance and starts its workers.
+
+        Parameters
+        ----------
+        workers : Optional[:class:`int`]
+            The number of worker threads. Defaults to ``4``.
+        queue_size : Optional[:class:`int`]
+            The maximum number of tasks waiting for a worker. Defaults to ``64``.
+        policy : Optional[:class:`str`]
+            What :func:`submit()` does when the queue is full. ``block`` waits for a free slot, ``fail`` raises a\
+            :class:`ThreadQueueFullError`, and ``drop`` discards the oldest waiting task. Defaults to ``block``.
+
+        Raises
+        ----------
+        ValueError
+            If ``workers`` or ``queue_size`` is less than one, or ``policy`` is unknown.
+
+        Notes
+        ----------
+        - The queue is a :class:`collections.deque`, so adding and taking a task costs the same regardless of its length.
+        - The futures of dropped tasks are cancelled, so callers waiting on them aren't left hanging.
+        """
+        if workers < 1:
+            raise ValueError("The number of workers must be at least one!")
+        if queue_size < 1:
+            raise ValueError("The queue size must be at least one!")
+        if not policy in self.policies:
+            raise ValueError(f"The queue policy must be one of {', '.join(self.policies)}!")
+        self._queue_size: int = queue_size
+        self._policy: str = policy
+        self._queue: deque[tuple[Future, Callable, tuple, dict[str, Any]]] = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(self._lock)
+        self._not_full: threading.Condition = threading.Condition(self._lock)
+        self._closed: bool = False
+        self._dropped: int = 0
+        self._workers: list[CancellableThread] = []
+        for index in range(workers):
+            worker = CancellableThread(target=self._work, name=f"WorkerPool-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    @property
+    def workers(self: "WorkerPool") -> int:
+        """
+        Returns the number of worker threads which are still running.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of live workers.
+        """
+        return sum(1 for worker in self._workers if worker.is_alive())
+
+    @property
+    def pending(self: "WorkerPool") -> int:
+        """
+        Returns the number of tasks waiting for a worker.
+
+        Returns
+        ----------
+        :class:`int`
+            The length of the queue.
+        """
+        return len(self._queue)
+
+    @property
+    def dropped(self: "WorkerPool") -> int:
+        """
+        Returns the number of tasks discarded by the ``drop`` policy.
 
+        Returns
+        ----------
+        :class:`int`
+            The number of dropped tasks.
         """
-        if event == 'call':
-            return self.localtrace
-        else:
-            return None
+        return self._dropped
 
-    def localtrace(self: "TracedThread", frame, event, arg) -> Any:
+    @property
+    def is_closed(self: "WorkerPool") -> bool:
         """
-        Trace function for the :class:`TracedThread` class.
+        Returns a flag indicating if the pool stopped accepting tasks.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` once the pool was shut down or halted, ``False`` otherwise.
+        """
+        return self._closed
+
+    def _work(self: "WorkerPool") -> None:
+        """
+        Takes tasks from the queue and runs them until the pool is closed and drained, or the worker is cancelled.
+        """
+        token: CancellationToken = CancellableThread.current_token()
+        while True:
+            with self._not_empty:
+                while not self._queue and not self._closed and not token.is_cancelled:
+                    self._not_empty.wait()
+                if token.is_cancelled or not self._queue:
+                    return
+                future, function, args, kwargs = self._queue.popleft()
+                self._not_full.notify()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try: result = function(*args, **kwargs)
+            except ThreadCancelledError as error:
+                future.set_exception(error)
+                raise # The worker itself was interrupted.
+            except BaseException as error:
+                future.set_exception(error)
+            else: future.set_result(result)
+
+    def submit(self: "WorkerPool",
+               function: Callable,
+               args: tuple = (),
+               kwargs: dict[str, Any] = {},
+               timeout: Optional[float] = None) -> Future:
+        """
+        Queues a task for the next free worker.
 
         Parameters
         ----------
-        frame : :class:`types.FrameType`
-            The current frame being executed in the thread.
-        event : :class:`str`
-            The event that occurred in the thread during tracing.
-        arg : :class:`Any` 
-            Optional argument associated with the event.
+        function : :class:`Callable`
+            The callable function to be executed.
+        args : Optional[:class:`tuple`]
+            A tuple of positional arguments to be passed into the function when executed. Defaults to ``()``.
+        kwargs : Optional[:class:`dict[str, Any]`]
+            A dictionary of keyword arguments to be passed into the function when executed. Defaults to ``{}``.
+        timeout : Optional[:class:`float`]
+            The maximum number of seconds the ``block`` policy waits for a free slot. Defaults to ``None``,\
+            which waits as long as it takes.
 
         Returns
         ----------
-        Optional[:class:`Callable`]: 
-            The next trace function to be called or :class:`None` to stop tracing.
+        :class:`concurrent.futures.Future`
+            A future which receives the result of the function, or the error it raised.
 
         Raises
         ----------
-        SystemExit: 
-            If the thread is halted and the event is line, the program is forcefully terminated.
+        ThreadQueueFullError
+            If the queue is full and the policy is ``fail``, or the ``block`` policy timed out.
+        ThreadPoolClosedError
+            If the pool was shut down or halted.
+        """
+        future: Future = Future()
+        with self._not_full:
+            if self._closed:
+                raise ThreadPoolClosedError("The worker pool has been shut down!")
+            if len(self._queue) >= self._queue_size:
+                if self._policy == "fail":
+                    raise ThreadQueueFullError(f"The queue of {self._queue_size} tasks is full!")
+                elif self._policy == "drop":
+                    self._queue.popleft()[0].cancel()
+                    self._dropped += 1
+                elif not self._not_full.wait_for(lambda: self._closed or len(self._queue) < self._queue_size, timeout):
+                    raise ThreadQueueFullError(f"The queue of {self._queue_size} tasks stayed full for {timeout} seconds!")
+                if self._closed:
+                    raise ThreadPoolClosedError("The worker pool has been shut down!")
+            self._queue.append((future, function, args, kwargs))
+            self._not_empty.notify()
+        return future
+
+    def _close(self: "WorkerPool", cancel_pending: bool) -> None:
+        """
+        Stops accepting tasks and wakes every waiting worker and submitter.
 
-        Notes
+        Parameters
         ----------
-        - This function can be registered as a trace function on a thread using :func:`sys.settrace()`.\
-        It is called every time an event is encountered in the traced thread and returns the next\
-        trace function to be called. If the thread is halted and the event is line, it raises a\
-        ``SystemExit`` exception to stop the thread execution.
+        cancel_pending : :class:`bool`
+            If ``True``, the futures of every queued task are cancelled instead of being run.
+        """
+        with self._lock:
+            self._closed = True
+            if cancel_pending:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
 
+    def shutdown(self: "WorkerPool", wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stops accepting tasks and lets the workers finish the queue before they exit.
+
+        Parameters
+        ----------
+        wait : Optional[:class:`bool`]
+            If ``True``, returns once every worker exited. Defaults to ``True``.
+        cancel_pending : Optional[:class:`bool`]
+            If ``True``, queued tasks are cancelled, so only the running tasks finish. Defaults to ``False``.
         """
-        if self.halted:
-            if event == 'line':
-                raise SystemExit()
-        return self.localtrace
+        self._close(cancel_pending)
+        if wait:
+            for worker in self._workers:
+                worker.join()
 
-    def halt(self: "TracedThread") -> None:
+    def halt(self: "WorkerPool", grace: float = 1.0) -> None:
         """
-        Halt function for the :class:`TracedThread` class.
+        Cancels every queued task and halts every worker, interrupting the ones which don't stop in time.
+
+        Parameters
+        ----------
+        grace : Optional[:class:`float`]
+            The number of seconds a running task may take to notice its cancelled token before a\
+            :class:`ThreadCancelledError` is raised inside of it. Defaults to ``1.0``.
 
         Notes
         ----------
-        - This function sets the ``halted`` attribute of the :class:`TracedThread` instance to ``True``, indicating that\
-        the thread should be paused for debugging or other purposes. Once halted, the thread will stop\
-        executing at the next available opportunity in its trace function.
-        - This function is intended to be used in combination with the :func:`localtrace()` and :func:`globaltrace()` methods\
-        from the ``sys`` module, where the former is registered as a trace function for a thread to halt the\
-        thread at a specific point, and the latter is used to globally manipulate the trace function of\
-        all threads in the running Python process.
+        - Tasks find the token of their worker through :func:`CancellableThread.current_token()`.
+        - The future of an interrupted task receives the :class:`ThreadCancelledError`.
+        """
+        for worker in self._workers: # Every worker is asked first, so they all stop at once.
+            worker.token.cancel()
+        self._close(cancel_pending=True)
+        for worker in self._workers:
+            worker.halt(grace)
+
+    def __enter__(self: "WorkerPool") -> "WorkerPool":
+        """
+        Returns the pool, so it can be used as a context manager.
+
+        Returns
+        ----------
+        :class:`WorkerPool`
+            The current :class:`WorkerPool` instance.
+        """
+        return self
 
+    def __exit__(self: "WorkerPool", *exception: Any) -> None:
         """
-        self.halted = True
+        Shuts the pool down once the ``with`` block exits, waiting for the queued tasks to finish.
+
+        Parameters
+        ----------
+        *exception : :class:`Any`
+            The type, value, and traceback of the error which ended the block, if any.
+        """
+        self.shutdown()
 
 class ThreadManager: # pragma: no cover
     """
@@ -185,6 +479,7 @@ class ThreadManager: # pragma: no cover
         self._flag_request: bool = False
         self._currently_watching: bool = False
         self._currently_running: bool = False
+        self._pool: Optional[WorkerPool] = None
         self.thread_limit: int = 10
 
     def _generate_uid(self: "ThreadManager", delimiter: str = "-") -> str:
@@ -247,19 +542,29 @@ class ThreadManager: # pragma: no cover
                 if not thread.is_alive():
                     del self._running_threads[f"{thread_cid}"]
 
-    def _stop_threads(self: "ThreadManager") -> None:
+    def _stop_threads(self: "ThreadManager", grace: float = 1.0) -> list[str]:
         """
         Stops all running threads in the :class:`ThreadManager` instance.
 
-        This function iterates over the list of running threads in the :class:`ThreadManager` instance and stops each\
-        thread using the :func:`halt()` function of the :class:`TracedThread` class. It then waits for each stopped thread to\
-        complete using the :func:`join()` function before cleaning up the list of running threads.
+        This function cancels the token of every running thread at once, so all of them wind down in parallel, and then\
+        halts each thread using the :func:`halt()` function of the :class:`CancellableThread` class, which waits for the thread\
+        and interrupts it if it ignores its token.
+
+        Parameters
+        ----------
+        grace : Optional[:class:`float`]
+            The number of seconds every thread may take to stop on its own before it is interrupted. Defaults to ``1.0``.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The identifiers of the threads which are still running after they were interrupted.
 
         Important
         ----------
-        Invoking the :func:`halt()` function on a :class:`TracedThread` instance may cause the thread to stop executing\
-        immediately, so it should be used with caution. Additionally, any necessary cleanup or stopping of threads\
-        should be handled by other methods or functions within the :class:`ThreadManager` class.
+        Interrupting a :class:`CancellableThread` instance stops it wherever it currently is, so it should be used with\
+        caution. Additionally, any necessary cleanup or stopping of threads should be handled by other methods or\
+        functions within the :class:`ThreadManager` class.
 
         Notes
         ----------
@@ -269,17 +574,23 @@ class ThreadManager: # pragma: no cover
         - The function works by creating a shallow copy of the running threads dictionary to ensure that the\
         original dictionary is not modified during iteration, which can cause unexpected behavior. For each\
         running thread, the function checks if it is still alive, and if so, halts the thread using the :func:`halt()`\
-        function of the :class:`TracedThread` class. It then waits for the thread to complete halting using the\
-        :func:`join()` function before cleaning up the list of running threads.
+        function of the :class:`CancellableThread` class, which waits for the thread to complete halting.
+        - A thread which survives the interrupt, e.g. because it is blocked inside of a C call, is never waited for\
+        again. It stays in the ``_running_threads`` collection while every stopped thread is removed.
 
         """
+        stuck: list[str] = []
         if len(self._running_threads) > 0:
             shallow_running = self._running_threads.copy()
+            for thread in shallow_running.values(): # Every thread is asked first, so they all stop at once.
+                thread.token.cancel()
             for thread_cid, thread in shallow_running.items():
                 if thread.is_alive():
-                    trace: TracedThread = thread
-                    trace.halt()
-                    trace.join()
+                    cancellable: CancellableThread = thread
+                    if not cancellable.halt(grace):
+                        stuck.append(thread_cid)
+            self._clean_threads()
+        return stuck
 
     def _start_threads(self: "ThreadManager", watching_threads: bool = False) -> None:
         """
@@ -318,7 +629,7 @@ class ThreadManager: # pragma: no cover
                 raise ThreadLimitReachedError(f"{message}")
             if self._running_threads.get(thread_cid, None) is None:
                 (function, args, kwargs) = thread
-                task = TracedThread(group=None, target=function, args=args, kwargs=kwargs)
+                task = CancellableThread(group=None, target=function, args=args, kwargs=kwargs)
                 task.start()
                 self._running_threads[f"{thread_cid}"] = task
                 self._requested_threads.remove((thread_cid, thread))
@@ -361,6 +672,75 @@ class ThreadManager: # pragma: no cover
         except: 
             return False
         
+    def start_pool(self: "ThreadManager",
+                   workers: Optional[int] = None,
+                   queue_size: int = 64,
+                   policy: str = "block") -> WorkerPool:
+        """
+        Starts a :class:`WorkerPool` which runs the tasks passed to :func:`submit()` on persistent threads.
+
+        Parameters
+        ----------
+        workers : Optional[:class:`int`]
+            The number of worker threads. Defaults to ``None``, which uses the ``thread_limit`` of the manager.
+        queue_size : Optional[:class:`int`]
+            The maximum number of tasks waiting for a worker. Defaults to ``64``.
+        policy : Optional[:class:`str`]
+            What happens when the queue is full, either ``block``, ``fail``, or ``drop``. Defaults to ``block``.
+
+        Returns
+        ----------
+        :class:`WorkerPool`
+            The started pool.
+
+        Raises
+        ----------
+        ThreadManagerAlreadyRunningError
+            Raised when a pool of the manager is already running.
+
+        Notes
+        ----------
+        - Unlike :func:`append_thread()`, which starts a new thread for every function, the pool reuses its workers\
+        and queues tasks while all of them are busy instead of raising a :class:`ThreadLimitReachedError`.
+        """
+        if not self._pool is None and not self._pool.is_closed:
+            raise ThreadManagerAlreadyRunningError("The thread manager is already running a worker pool.")
+        self._pool = WorkerPool(workers or self.thread_limit, queue_size, policy)
+        return self._pool
+
+    def submit(self: "ThreadManager",
+               function: Callable,
+               args: tuple = (),
+               kwargs: dict[str, Any] = {},
+               timeout: Optional[float] = None) -> Future:
+        """
+        Queues a function for the worker pool of the :class:`ThreadManager` object, starting a default pool if needed.
+
+        Parameters
+        ----------
+        function : :class:`Callable`
+            The callable function to be executed.
+        args : Optional[:class:`tuple`]
+            A tuple of positional arguments to be passed into the function when executed. Defaults to ``()``.
+        kwargs : Optional[:class:`dict[str, Any]`]
+            A dictionary of keyword arguments to be passed into the function when executed. Defaults to ``{}``.
+        timeout : Optional[:class:`float`]
+            The maximum number of seconds to wait for a free slot with the ``block`` policy. Defaults to ``None``.
+
+        Returns
+        ----------
+        :class:`concurrent.futures.Future`
+            A future which receives the result of the function, or the error it raised.
+
+        Raises
+        ----------
+        ThreadQueueFullError
+            Raised when the queue is full and the pool's policy is ``fail``, or waiting for a free slot timed out.
+        """
+        if self._pool is None or self._pool.is_closed:
+            self.start_pool()
+        return self._pool.submit(function, args, kwargs, timeout)
+
     def stop(self: "ThreadManager") -> None:
         """
         Sets the `_flag_request` attribute to ``True``, a signal that stops all running threads in the :class:`ThreadManager` object.
@@ -371,21 +751,42 @@ class ThreadManager: # pragma: no cover
         :class:`ThreadManager` object. When ``_flag_request`` is set to ``True``, all running threads are stopped. This method sets the\
         value of this attribute to ``True`` and does not return any value. Once this is done, the :func:`stop_listening()` method\
         is called by the :class:`ThreadManager` object so that all the threads that are currently running can terminate.
+        - A running worker pool stops accepting tasks, and its workers exit once the queue is empty.
         """
         self._flag_request = True
+        if not self._pool is None:
+            self._pool.shutdown(wait=False)
 
-    def halt(self: "ThreadManager") -> None:
+    def halt(self: "ThreadManager", grace: float = 1.0) -> bool:
         """
         Halts all running threads in the :class:`ThreadManager` object.
 
+        Parameters
+        ----------
+        grace : Optional[:class:`float`]
+            The number of seconds every thread may take to notice its cancelled token before a\
+            :class:`ThreadCancelledError` is raised inside of it. Defaults to ``1.0``.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if every thread stopped, ``False`` if any of them is still running after it was interrupted.
+
         Notes
         ----------
         This method is used to stop (halt) all running threads in the :class:`ThreadManager` object instance. The method achieves this\
         by calling the :func:`_stop_threads()` method of the :class:`ThreadManager` object which terminates all running threads. After this\
         method is called, the ``_running_threads`` collection of the :class:`ThreadManager` is set to an empty dictionary. The method does\
         not return anything.
-        """
-        self._stop_threads()
+        - Threads find their token through :func:`CancellableThread.current_token()`.
+        - A running worker pool is halted as well, cancelling every task in its queue.
+        - The method never waits longer than the grace period twice per thread, so a thread which can't be\
+        interrupted is left running in the ``_running_threads`` collection instead of blocking the caller.
+        """
+        stuck = self._stop_threads(grace)
+        if not self._pool is None:
+            self._pool.halt(grace)
+        return len(stuck) == 0
 
     def run(self: "ThreadManager") -> None:
         """
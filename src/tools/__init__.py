@@ -5,6 +5,13 @@
 # Version: 1.0.0
 # Date: 07/26/23
 # #########################################################################
+from ..tools.checksums import (
+    Fingerprints
+)
+from ..tools.inotify import (
+    Inotify,
+    InotifyEvent
+)
 from ..tools.colors import (
     Colors
 )
@@ -15,14 +22,23 @@ from ..tools.sentinel import (
     Sentinel
 )
 from ..tools.utils import (
+    CRC32,
+    ChecksumEngine,
+    DigestUtils,
     SystemUtils, 
     TextUtils
 )
 
 __all__ = (
+    Fingerprints,
+    Inotify,
+    InotifyEvent,
     Colors,
     Logger,
     Sentinel,
+    CRC32,
+    ChecksumEngine,
+    DigestUtils,
     SystemUtils,
     TextUtils
 )
\ No newline at end of file
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# ########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module provides checksum utilities which avoid hashing files again
+# when their contents cannot have changed.
+# #########################################################################
+from ..tools.utils import ChecksumEngine, DigestUtils, SystemUtils
+from collections import OrderedDict
+from typing import Iterable, Optional
+import threading
+import os
+
+class Fingerprints():
+    """A bounded cache of file checksums which are only recalculated when the stat signature of a file changes."""
+    def __init__(self: "Fingerprints", limit: int = 4096, algorithm: str = "sha512") -> None:
+        """
+        Initializes a new :class:`Fingerprints` instance.
+
+        Parameters
+        ----------
+        limit : Optional[:class:`int`]
+            The maximum number of files to remember. The least recently used file is forgotten first. Defaults to ``4096``.
+        algorithm : Optional[:class:`str`]
+            The algorithm used to hash files on a cache miss. Defaults to ``sha512``.
+
+        Raises
+        ----------
+        ValueError
+            If ``limit`` is less than one or the algorithm is not supported.
+
+        Notes
+        ----------
+        - A file's stat signature consists of its ``st_dev``, ``st_ino``, ``st_mtime_ns``, ``st_size``, and ``st_ctime_ns``.\
+        Any write, truncation, replacement, or rename over the file changes at least one of them, so an unchanged\
+        signature means the cached checksum can be returned without reading the file.
+        - The cache is safe to share between threads, e.g. the loader and its watcher thread.
+        """
+        if limit < 1:
+            raise ValueError("The fingerprint limit must be at least one!")
+        if not DigestUtils.is_supported(algorithm):
+            raise ValueError(f"The checksum algorithm '{algorithm}' is not supported!")
+        self._algorithm: str = algorithm
+        self._limit: int = limit
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], str]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self: "Fingerprints") -> int:
+        """
+        Returns the number of files currently remembered.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cached fingerprints.
+        """
+        return len(self._entries)
+
+    def __contains__(self: "Fingerprints", filepath: str) -> bool:
+        """
+        Returns a flag indicating if a fingerprint is cached for the provided file.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the file.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if a fingerprint is cached, ``False`` otherwise.
+        """
+        return os.path.abspath(filepath) in self._entries
+
+    @property
+    def limit(self: "Fingerprints") -> int:
+        """
+        Returns the maximum number of files remembered by the cache.
+
+        Returns
+        ----------
+        :class:`int`
+            The maximum number of cached fingerprints.
+        """
+        return self._limit
+
+    @property
+    def algorithm(self: "Fingerprints") -> str:
+        """
+        Returns the name of the algorithm used to hash files on a cache miss.
+
+        Returns
+        ----------
+        :class:`str`
+            The checksum algorithm.
+        """
+        return self._algorithm
+
+    @property
+    def hits(self: "Fingerprints") -> int:
+        """
+        Returns the number of checksums which were served without hashing the file.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cache hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self: "Fingerprints") -> int:
+        """
+        Returns the number of checksums which had to be calculated by hashing the file.
+
+        Returns
+        ----------
+        :class:`int`
+            The number of cache misses.
+        """
+        return self._misses
+
+    @staticmethod
+    def get_signature(stat: os.stat_result) -> tuple[int, int, int, int, int]:
+        """
+        Returns the stat signature which decides if a cached checksum is still valid.
+
+        Parameters
+        ----------
+        stat : :class:`os.stat_result`
+            The stat result of a file.
+
+        Returns
+        ----------
+        :class:`tuple[int, int, int, int, int]`
+            The ``st_dev``, ``st_ino``, ``st_mtime_ns``, ``st_size``, and ``st_ctime_ns`` of the file.
+        """
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size, stat.st_ctime_ns)
+
+    def lookup(self: "Fingerprints",
+               filepath: str,
+               stat: Optional[os.stat_result] = None,
+               count: bool = False) -> Optional[str]:
+        """
+        Returns the cached checksum of a file if its stat signature hasn't changed, without ever hashing it.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the file.
+        stat : Optional[:class:`os.stat_result`]
+            An already known stat result for the file. Defaults to ``None``.
+        count : Optional[:class:`bool`]
+            If ``True``, the lookup is counted as a hit or a miss. Defaults to ``False``.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The cached checksum, or ``None`` if it is missing or stale.
+        """
+        filepath = os.path.abspath(filepath)
+        try: stat = stat or os.stat(filepath)
+        except OSError: return None
+        with self._lock:
+            entry = self._entries.get(filepath, None)
+            if entry is None or entry[0] != self.get_signature(stat):
+                if count: self._misses += 1
+                return None
+            if count: self._hits += 1
+            self._entries.move_to_end(filepath)
+            return entry[1]
+
+    def store(self: "Fingerprints", filepath: str, checksum: str, stat: Optional[os.stat_result] = None) -> None:
+        """
+        Remembers the checksum of a file for its current stat signature.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the file.
+        checksum : :class:`str`
+            The checksum of the file contents.
+        stat : Optional[:class:`os.stat_result`]
+            The stat result taken *before* the file was hashed. Defaults to ``None``, which stats the file now.
+
+        Notes
+        ----------
+        - Passing the stat result from before hashing guarantees that a write which happens while the file\
+        is being hashed is always detected on the next lookup.
+        """
+        filepath = os.path.abspath(filepath)
+        try: stat = stat or os.stat(filepath)
+        except OSError: return
+        with self._lock:
+            self._entries[filepath] = (self.get_signature(stat), checksum)
+            self._entries.move_to_end(filepath)
+            while len(self._entries) > self._limit:
+                self._entries.popitem(last=False)
+
+    def get_checksum(self: "Fingerprints", filepath: str, block: int = 2**20) -> Optional[str]:
+        """
+        Returns the checksum of a file, only hashing it when its stat signature changed since the last call.
+
+        Parameters
+        ----------
+        filepath : :class:`str`
+            The path of the file.
+        block : Optional[:class:`int`]
+            Chunk size to read and hash the file in bytes. Default is ``2^20``.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The checksum of the file, or ``None`` if the file doesn't exist or cannot be read.
+        """
+        try: stat = os.stat(filepath)
+        except OSError:
+            self.invalidate(filepath)
+            return None
+        checksum = self.lookup(filepath, stat, count=True)
+        if not checksum is None:
+            return checksum
+        checksum = SystemUtils.get_file_checksum(filepath, block, self._algorithm)
+        if not checksum is None:
+            self.store(filepath, checksum, stat)
+        return checksum
+
+    def get_checksums(self: "Fingerprints",
+                      filepaths: Iterable[str],
+                      block: int = 2**20,
+                      workers: Optional[int] = None) -> dict[str, Optional[str]]:
+        """
+        Returns the checksums of many files, hashing every file whose stat signature changed in parallel.
+
+        Parameters
+        ----------
+        filepaths : :class:`Iterable[str]`
+            The paths of the files.
+        block : Optional[:class:`int`]
+            Chunk size to read and hash the files in bytes. Default is ``2^20``.
+        workers : Optional[:class:`int`]
+            The maximum number of files hashed at once. Defaults to ``None``, which uses\
+            :attr:`ChecksumEngine.workers`.
+
+        Returns
+        ----------
+        :class:`dict[str, Optional[str]]`
+            The checksum of every file, or ``None`` if it doesn't exist or cannot be read, in the order the\
+            files were provided.
+
+        Raises
+        ----------
+        ValueError
+            If ``workers`` is less than one.
+        """
+        if not workers is None and workers < 1:
+            raise ValueError("The number of checksum workers must be at least one!")
+        results: dict[str, Optional[str]] = {}
+        stats: dict[str, os.stat_result] = {}
+        for filepath in filepaths:
+            if filepath in results or filepath in stats:
+                continue
+            try: stat = os.stat(filepath)
+            except OSError:
+                self.invalidate(filepath)
+                results[filepath] = None
+                continue
+            checksum = self.lookup(filepath, stat, count=True)
+            if checksum is None:
+                stats[filepath] = stat
+            results[filepath] = checksum
+        if stats:
+            for filepath, checksum in ChecksumEngine.iterate_checksums(stats, self._algorithm, block, workers):
+                results[filepath] = checksum
+                if not checksum is None:
+                    self.store(filepath, checksum, stats[filepath])
+        return results
+
+    def invalidate(self: "Fingerprints", filepath: Optional[str] = None) -> bool:
+        """
+        Forgets the fingerprint of a file, or of every file.
+
+        Parameters
+        ----------
+        filepath : Optional[:class:`str`]
+            The path of the file to forget. Defaults to ``None``, which clears the whole cache.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if anything was forgotten, ``False`` otherwise.
+        """
+        with self._lock:
+            if filepath is None:
+                cleared = len(self._entries) > 0
+                self._entries.clear()
+                return cleared
+            return not self._entries.pop(os.path.abspath(filepath), None) is None
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# #########################################################################
+# Program: Luminal
+# Author: Jason Drawdy
+# Version: 1.0.0
+# Date: 10/17/26
+# #########################################################################
+# Description:
+# This module wraps the Linux inotify API with ctypes so that photon trees
+# can be watched through file system events instead of polling.
+# #########################################################################
+from typing import Optional
+import ctypes.util
+import ctypes
+import asyncio
+import struct
+import errno
+import sys
+import os
+
+class InotifyEvent():
+    """Describes a single file system event reported by :class:`Inotify`."""
+    def __init__(self: "InotifyEvent", path: str, mask: int, cookie: int) -> None:
+        """
+        Initializes a new :class:`InotifyEvent` instance.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the file or directory the event is about.
+        mask : :class:`int`
+            The inotify mask describing what happened.
+        cookie : :class:`int`
+            A cookie which connects the two halves of a rename, or ``0``.
+        """
+        self.path: str = path
+        self.mask: int = mask
+        self.cookie: int = cookie
+
+    @property
+    def is_dir(self: "InotifyEvent") -> bool:
+        """
+        Returns a flag indicating if the event is about a directory.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the subject of the event is a directory, ``False`` otherwise.
+        """
+        return bool(self.mask & Inotify.IN_ISDIR)
+
+    @property
+    def is_overflow(self: "InotifyEvent") -> bool:
+        """
+        Returns a flag indicating if the kernel dropped events because its queue was full.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if events were lost, ``False`` otherwise.
+        """
+        return bool(self.mask & Inotify.IN_Q_OVERFLOW)
+
+    def __str__(self: "InotifyEvent") -> str:
+        """
+        Returns the current :class:`InotifyEvent` instance as its string representation.
+
+        Returns
+        ----------
+        :class:`str`
+            A string representation of the :class:`InotifyEvent` object created by the
+            :func:`__dict__()` dunder method.
+        """
+        return str(self.__dict__)
+
+class Inotify():
+    """A dependency free :mod:`ctypes` wrapper around the Linux inotify API which watches whole directory trees."""
+    IN_MODIFY: int = 0x00000002
+    IN_ATTRIB: int = 0x00000004
+    IN_CLOSE_WRITE: int = 0x00000008
+    IN_MOVED_FROM: int = 0x00000040
+    IN_MOVED_TO: int = 0x00000080
+    IN_CREATE: int = 0x00000100
+    IN_DELETE: int = 0x00000200
+    IN_DELETE_SELF: int = 0x00000400
+    IN_MOVE_SELF: int = 0x00000800
+    IN_Q_OVERFLOW: int = 0x00004000
+    IN_IGNORED: int = 0x00008000
+    IN_ONLYDIR: int = 0x01000000
+    IN_ISDIR: int = 0x40000000
+    IN_NONBLOCK: int = os.O_NONBLOCK
+    IN_CLOEXEC: int = 0x00080000
+    watch_mask: int = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | \
+                      IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    ignored_directories: tuple[str, ...] = ("__pycache__",)
+    _header: struct.Struct = struct.Struct("iIII")
+    _libc: Optional[ctypes.CDLL] = None
+
+    def __init__(self: "Inotify") -> None:
+        """
+        Initializes a new :class:`Inotify` instance with its own non-blocking inotify descriptor.
+
+        Raises
+        ----------
+        OSError
+            If inotify is not supported on the current platform or the descriptor cannot be created.
+
+        Notes
+        ----------
+        - Every watched directory uses one of the ``fs.inotify.max_user_watches`` allowed by the kernel. Adding\
+        a watch beyond that limit raises :class:`OSError`, so callers should fall back to polling.
+        """
+        libc = self._get_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not supported on this platform!")
+        descriptor = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if descriptor < 0: # pragma: no cover
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        self._descriptor: int = descriptor
+        self._watches: dict[int, str] = {}
+        self._paths: dict[str, int] = {}
+
+    @classmethod
+    def _get_libc(cls: type["Inotify"]) -> Optional[ctypes.CDLL]:
+        """
+        Loads the C library exposing the inotify functions, once per process.
+
+        Returns
+        ----------
+        Optional[:class:`ctypes.CDLL`]
+            The C library, or ``None`` if inotify is not available.
+        """
+        if cls._libc is None and sys.platform.startswith("linux"):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+                cls._libc = libc
+            except (OSError, AttributeError): # pragma: no cover
+                return None
+        return cls._libc
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Returns a flag indicating if inotify can be used on the current platform.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if inotify is available, ``False`` otherwise.
+        """
+        return not Inotify._get_libc() is None
+
+    @property
+    def watches(self: "Inotify") -> list[str]:
+        """
+        Returns every directory which is currently watched.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The paths of the watched directories.
+        """
+        return list(self._paths)
+
+    def fileno(self: "Inotify") -> int:
+        """
+        Returns the inotify descriptor, e.g. for :func:`asyncio.AbstractEventLoop.add_reader()`.
+
+        Returns
+        ----------
+        :class:`int`
+            The file descriptor of the inotify instance.
+        """
+        return self._descriptor
+
+    def close(self: "Inotify") -> None:
+        """
+        Closes the inotify descriptor, which removes every watch at once.
+        """
+        if self._descriptor >= 0:
+            os.close(self._descriptor)
+            self._descriptor = -1
+        self._watches.clear()
+        self._paths.clear()
+
+    def add_watch(self: "Inotify", path: str) -> int:
+        """
+        Watches a single directory for changes to its entries.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the directory.
+
+        Returns
+        ----------
+        :class:`int`
+            The watch descriptor of the directory.
+
+        Raises
+        ----------
+        OSError
+            If the directory cannot be watched, e.g. because the watch limit was reached.
+        """
+        descriptor = self._libc.inotify_add_watch(self._descriptor, os.fsencode(path),
+                                                  self.watch_mask | self.IN_ONLYDIR)
+        if descriptor < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), path)
+        self._watches[descriptor] = path
+        self._paths[path] = descriptor
+        return descriptor
+
+    def watch_tree(self: "Inotify", root: str) -> list[str]:
+        """
+        Watches a directory and all of its subdirectories.
+
+        Parameters
+        ----------
+        root : :class:`str`
+            The path of the top directory.
+
+        Returns
+        ----------
+        :class:`list[str]`
+            The paths of all directories that are now watched.
+
+        Raises
+        ----------
+        OSError
+            If a directory cannot be watched, e.g. because the watch limit was reached.
+
+        Notes
+        ----------
+        - Hidden directories and ``__pycache__`` directories are never watched.
+        - Directories which disappear while the tree is being walked are skipped.
+        """
+        watched: list[str] = []
+        pending: list[str] = [root]
+        while pending:
+            directory = pending.pop()
+            try:
+                self.add_watch(directory)
+                with os.scandir(directory) as scanner:
+                    for entry in scanner:
+                        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".") \
+                            and not entry.name in self.ignored_directories:
+                            pending.append(entry.path)
+            except FileNotFoundError: # pragma: no cover
+                continue
+            except NotADirectoryError: # pragma: no cover
+                continue
+            watched.append(directory)
+        return watched
+
+    def read_events(self: "Inotify") -> list[InotifyEvent]:
+        """
+        Reads every event which is currently queued without blocking.
+
+        Returns
+        ----------
+        :class:`list[InotifyEvent]`
+            The queued events in the order they happened.
+
+        Notes
+        ----------
+        - Directories which are created or moved into a watched directory are watched automatically.
+        - Watches of deleted directories are forgotten once the kernel reports them as ignored.
+        """
+        events: list[InotifyEvent] = []
+        while True:
+            try: data = os.read(self._descriptor, 64 * 1024)
+            except BlockingIOError: break
+            offset = 0
+            while offset + self._header.size <= len(data):
+                descriptor, mask, cookie, length = self._header.unpack_from(data, offset)
+                offset += self._header.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                directory = self._watches.get(descriptor, None)
+                if mask & self.IN_IGNORED:
+                    self._paths.pop(self._watches.pop(descriptor, None), None)
+                    continue
+                if mask & self.IN_Q_OVERFLOW:
+                    events.append(InotifyEvent("", mask, cookie))
+                    continue
+                if directory is None: # pragma: no cover
+                    continue
+                path = os.path.join(directory, name) if name else directory
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    try: self.watch_tree(path)
+                    except OSError: # pragma: no cover
+                        events.append(InotifyEvent("", self.IN_Q_OVERFLOW, 0)) # Fall back to a full scan.
+                events.append(InotifyEvent(path, mask, cookie))
+        return events
+
+    async def wait(self: "Inotify", timeout: Optional[float] = None) -> list[InotifyEvent]:
+        """``|coro|``
+
+        Waits until events are queued, or the timeout elapses, without blocking the event loop.
+
+        Parameters
+        ----------
+        timeout : Optional[:class:`float`]
+            The maximum number of seconds to wait. Defaults to ``None``, which waits indefinitely.
+
+        Returns
+        ----------
+        :class:`list[InotifyEvent]`
+            The queued events, which is empty if the timeout elapsed first.
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        def _set_ready() -> None:
+            if not ready.done(): ready.set_result(True)
+        loop.add_reader(self._descriptor, _set_ready)
+        try:
+            await asyncio.wait([ready], timeout=timeout)
+        finally:
+            loop.remove_reader(self._descriptor)
+            ready.cancel()
+        return self.read_events()
+
+    @staticmethod
+    def get_changed_paths(events: list[InotifyEvent]) -> Optional[list[str]]:
+        """
+        Collapses a batch of events into the distinct paths they are about.
+
+        Parameters
+        ----------
+        events : :class:`list[InotifyEvent]`
+            The events to collapse.
+
+        Returns
+        ----------
+        Optional[:class:`list[str]`]
+            The changed paths in the order they were first reported, or ``None`` if events were lost\
+            and the whole tree has to be scanned again.
+        """
+        paths: dict[str, None] = {}
+        for event in events:
+            if event.is_overflow:
+                return None
+            paths[event.path] = None
+        return list(paths)
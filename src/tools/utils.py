@@ -9,12 +9,17 @@
 # This module encapsulates functions that are used globally throughout
 # the library, sentinel instances, or other project modules.
 # #########################################################################
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional
+import threading
 import asyncio
 import hashlib
+import mmap
 import secrets
 import random
 import string
 import base64
+import zlib
 import sys
 import os
 
@@ -148,9 +153,9 @@ class SystemUtils:
         except: raise Exception(f"The file '{filepath}' could not be written.") # pragma: no cover
 
     @staticmethod
-    def get_file_checksum(filename: str, block: int = 2**20) -> str:
+    def get_file_checksum(filename: str, block: int = 2**20, algorithm: str = "sha512") -> str:
         """
-        Generates a calculated ``SHA512`` hash for a given file.
+        Generates a calculated ``SHA512`` hash, or another supported digest, for a given file.
 
         Parameters
         ----------
@@ -158,29 +163,29 @@ class SystemUtils:
             The name of the file to generate the checksum for.
         block : Optional[:class:`int`]
             Chunk size to read and hash the file in bytes. Default is ``2^20``.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
 
         Returns
         ----------
         :class:`str`
-            The calculated ``SHA512`` hash of the file, or ``None`` if there was an error generating the checksum.
+            The calculated hash of the file, or ``None`` if there was an error generating the checksum.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is not supported.
 
         Notes
         ----------
-        - This function generates a ``SHA512`` hash for a given file by reading the file in blocks and hashing each block.\
-        The generated hash is a digest checksum (a unique fixed-sized representation of the file content).\
-        The file is treated as a binary file (read in ``rb`` mode) for proper handling of all types of files.
+        - This function generates a ``SHA512`` hash for a given file through the :class:`ChecksumEngine`, which\
+        reads it into a reused buffer. The generated hash is a digest checksum\
+        (a unique fixed-sized representation of the file content).
         
         - The reason ``SHA512`` was chosen is purely for the lack of collisions at runtime when performing dynamic checks.
         """
         try:
-            sha512 = hashlib.sha512()
-            with open(filename, 'rb') as file:
-                while True:
-                    data = file.read(block)
-                    if not data:
-                        break
-                    sha512.update(data)
-                return sha512.hexdigest()
+            return ChecksumEngine.hash_file(filename, algorithm, block)
         except IOError: # pragma: no cover
             print("File \'" + filename + "\' not found!")
             return None
@@ -220,6 +225,368 @@ class SystemUtils:
         """
         await asyncio.sleep(delay)
 
+class CRC32:
+    """A :mod:`hashlib` compatible wrapper around :func:`zlib.crc32` for cheap, non-cryptographic change detection."""
+    name: str = "crc32"
+    digest_size: int = 4
+    block_size: int = 1
+
+    def __init__(self: "CRC32", data: bytes = b"", value: int = 0) -> None:
+        """
+        Initializes a new :class:`CRC32` instance.
+
+        Parameters
+        ----------
+        data : Optional[:class:`bytes`]
+            Initial data to hash. Defaults to ``b""``.
+        value : Optional[:class:`int`]
+            The running checksum to continue from. Defaults to ``0``.
+        """
+        self._value: int = zlib.crc32(data, value)
+
+    def update(self: "CRC32", data: bytes) -> None:
+        """
+        Hashes the provided data into the running checksum.
+
+        Parameters
+        ----------
+        data : :class:`bytes`
+            The data to hash.
+        """
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self: "CRC32") -> bytes:
+        """
+        Returns the running checksum as big endian bytes.
+
+        Returns
+        ----------
+        :class:`bytes`
+            The four byte checksum.
+        """
+        return self._value.to_bytes(self.digest_size, "big")
+
+    def hexdigest(self: "CRC32") -> str:
+        """
+        Returns the running checksum as a hexadecimal string.
+
+        Returns
+        ----------
+        :class:`str`
+            The eight character checksum.
+        """
+        return f"{self._value:08x}"
+
+    def copy(self: "CRC32") -> "CRC32":
+        """
+        Returns a copy of the running checksum.
+
+        Returns
+        ----------
+        :class:`CRC32`
+            A new instance continuing from the same checksum.
+        """
+        return CRC32(value=self._value)
+
+class DigestUtils:
+    """Provides the checksum algorithms which can be selected for photon change detection and integrity checks."""
+    default: str = "sha512"
+    cryptographic: tuple[str, ...] = ("sha512", "sha384", "sha256", "sha3_256", "sha3_512", "blake2b", "blake2s")
+    change_detection: tuple[str, ...] = ("sha1", "md5", "crc32")
+
+    @staticmethod
+    def get_algorithms() -> tuple[str, ...]:
+        """
+        Returns the names of all supported checksum algorithms.
+
+        Returns
+        ----------
+        :class:`tuple[str, ...]`
+            Every algorithm name which can be passed to :func:`new()`.
+
+        Notes
+        ----------
+        - ``sha1``, ``md5``, and ``crc32`` are only suitable for detecting that a file changed. Use one\
+        of the ``cryptographic`` algorithms, e.g. the default ``sha512``, when checking integrity.
+        """
+        return DigestUtils.cryptographic + DigestUtils.change_detection
+
+    @staticmethod
+    def is_supported(algorithm: str) -> bool:
+        """
+        Returns a flag indicating if the provided algorithm can be used for checksums.
+
+        Parameters
+        ----------
+        algorithm : :class:`str`
+            The name of the algorithm.
+
+        Returns
+        ----------
+        :class:`bool`
+            ``True`` if the algorithm is supported, ``False`` otherwise.
+        """
+        return isinstance(algorithm, str) and algorithm in DigestUtils.get_algorithms()
+
+    @staticmethod
+    def new(algorithm: str = "sha512") -> "hashlib._Hash|CRC32":
+        """
+        Creates a new hash object for the provided algorithm.
+
+        Parameters
+        ----------
+        algorithm : Optional[:class:`str`]
+            The name of the algorithm. Defaults to ``sha512``.
+
+        Returns
+        ----------
+        :class:`hashlib._Hash|CRC32`
+            A hash object providing :func:`update()` and :func:`hexdigest()`.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is not supported.
+        """
+        if not DigestUtils.is_supported(algorithm):
+            raise ValueError(f"The checksum algorithm '{algorithm}' is not supported!")
+        if algorithm == CRC32.name:
+            return CRC32()
+        if algorithm in ("sha1", "md5"): # Not used for security, which keeps FIPS builds happy.
+            return hashlib.new(algorithm, usedforsecurity=False)
+        return hashlib.new(algorithm)
+
+class ChecksumEngine:
+    """Hashes whole files with as few copies as possible, either on the calling thread or in a single executor hop."""
+    mmap_threshold: int = 2**16
+    workers: int = min(32, (os.cpu_count() or 1) + 4)
+    _buffers: threading.local = threading.local()
+
+    @staticmethod
+    def _get_buffer(block: int) -> memoryview:
+        """
+        Returns the read buffer of the current thread, which is reused by every file it hashes.
+
+        Parameters
+        ----------
+        block : :class:`int`
+            The minimum size of the buffer in bytes.
+
+        Returns
+        ----------
+        :class:`memoryview`
+            A writable view of the buffer.
+        """
+        buffer = getattr(ChecksumEngine._buffers, "buffer", None)
+        if buffer is None or len(buffer) < block:
+            buffer = memoryview(bytearray(block))
+            ChecksumEngine._buffers.buffer = buffer
+        return buffer
+
+    @staticmethod
+    def hash_file(filename: str, algorithm: str = "sha512", block: int = 2**20, use_mmap: bool = False) -> str:
+        """
+        Calculates the checksum of a file.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            The path of the file.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
+        block : Optional[:class:`int`]
+            The size of the reused read buffer in bytes, when the file isn't memory-mapped. Default is ``2^20``.
+        use_mmap : Optional[:class:`bool`]
+            If ``True``, files of at least ``mmap_threshold`` bytes are memory-mapped. Default is ``False``.
+
+        Returns
+        ----------
+        :class:`str`
+            The hexadecimal checksum of the file.
+
+        Raises
+        ----------
+        OSError
+            If the file cannot be opened or read.
+        ValueError
+            If the algorithm is not supported.
+
+        Notes
+        ----------
+        - Files are read with :func:`readinto()` into a buffer that is reused by every call on the same thread.
+        - With ``use_mmap``, large files are memory-mapped and handed to the hash as a single buffer instead, so\
+        their contents are never copied into Python objects.
+        - Only map files which cannot change while they are hashed. If a mapped file is truncated, e.g. by an\
+        editor or deploy tool rewriting a photon, reading past its new end kills the process with ``SIGBUS``,\
+        which Python cannot catch. Photon files are therefore never mapped by the loader or the watcher.
+        """
+        checksum = DigestUtils.new(algorithm)
+        with open(filename, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if use_mmap and size >= ChecksumEngine.mmap_threshold:
+                try:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                        checksum.update(mapping)
+                    return checksum.hexdigest()
+                except (OSError, ValueError): # pragma: no cover
+                    checksum = DigestUtils.new(algorithm) # The file system doesn't support mapping.
+            buffer = ChecksumEngine._get_buffer(block)[:block]
+            while True:
+                length = file.readinto(buffer)
+                if not length:
+                    break
+                checksum.update(buffer[:length])
+        return checksum.hexdigest()
+
+    @staticmethod
+    async def hash_file_async(filename: str,
+                              algorithm: str = "sha512",
+                              block: int = 2**20,
+                              executor: Optional[Executor] = None,
+                              use_mmap: bool = False) -> str:
+        """``|coro|``
+
+        Calculates the checksum of a file on an executor without blocking the event loop.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            The path of the file.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
+        block : Optional[:class:`int`]
+            The size of the reused read buffer in bytes, when the file isn't memory-mapped. Default is ``2^20``.
+        executor : Optional[:class:`Executor`]
+            The executor to hash on. Defaults to ``None``, which uses the default executor of the event loop.
+        use_mmap : Optional[:class:`bool`]
+            If ``True``, large files are memory-mapped. See :func:`hash_file()` before enabling it. Default is ``False``.
+
+        Returns
+        ----------
+        :class:`str`
+            The hexadecimal checksum of the file.
+
+        Raises
+        ----------
+        OSError
+            If the file cannot be opened or read.
+        ValueError
+            If the algorithm is not supported.
+
+        Notes
+        ----------
+        - The whole file is hashed by :func:`hash_file()` in one executor job, instead of returning to the event\
+        loop after every block.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, ChecksumEngine.hash_file, filename, algorithm, block, use_mmap)
+
+    @staticmethod
+    def _try_hash_file(filename: str, algorithm: str, block: int) -> Optional[str]:
+        """
+        Calculates the checksum of a file, without raising if the file cannot be read.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            The path of the file.
+        algorithm : :class:`str`
+            Any algorithm supported by :class:`DigestUtils`.
+        block : :class:`int`
+            The size of the reused read buffer in bytes.
+
+        Returns
+        ----------
+        Optional[:class:`str`]
+            The hexadecimal checksum of the file, or ``None`` if it doesn't exist or cannot be read.
+        """
+        try: return ChecksumEngine.hash_file(filename, algorithm, block)
+        except OSError: return None
+
+    @staticmethod
+    def iterate_checksums(filenames: Iterable[str],
+                          algorithm: str = "sha512",
+                          block: int = 2**20,
+                          workers: Optional[int] = None) -> Iterator[tuple[str, Optional[str]]]:
+        """
+        Calculates the checksums of many files on a pool of threads, yielding each one as soon as it is done.
+
+        Parameters
+        ----------
+        filenames : :class:`Iterable[str]`
+            The paths of the files. Duplicates are only hashed once.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
+        block : Optional[:class:`int`]
+            The size of the reused read buffer of each thread in bytes. Default is ``2^20``.
+        workers : Optional[:class:`int`]
+            The maximum number of files hashed at once. Defaults to ``None``, which uses ``workers``.
+
+        Returns
+        ----------
+        :class:`Iterator[tuple[str, Optional[str]]]`
+            Every file path with its hexadecimal checksum, or ``None`` if the file cannot be read, in the\
+            order the hashes complete.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is not supported or ``workers`` is less than one.
+
+        Notes
+        ----------
+        - Hashing releases the GIL, so the threads read and hash several files truly in parallel.
+        - A single file, or a single worker, is hashed on the calling thread without creating a pool.
+        """
+        DigestUtils.new(algorithm)
+        workers = ChecksumEngine.workers if workers is None else workers
+        if workers < 1:
+            raise ValueError("The number of checksum workers must be at least one!")
+        filenames = list(dict.fromkeys(filenames))
+        if workers == 1 or len(filenames) < 2:
+            for filename in filenames:
+                yield (filename, ChecksumEngine._try_hash_file(filename, algorithm, block))
+            return
+        with ThreadPoolExecutor(min(workers, len(filenames)), thread_name_prefix="luminal-checksums") as pool:
+            futures = {pool.submit(ChecksumEngine._try_hash_file, filename, algorithm, block): filename
+                       for filename in filenames}
+            for future in as_completed(futures):
+                yield (futures[future], future.result())
+
+    @staticmethod
+    def checksums(filenames: Iterable[str],
+                  algorithm: str = "sha512",
+                  block: int = 2**20,
+                  workers: Optional[int] = None) -> dict[str, Optional[str]]:
+        """
+        Calculates the checksums of many files on a pool of threads.
+
+        Parameters
+        ----------
+        filenames : :class:`Iterable[str]`
+            The paths of the files. Duplicates are only hashed once.
+        algorithm : Optional[:class:`str`]
+            Any algorithm supported by :class:`DigestUtils`. Default is ``sha512``.
+        block : Optional[:class:`int`]
+            The size of the reused read buffer of each thread in bytes. Default is ``2^20``.
+        workers : Optional[:class:`int`]
+            The maximum number of files hashed at once. Defaults to ``None``, which uses ``workers``.
+
+        Returns
+        ----------
+        :class:`dict[str, Optional[str]]`
+            The hexadecimal checksum of every file, or ``None`` if it cannot be read, in the order the files\
+            were provided.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is not supported or ``workers`` is less than one.
+        """
+        filenames = list(dict.fromkeys(filenames))
+        results = dict(ChecksumEngine.iterate_checksums(filenames, algorithm, block, workers))
+        return {filename: results[filename] for filename in filenames}
+
 class TextUtils:
     """Contains a collection of text generation utilities such as random id and cid strings."""
     @staticmethod
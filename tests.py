@@ -124,7 +124,11 @@ F6D2F77617463683F763D4165472D4A304B35563077
 from dataclasses import dataclass
 from unittest.mock import patch
 from typing import Final
+import tempfile
+import asyncio
 import unittest
+import threading
+import dis
 import time
 import os
 
@@ -141,39 +145,66 @@ from src.interfaces.photon import (
     IPhoton
 )
 # Import all manager objects.
+from src.managers.bytecode import BytecodeCache
+from src.managers.events import (
+    PhotonEvent,
+    Subscription
+)
+from src.managers.graph import DependencyGraph
 from src.managers.handler import Handler
+from src.managers.inspector import Inspector
+from src.managers.isolation import (
+    IsolatedHandler,
+    PhotonProxy
+)
 from src.managers.loader import Loader
+from src.managers.manifest import Manifest
+from src.managers.merkle import MerkleIndex
+from src.managers.quarantine import Quarantine
+from src.managers.registry import Registry
 from src.managers.resolver import Resolver
 from src.managers.threads import (
+    CancellableThread,
+    CancellationToken,
     TracedThread,
-    ThreadManager
+    ThreadManager,
+    WorkerPool
 )
 from src.managers.tracer import (
     LoopTrace,
     LoopTask
 )
 # Import all tool objects.
+from src.tools.checksums import Fingerprints
+from src.tools.inotify import Inotify
 from src.tools.sentinel import Sentinel
 from src.tools.colors import Colors
 from src.tools.logger import Logger
 from src.tools.utils import (
+    ChecksumEngine,
+    DigestUtils,
     SystemUtils,
     TextUtils
 )
 # Import all error objects.
 from src.errors.cleanup import (
+    PhotonCollisionError,
     FinalizerNotImplementedError,
     PhotonNotFoundError,
     PhotonNotInitializedError
 )
 from src.errors.system import (
-    DirectoryNotFoundError
+    DirectoryNotFoundError,
+    PhotonProcessError
 )
 from src.errors.threads import (
     NoThreadsFoundError,
+    ThreadCancelledError,
     ThreadManagerAlreadyRunningError,
     ThreadsAlreadyRunningError,
     ThreadLimitReachedError,
+    ThreadQueueFullError,
+    ThreadPoolClosedError
 )
 
 #*=============================================
@@ -204,6 +235,14 @@ class ErrorsTest(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(PhotonNotFoundError):
             raise PhotonNotFoundError("6C6966652C20")
     
+    async def test_raise_photon_collision_error(self):
+        with self.assertRaises(PhotonCollisionError):
+            raise PhotonCollisionError("6F6E6365")
+
+    async def test_raise_photon_process_error(self):
+        with self.assertRaises(PhotonProcessError):
+            raise PhotonProcessError("776F726B6572")
+
     async def test_raise_directory_not_found_error(self):
         with self.assertRaises(DirectoryNotFoundError):
             raise DirectoryNotFoundError("6D61746820")
@@ -220,9 +259,21 @@ class ErrorsTest(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ThreadsAlreadyRunningError):
             raise ThreadsAlreadyRunningError("72657665616C656420")
         
+    async def test_raise_thread_cancelled_error(self):
+        with self.assertRaises(ThreadCancelledError):
+            raise ThreadCancelledError("63616E63656C6C6564")
+
     async def test_raise_thread_limit_reached_error(self):
         with self.assertRaises(ThreadLimitReachedError):
             raise ThreadLimitReachedError("65766572797468696E672E")
+
+    async def test_raise_thread_queue_full_error(self):
+        with self.assertRaises(ThreadLimitReachedError):
+            raise ThreadQueueFullError("7175657565")
+
+    async def test_raise_thread_pool_closed_error(self):
+        with self.assertRaises(ThreadPoolClosedError):
+            raise ThreadPoolClosedError("636C6F736564")
         
 #@unittest.skip(reason="Debugging")
 class InterfacesTest(unittest.IsolatedAsyncioTestCase):
@@ -257,6 +308,9 @@ class InterfacesTest(unittest.IsolatedAsyncioTestCase):
     async def test_photon_finalize_function(self):
         with self.assertRaises(FinalizerNotImplementedError):
             await self.photon_base.finalize()
+
+    async def test_photon_initialize_function(self):
+        self.assertIsNone(await self.photon_base.initialize())
     
     async def test_photon_get_photon_name_property(self):
         value = self.photon_base.photon_name
@@ -335,6 +389,277 @@ class ManagersTest(unittest.IsolatedAsyncioTestCase):
         await self._loader.stop_watching_photons()
         self.assertEqual(result, True)
 
+    async def test_observe_photons_reloads_changed_files(self: "ManagersTest"):
+        engines = ["polling", "inotify"] if Inotify.is_supported() else ["polling"]
+        for engine in engines:
+            with self.subTest(engine=engine), tempfile.TemporaryDirectory() as directory:
+                photon_path = os.path.join(directory, "merkle_photon.py")
+                source = "from src.interfaces.photon import IPhoton\nclass MerklePhoton(IPhoton):\n    VALUE = {}\n"
+                SystemUtils.write_to_file(photon_path, source.format(1))
+                loader = Loader()
+                async def _change_photon():
+                    SystemUtils.write_to_file(photon_path, source.format(22))
+                loader._is_watching = True
+                loop_trace = LoopTrace(tasks=[LoopTask(0, _change_photon)], iteration_limit=2)
+                with patch.object(Loader, "_reload_photons", wraps=loader._reload_photons) as mock_reload:
+                    await loader._observe_photons(directory, loop_trace, engine)
+                await loader.stop_watching_photons()
+                reloaded = [[photon.name for photon in call.args[0]] for call in mock_reload.call_args_list]
+                self.assertIn(["MerklePhoton"], reloaded)
+
+    async def test_observe_photons_waits_for_writes_to_settle(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            photon_path = os.path.join(directory, "settled_photon.py")
+            source = "from src.interfaces.photon import IPhoton\nclass Settled(IPhoton):\n    VALUE = {}\n"
+            SystemUtils.write_to_file(photon_path, source.format(1))
+            loader = Loader()
+            async def _write_in_steps():
+                SystemUtils.write_to_file(photon_path, "from src.interfaces.photon import IPhoton\nclass Settled(")
+                await asyncio.sleep(0.1)
+                SystemUtils.write_to_file(photon_path, source.format(22))
+            async def _change_photon():
+                asyncio.get_running_loop().create_task(_write_in_steps())
+            loader._is_watching = True
+            loop_trace = LoopTrace(tasks=[LoopTask(0, _change_photon)], iteration_limit=2)
+            with patch.object(Loader, "_reload_photons", wraps=loader._reload_photons) as mock_reload, \
+                patch.object(Loader, "_revert_photon") as mock_revert:
+                await loader._observe_photons(directory, loop_trace, debounce=0.5)
+                mock_revert.assert_not_called()
+            await loader.stop_watching_photons()
+            reloaded = [[photon.name for photon in call.args[0]] for call in mock_reload.call_args_list]
+            self.assertEqual(reloaded.count(["Settled"]), 1)
+
+    async def test_observe_photons_reloads_dependents_of_changed_helpers(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            helper_path = os.path.join(directory, "graph_helper.py")
+            photon_path = os.path.join(directory, "graph_photon.py")
+            SystemUtils.write_to_file(helper_path, "VALUE = 1\n")
+            SystemUtils.write_to_file(photon_path, "import graph_helper\nfrom src.interfaces.photon import IPhoton\n" + \
+                                                   "class GraphPhoton(IPhoton):\n    VALUE = graph_helper.VALUE\n")
+            loader = Loader()
+            await loader.load_photons(directory)
+            self.assertEqual(loader.dependencies.get_dependencies(photon_path), {os.path.abspath(helper_path)})
+            async def _change_helper():
+                SystemUtils.write_to_file(helper_path, "VALUE = 22\n")
+            loader._is_watching = True
+            loop_trace = LoopTrace(tasks=[LoopTask(0, _change_helper)], iteration_limit=2)
+            await loader._observe_photons(directory, loop_trace, debounce=0)
+            await loader.stop_watching_photons()
+            self.assertEqual(loader.photons["GraphPhoton"].instance.VALUE, 22)
+
+    async def test_dependency_graph_reload_order(self: "ManagersTest"):
+        graph = DependencyGraph()
+        base, left, right, top = [os.path.abspath(name) for name in ("base.py", "left.py", "right.py", "top.py")]
+        graph.record(left, [base])
+        graph.record(right, [base])
+        graph.record(top, [left, right])
+        self.assertEqual(graph.get_dependents(base), {left, right})
+        self.assertEqual(graph.get_reload_order([base]), [[base], [left, right], [top]])
+        self.assertEqual(graph.get_reload_order([right]), [[right], [top]])
+        graph.record(base, [top]) # Cycles are reloaded together in a final stage.
+        self.assertEqual(graph.get_reload_order([base]), [sorted([base, left, right, top])])
+        self.assertTrue(graph.discard(base))
+        self.assertFalse(graph.discard(base))
+
+    async def test_dependency_graph_reads_imports_from_bytecode(self: "ManagersTest"):
+        source = "import os.path\nfrom json import dumps\nfrom . import sibling\nfrom .nested import helper\n" + \
+                 "def deferred():\n    import ast\n"
+        code = compile(source, "<graph>", "exec")
+        self.assertEqual(DependencyGraph._get_code_imports(code), {'ast', 'json', 'json.dumps', 'os', 'os.path'})
+        instructions = list(dis.get_instructions(compile("import os", "<graph>", "exec")))
+        index = next(index for index, instruction in enumerate(instructions) if instruction.opname == "IMPORT_NAME")
+        self.assertEqual(DependencyGraph._get_import_level(instructions, index), 0)
+        self.assertIsNone(DependencyGraph._get_import_level(instructions[index:], 0))
+
+    async def test_observe_photons_notices_cancellation_while_settling(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            loader = Loader()
+            loader._is_watching = True
+            _observe = lambda: asyncio.run(loader._observe_photons(directory, engine="polling", debounce=10, max_delay=30))
+            thread = CancellableThread(target=_observe, daemon=True)
+            thread.start()
+            time.sleep(0.2)
+            SystemUtils.write_to_file(os.path.join(directory, "settling_helper.py"), "VALUE = 1\n")
+            time.sleep(1.1) # The change is seen and the batch waits for a debounce window of ten seconds.
+            with patch.object(CancellableThread, "interrupt") as mock_interrupt:
+                started = time.perf_counter()
+                self.assertTrue(thread.halt(timeout=1))
+                self.assertLess(time.perf_counter() - started, 0.5)
+                mock_interrupt.assert_not_called()
+
+    async def test_observe_photons_quarantines_broken_files(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            photon_path = os.path.abspath(os.path.join(directory, "broken_photon.py"))
+            SystemUtils.write_to_file(photon_path, "from src.interfaces.photon import IPhoton\nclass Broken(IPhoton\n")
+            loader = Loader()
+            loader._quarantine = Quarantine(backoff=60)
+            async def _repair_photon():
+                self.assertEqual(loader.quarantine.entries[photon_path].failures, 1)
+                SystemUtils.write_to_file(photon_path, "from src.interfaces.photon import IPhoton\nclass Repaired(IPhoton): pass\n")
+            loader._is_watching = True
+            loop_trace = LoopTrace(tasks=[LoopTask(2, _repair_photon)], iteration_limit=4)
+            with patch.object(Loader, "_import_module", wraps=loader._import_module) as mock_import:
+                await loader._observe_photons(directory, loop_trace, "polling", debounce=0)
+            await loader.stop_watching_photons()
+            self.assertEqual(mock_import.call_count, 2) # Once broken, and once repaired.
+            self.assertIn("Repaired", loader.photons)
+            self.assertNotIn(photon_path, loader.quarantine)
+
+    async def test_quarantine_backs_off_exponentially(self: "ManagersTest"):
+        quarantine = Quarantine(backoff=10, max_backoff=30)
+        photon_path = PhotonLocations.basic_photon
+        self.assertEqual(quarantine.record(photon_path, "517561", SyntaxError()).failures, 1)
+        entry = quarantine.record(photon_path, "517561", SyntaxError())
+        self.assertEqual(entry.failures, 2)
+        self.assertGreater(entry.retry_in, 10)
+        self.assertLessEqual(quarantine.record(photon_path, "517561", SyntaxError()).retry_in, 30)
+        self.assertTrue(quarantine.is_quarantined(photon_path, "517561"))
+        self.assertFalse(quarantine.is_quarantined(photon_path, "72616E74696E65"))
+        self.assertEqual(quarantine.get_due(), [])
+        self.assertTrue(quarantine.release())
+        self.assertEqual(len(quarantine), 0)
+        with self.assertRaises(ValueError):
+            Quarantine(backoff=-1)
+
+    async def test_bytecode_cache_skips_compiling_known_versions(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as cache:
+            photon_path = os.path.join(directory, "cached_photon.py")
+            original = "from src.interfaces.photon import IPhoton\nimport cached_helper\nclass Cached(IPhoton): VALUE = 1\n"
+            SystemUtils.write_to_file(os.path.join(directory, "cached_helper.py"), "VALUE = 1\n")
+            SystemUtils.write_to_file(photon_path, original)
+            first = Loader(bytecode_cache=cache)
+            await first.load_photon(photon_path)
+            self.assertEqual((first.bytecode_cache.hits, first.bytecode_cache.misses), (0, 1))
+            second = Loader(bytecode_cache=cache) # A restarted loader reuses the compiled code.
+            photon = await second.load_photon(photon_path)
+            await photon.start()
+            self.assertEqual(photon.instance.VALUE, 1)
+            self.assertEqual((second.bytecode_cache.hits, second.bytecode_cache.misses), (1, 0))
+            self.assertIn(os.path.join(directory, "cached_helper.py"), second.dependencies.get_dependencies(photon_path))
+            SystemUtils.write_to_file(photon_path, original.replace("VALUE = 1", "VALUE = 2"))
+            photon = await second.reload_photon(photon)
+            await photon.start()
+            self.assertEqual(photon.instance.VALUE, 2)
+            SystemUtils.write_to_file(photon_path, original) # Reverting hits the cache again.
+            photon = await second.reload_photon(photon)
+            await photon.start()
+            self.assertEqual(photon.instance.VALUE, 1)
+            self.assertEqual((second.bytecode_cache.hits, second.bytecode_cache.misses), (2, 1))
+            self.assertEqual(len(second.bytecode_cache), 2)
+
+    async def test_bytecode_cache_discards_corrupted_entries(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as cache:
+            bytecode = BytecodeCache(cache)
+            code = compile("VALUE = 1\n", PhotonLocations.basic_photon, "exec")
+            self.assertTrue(bytecode.put(PhotonLocations.basic_photon, "436F6465", code))
+            self.assertEqual(bytecode.get(PhotonLocations.basic_photon, "436F6465"), code)
+            entry = os.path.join(cache, os.listdir(cache)[0])
+            SystemUtils.write_to_file(entry, "436F7272757074")
+            self.assertIsNone(bytecode.get(PhotonLocations.basic_photon, "436F6465"))
+            self.assertEqual(len(bytecode), 0)
+            self.assertEqual(bytecode.clear(), 0)
+
+    async def test_bytecode_cache_ignores_weak_loader_checksums(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as cache:
+            photon_path = os.path.join(directory, "colliding_photon.py")
+            original = "from src.interfaces.photon import IPhoton\nclass Colliding(IPhoton): VALUE = 1\n"
+            SystemUtils.write_to_file(photon_path, original)
+            with patch.object(Fingerprints, "get_checksum", return_value="00000000"): # Every version collides.
+                first = Loader(algorithm="crc32", bytecode_cache=cache)
+                self.assertEqual(first.bytecode_cache.algorithm, "sha256")
+                await first.load_photon(photon_path)
+                SystemUtils.write_to_file(photon_path, original.replace("VALUE = 1", "VALUE = 2"))
+                photon = await Loader(algorithm="crc32", bytecode_cache=cache).load_photon(photon_path)
+                await photon.start()
+            self.assertEqual(photon.instance.VALUE, 2)
+
+    async def test_registry_indexes_photons(self: "ManagersTest"):
+        loader = Loader()
+        photons = await loader.load_photon(PhotonLocations.advanced_photon)
+        registry = loader.photons
+        self.assertIsInstance(registry, Registry)
+        self.assertEqual(registry.get_by_filepath(os.path.abspath(PhotonLocations.advanced_photon)), photons)
+        self.assertEqual(registry.get_by_module("luminal_advanced"), photons)
+        self.assertEqual(registry.get_by_base(IPhoton), photons)
+        self.assertEqual(registry.get_by_base("IPhoton"), photons)
+        self.assertTrue(registry.has_filepath(PhotonLocations.advanced_photon))
+        await loader.warm()
+        await loader.unload_photons([PhotonLocations.advanced_photon], force_stop=True)
+        self.assertEqual(registry.get_by_filepath(PhotonLocations.advanced_photon), [])
+        self.assertEqual(registry.get_by_base(IPhoton), [])
+        self.assertEqual(registry.filepaths, set())
+
+    async def test_registry_rejects_colliding_names(self: "ManagersTest"):
+        first = Handler(False, "Twin", "first/twin.py", None, None)
+        second = Handler(False, "Twin", "second/twin.py", None, None)
+        registry = Registry({"Twin": first})
+        with self.assertRaises(PhotonCollisionError):
+            registry["Twin"] = second
+        registry["Twin"] = Handler(False, "Twin", os.path.abspath("first/twin.py"), None, None)
+        self.assertEqual(len(registry.get_by_filepath("first/twin.py")), 1)
+        self.assertEqual(len(registry.get_by_module("twin")), 1)
+        self.assertEqual(registry.pop("Twin").filepath, os.path.abspath("first/twin.py"))
+        self.assertEqual(registry.get_by_module("twin"), [])
+        self.assertIsNone(registry.pop("Twin", None))
+
+    async def test_observe_photons_unloads_deleted_files(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            photon_path = os.path.join(directory, "deleted_photon.py")
+            SystemUtils.write_to_file(photon_path, "from src.interfaces.photon import IPhoton\nclass Deleted(IPhoton): pass\n")
+            loader = Loader()
+            async def _delete_photon():
+                os.remove(photon_path)
+            loader._is_watching = True
+            loop_trace = LoopTrace(tasks=[LoopTask(0, _delete_photon)], iteration_limit=2)
+            await loader._observe_photons(directory, loop_trace)
+            await loader.stop_watching_photons()
+            self.assertNotIn("Deleted", loader.photons)
+
+    async def test_merkle_root_digest_is_location_independent(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            for directory in (first, second):
+                SystemUtils.write_to_file(os.path.join(directory, "nested", "merkle_photon.py"), "VALUE = 1\n")
+            digests = [await Loader().get_root_digest(directory) for directory in (first, second)]
+            self.assertEqual(digests[0], digests[1])
+            SystemUtils.write_to_file(os.path.join(second, "nested", "merkle_photon.py"), "VALUE = 22\n")
+            self.assertNotEqual(digests[0], await Loader().get_root_digest(second))
+
+    async def test_merkle_refresh_reports_changed_paths(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            alpha, omega = os.path.join(directory, "alpha.py"), os.path.join(directory, "sub", "omega.py")
+            SystemUtils.write_to_file(alpha, "VALUE = 1\n")
+            SystemUtils.write_to_file(omega, "VALUE = 1\n")
+            index = MerkleIndex(directory)
+            self.assertEqual(len(index.refresh()), 2)
+            self.assertEqual(index.refresh(), [])
+            SystemUtils.write_to_file(alpha, "VALUE = 22\n")
+            SystemUtils.write_to_file(omega, "VALUE = 22\n")
+            self.assertEqual(index.refresh([alpha]), [alpha])
+            self.assertEqual(index.refresh(), [omega])
+            os.remove(omega)
+            self.assertEqual(index.refresh([os.path.dirname(omega)]), [omega])
+            self.assertNotIn(omega, index)
+
+    async def test_merkle_refresh_only_lists_changed_directories(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("alpha", "omega", "sigma"):
+                SystemUtils.write_to_file(os.path.join(directory, name, f"{name}_photon.py"), "VALUE = 1\n")
+            index = MerkleIndex(directory)
+            index.refresh()
+            with patch.object(index, "_list_children", wraps=index._list_children) as mock_list:
+                self.assertEqual(index.refresh(), [])
+                mock_list.assert_not_called()
+                added = os.path.join(index.root, "omega", "gamma_photon.py")
+                SystemUtils.write_to_file(added, "VALUE = 1\n")
+                self.assertEqual(index.refresh(), [added])
+                self.assertEqual([call.args[0] for call in mock_list.call_args_list], [os.path.dirname(added)])
+
+    async def test_get_root_digest_with_invalid_path(self: "ManagersTest"):
+        with self.assertRaises(TypeError):
+            await Loader().get_root_digest(0x4D65726B6C65)
+        with self.assertRaises(DirectoryNotFoundError):
+            await Loader().get_root_digest(PhotonLocations.basic_photon)
+
     async def test_return_photon_handler_as_string(self: "ManagersTest"):
         photon = await self._loader.load_photon(PhotonLocations.basic_photon)
         handler_as_string = photon.__str__()
@@ -345,26 +670,192 @@ class ManagersTest(unittest.IsolatedAsyncioTestCase):
         checksum = await Handler._get_checksum(path)
         self.assertIsNone(checksum)
     
-    async def test_traced_thread_global_trace_as_call(self: "ManagersTest"):
-        traced_thread = TracedThread()
-        trace = traced_thread.globaltrace(None, "call", None)
-        self.assertIsInstance(trace, object)
-
-    async def test_traced_thread_global_trace_as_none(self: "ManagersTest"):
-        traced_thread = TracedThread()
-        trace = traced_thread.globaltrace(None, None, None)
-        self.assertIsInstance(trace, object)
-
-    async def test_traced_thread_local_trace(self: "ManagersTest"):
-        traced_thread = TracedThread()
-        trace = traced_thread.localtrace(None, None, None)
-        self.assertIsInstance(trace, object)
-
-    async def test_traced_thread_local_trace_as_halted_line(self: "ManagersTest"):
-        traced_thread = TracedThread()
-        traced_thread.halt()
+    async def test_manifest_reuses_unchanged_checksums(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = os.path.join(directory, "manifest.json")
+            photons = await Loader(manifest=manifest).load_photons(PhotonLocations.main_directory)
+            with patch.object(Handler, "_get_checksum") as mock_checksum:
+                reloaded = await Loader(manifest=manifest).load_photons(PhotonLocations.main_directory)
+                mock_checksum.assert_not_called()
+            self.assertEqual([photon.checksum for photon in photons], [photon.checksum for photon in reloaded])
+
+    async def test_manifest_ignores_checksums_of_other_algorithms(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = os.path.join(directory, "manifest.json")
+            await Loader(manifest=manifest).load_photons(PhotonLocations.main_directory)
+            photons = await Loader(manifest=manifest, algorithm="crc32").load_photons(PhotonLocations.main_directory)
+            self.assertTrue(all(len(photon.checksum) == 8 for photon in photons))
+
+    async def test_manifest_skips_files_without_photons(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as storage:
+            SystemUtils.write_to_file(os.path.join(directory, "manifest_helper.py"), "VALUE = 1\n")
+            manifest = os.path.join(storage, "manifest.json")
+            await Loader(manifest=manifest).load_photons(directory)
+            with patch.object(Loader, "_import_module") as mock_import:
+                await Loader(manifest=manifest).load_photons(directory)
+                mock_import.assert_not_called()
+
+    async def test_manifest_invalidates_changed_files(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            photon_path = os.path.join(directory, "manifest_photon.py")
+            SystemUtils.write_to_file(photon_path, "VALUE = 1\n")
+            manifest = Manifest(os.path.join(directory, "manifest.json"))
+            manifest.update(photon_path, checksum="4D616E6966657374")
+            self.assertIsNotNone(manifest.lookup(photon_path))
+            SystemUtils.write_to_file(photon_path, "VALUE = 22\n")
+            self.assertIsNone(manifest.lookup(photon_path))
+            self.assertTrue(manifest.save())
+            self.assertIn(os.path.abspath(photon_path), Manifest(manifest.filepath).entries)
+
+    async def test_inspector_reads_photon_metadata(self: "ManagersTest"):
+        source = "from src.interfaces.photon import IPhoton as Base\n" + \
+                 "class Zeta(Base, name='zeta', version='1.2.3', tags=['static']):\n" + \
+                 "    \"\"\"A statically discovered photon.\"\"\"\n" + \
+                 "class Eta(Zeta): pass\n" + \
+                 "class Theta: pass\n"
+        signatures = Inspector().inspect_source(source)
+        self.assertEqual([signature.name for signature in signatures], ['Eta', 'Zeta'])
+        self.assertEqual(signatures[1].metadata['name'], 'zeta')
+        self.assertEqual(signatures[1].metadata['version'], '1.2.3')
+        self.assertEqual(signatures[1].metadata['tags'], ['static'])
+        self.assertEqual(signatures[1].metadata['description'], 'A statically discovered photon.')
+
+    async def test_discover_photons_without_importing(self: "ManagersTest"):
+        loaded = await Loader().load_photons(PhotonLocations.main_directory, recursive=True)
+        with patch.object(Loader, "_import_module") as mock_import:
+            catalog = await Loader().discover_photons(PhotonLocations.main_directory, recursive=True)
+            mock_import.assert_not_called()
+        self.assertEqual([signature.name for signature in catalog], [photon.name for photon in loaded])
+
+    async def test_static_discovery_skips_files_without_photons(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "static_helper.py"), "raise RuntimeError()\n")
+            with patch.object(Loader, "_import_module") as mock_import:
+                photons = await Loader(static_discovery=True).load_photons(directory)
+                mock_import.assert_not_called()
+            self.assertEqual(photons, [])
+
+    async def test_static_discovery_imports_photons_with_imported_bases(self: "ManagersTest"):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "static_base.py"),
+                                      "from src.interfaces.photon import IPhoton\nclass Plugin(IPhoton): pass\n")
+            SystemUtils.write_to_file(os.path.join(directory, "static_child.py"),
+                                      "from static_base import Plugin\nclass Child(Plugin): pass\n")
+            self.assertIsNone(Inspector().inspect_file(os.path.join(directory, "static_child.py")))
+            photons = await Loader(static_discovery=True).load_photons(directory)
+            self.assertEqual(sorted({photon.name for photon in photons}), ['Child', 'Plugin'])
+
+    async def test_cancellation_token(self: "ManagersTest"):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        self.assertFalse(token.wait(0.01))
+        token.cancel()
+        self.assertTrue(token.is_cancelled)
+        self.assertTrue(token.wait())
         with self.assertRaises(SystemExit):
-            traced_thread.localtrace(None, "line", None)
+            token.raise_if_cancelled()
+
+    async def test_cancellable_thread_stops_cooperatively(self: "ManagersTest"):
+        def _work(iterations: list[int]) -> None:
+            token = CancellableThread.current_token()
+            while not token.wait(0.01):
+                iterations.append(1)
+        iterations: list[int] = []
+        thread = TracedThread(target=_work, args=(iterations,))
+        self.assertIs(TracedThread, CancellableThread)
+        self.assertIsNone(CancellableThread.current_token())
+        thread.start()
+        self.assertTrue(thread.halt(timeout=5))
+        self.assertTrue(thread.halted)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(thread.interrupt())
+
+    async def test_cancellable_thread_is_interrupted_when_ignoring_its_token(self: "ManagersTest"):
+        def _spin(cleaned: list[bool]) -> None:
+            try:
+                spins = 0
+                while True: spins += 1
+            finally:
+                cleaned.append(True)
+        cleaned: list[bool] = []
+        thread = CancellableThread(target=_spin, args=(cleaned,), daemon=True)
+        thread.start()
+        self.assertTrue(thread.halt(timeout=0.05))
+        self.assertEqual(cleaned, [True])
+
+    async def test_thread_manager_halts_cancellable_threads(self: "ManagersTest"):
+        manager = ThreadManager()
+        manager.thread_limit = 2
+        for _ in range(2):
+            manager.append_thread(lambda: CancellableThread.current_token().wait())
+        manager.run()
+        started = time.perf_counter()
+        self.assertTrue(manager.halt(grace=5))
+        self.assertLess(time.perf_counter() - started, 5)
+        self.assertTrue(all(not thread.is_alive() for thread in manager._running_threads.values()))
+
+    async def test_thread_manager_leaves_uninterruptible_threads_running(self: "ManagersTest"):
+        manager = ThreadManager()
+        manager.append_thread(time.sleep, (0.5,)) # Blocked in C, so the interrupt only lands once it returns.
+        manager.run()
+        started = time.perf_counter()
+        self.assertFalse(manager.halt(grace=0.05))
+        self.assertLess(time.perf_counter() - started, 0.4)
+        self.assertEqual(len(manager._running_threads), 1)
+        for thread in manager._running_threads.values(): thread.join()
+
+    async def test_worker_pool_reuses_its_workers(self: "ManagersTest"):
+        with WorkerPool(workers=2, queue_size=4) as pool:
+            futures = [pool.submit(lambda value: (value * 2, threading.get_ident()), (value,)) for value in range(20)]
+            results = [future.result(timeout=5) for future in futures]
+            failed = pool.submit(int, ("6E6F74",))
+            with self.assertRaises(ValueError):
+                failed.result(timeout=5)
+        self.assertEqual([value for value, _ in results], [value * 2 for value in range(20)])
+        self.assertLessEqual(len({ident for _, ident in results}), 2)
+        self.assertEqual(pool.workers, 0)
+        self.assertTrue(pool.is_closed)
+        with self.assertRaises(ThreadPoolClosedError):
+            pool.submit(int)
+        with self.assertRaises(ValueError):
+            WorkerPool(policy="6C696665")
+
+    async def test_worker_pool_queue_policies(self: "ManagersTest"):
+        for policy in WorkerPool.policies:
+            with self.subTest(policy=policy):
+                release = threading.Event()
+                pool = WorkerPool(workers=1, queue_size=2, policy=policy)
+                running = pool.submit(release.wait)
+                while pool.pending: time.sleep(0.001) # The worker picks up the blocking task first.
+                queued = [pool.submit(int, (value,)) for value in range(2)]
+                if policy == "fail":
+                    with self.assertRaises(ThreadQueueFullError):
+                        pool.submit(int)
+                elif policy == "block":
+                    with self.assertRaises(ThreadQueueFullError):
+                        pool.submit(int, timeout=0.01)
+                else:
+                    latest = pool.submit(int, (2,))
+                    self.assertTrue(queued[0].cancelled())
+                    self.assertEqual(pool.dropped, 1)
+                    queued = queued[1:] + [latest]
+                self.assertEqual(pool.pending, 2)
+                release.set()
+                pool.shutdown()
+                self.assertTrue(running.result())
+                self.assertEqual([future.result() for future in queued], [1, 2] if policy == "drop" else [0, 1])
+
+    async def test_thread_manager_submits_to_its_worker_pool(self: "ManagersTest"):
+        manager = ThreadManager()
+        manager.thread_limit = 2
+        self.assertEqual(manager.submit(sum, ([1, 2, 3],)).result(timeout=5), 6)
+        with self.assertRaises(ThreadManagerAlreadyRunningError):
+            manager.start_pool()
+        blocked = manager.submit(lambda: CancellableThread.current_token().wait())
+        while manager._pool.pending: time.sleep(0.001)
+        manager.halt(grace=5)
+        self.assertTrue(blocked.result(timeout=5))
+        self.assertEqual(manager._pool.workers, 0)
     
     async def test_loop_trace_get_current_iteration(self: "ManagersTest"):
         loop_trace = LoopTrace([], 1)
@@ -529,6 +1020,256 @@ class LoadingTest(unittest.IsolatedAsyncioTestCase):
             await Loader().load_photons(PhotonLocations.main_directory, 
                                        recursive=["746865206E6574206973207661737420616E6420696E66696E6974652E20"])
 
+    #* Concurrent photons — Test that worker pools load the same photons in the same order.
+    async def test_load_multiple_photons_concurrently(self):
+        sequential = await Loader().load_photons(PhotonLocations.main_directory, recursive=True)
+        concurrent = await Loader(workers=4).load_photons(PhotonLocations.main_directory, recursive=True)
+        self.assertEqual([photon.name for photon in sequential], [photon.name for photon in concurrent])
+
+    async def test_load_multiple_photons_concurrently_with_registry_order(self):
+        loader = Loader(workers=4)
+        photons = await loader.load_photons(PhotonLocations.main_directory, other_classes=['Alpha', 'Omega'])
+        self.assertEqual(list(loader.photons.keys()), [photon.name for photon in photons])
+
+    async def test_load_photons_skips_subdirectories_unless_recursive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.mkdir(os.path.join(directory, "zeta"))
+            SystemUtils.write_to_file(os.path.join(directory, "alpha_photon.py"),
+                                      "from src.interfaces.photon import IPhoton\nclass Top(IPhoton): pass\n")
+            SystemUtils.write_to_file(os.path.join(directory, "zeta", "nested_photon.py"),
+                                      "from src.interfaces.photon import IPhoton\nclass Nested(IPhoton): pass\n")
+            photons = await Loader().load_photons(directory)
+            self.assertEqual([photon.name for photon in photons], ['Top'])
+            photons = await Loader().load_photons(directory, recursive=True)
+            self.assertEqual(sorted(photon.name for photon in photons), ['Nested', 'Top'])
+
+    #* Lazy photons — Test that photons are only imported once they're accessed or warmed.
+    async def test_load_multiple_photons_lazily(self):
+        with patch.object(Loader, "_import_module") as mock_import:
+            photons = await Loader(lazy=True).load_photons(PhotonLocations.main_directory, recursive=True)
+            mock_import.assert_not_called()
+        self.assertTrue(all(photon.is_lazy for photon in photons))
+        self.assertEqual(photons[0].metadata['name'], photons[0].name)
+
+    async def test_load_photons_lazily_with_imported_bases(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "lazy_base.py"),
+                                      "from src.interfaces.photon import IPhoton\nclass Plugin(IPhoton): pass\n")
+            SystemUtils.write_to_file(os.path.join(directory, "lazy_child.py"),
+                                      "from lazy_base import Plugin\nclass Child(Plugin): pass\n")
+            photons = await Loader(lazy=True).load_photons(directory)
+            lazy = {photon.name: photon.is_lazy for photon in photons}
+            self.assertEqual(sorted(lazy), ['Child', 'Plugin'])
+            self.assertFalse(lazy['Child']) # The child could only be found by importing its file.
+
+    async def test_get_lazy_photon_instance(self):
+        photon = await Loader(lazy=True).load_photon(PhotonLocations.basic_photon)
+        instance = await photon.get_instance()
+        self.assertIsInstance(instance, IPhoton)
+        self.assertFalse(photon.is_lazy)
+
+    async def test_warm_lazy_photons(self):
+        loader = Loader(lazy=True)
+        photons = await loader.load_photons(PhotonLocations.main_directory)
+        warmed = await loader.warm([photons[0], PhotonLocations.basic_photon])
+        self.assertEqual(len(warmed), 2)
+        self.assertTrue(all(photon.is_started for photon in warmed))
+        self.assertTrue(all(photon.is_lazy for photon in photons if not photon in warmed))
+
+    async def test_warm_lazy_photon_from_relative_path_restores_sys_path(self):
+        import sys
+        with tempfile.TemporaryDirectory() as directory:
+            photon_path = os.path.join(directory, "relative_photon.py")
+            SystemUtils.write_to_file(photon_path, "from src.interfaces.photon import IPhoton\nclass Relative(IPhoton): pass\n")
+            loader = Loader(lazy=True)
+            photon = await loader.load_photon(os.path.relpath(photon_path))
+            await loader.warm([photon])
+            self.assertFalse(photon.is_lazy)
+            self.assertNotIn(os.path.abspath(directory), sys.path)
+
+    async def test_unload_lazy_photon_without_importing(self):
+        loader = Loader(lazy=True)
+        photon = await loader.load_photon(PhotonLocations.basic_photon)
+        unloaded = await loader.unload_photon(photon)
+        self.assertTrue(unloaded)
+        self.assertEqual(len(loader.photons), 0)
+
+    async def test_warm_photons_initializes_concurrently(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "initializers.py"),
+                "from src.interfaces.photon import IPhoton\nimport asyncio\n"
+                "class First(IPhoton):\n    async def initialize(self): await asyncio.sleep(0.4)\n"
+                "class Second(IPhoton):\n    async def initialize(self): await asyncio.sleep(0.4)\n"
+                "class Broken(IPhoton):\n    async def initialize(self): raise OSError('4E6F7065')\n")
+            loader = Loader()
+            photons = await loader.load_photons(directory)
+            started = time.perf_counter()
+            warmed = await loader.warm()
+            self.assertLess(time.perf_counter() - started, 0.7) # Not the 0.8 seconds of running them in turn.
+            self.assertEqual(sorted(photon.name for photon in warmed), ["First", "Second"])
+            broken = loader.photons["Broken"]
+            self.assertTrue(broken.is_started)
+            self.assertFalse(broken.is_ready)
+            self.assertIsNone(broken.instance)
+            self.assertEqual(len(photons), 3)
+
+    async def test_load_isolated_photons_in_worker_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, "finalized.txt")
+            SystemUtils.write_to_file(os.path.join(directory, "isolated.py"),
+                "from src.interfaces.photon import IPhoton\nimport asyncio\nimport os\n"
+                "class Isolated(IPhoton):\n"
+                "    async def initialize(self): self.value = '4C756D'\n"
+                "    def get_pid(self): return os.getpid()\n"
+                "    async def add(self, left, right): await asyncio.sleep(0); return left + right\n"
+                "    def fail(self): raise KeyError('4E6F7065')\n"
+                f"    async def finalize(self):\n        open({marker!r}, 'w').close()\n        return True\n"
+                "class Local(IPhoton):\n    def get_pid(self): return os.getpid()\n")
+            loader = Loader(isolated=["Isolated"])
+            await loader.load_photons(directory)
+            isolated, local = await loader.warm()
+            self.assertIsInstance(isolated, IsolatedHandler)
+            self.assertNotIsInstance(local, IsolatedHandler)
+            self.assertIsInstance(isolated.instance, PhotonProxy)
+            self.assertNotEqual(isolated.instance.get_pid(), os.getpid())
+            self.assertEqual(local.instance.get_pid(), os.getpid())
+            self.assertEqual(await isolated.instance.add(4, 2), 6)
+            self.assertEqual(isolated.instance.value, "4C756D")
+            with self.assertRaises(KeyError):
+                isolated.instance.fail()
+            process = isolated.process
+            await loader.unload_photons([isolated])
+            self.assertTrue(os.path.isfile(marker))
+            self.assertFalse(process.is_alive)
+            with self.assertRaises(PhotonProcessError):
+                process.request("get", "value")
+
+    async def test_loader_with_invalid_isolated_photons(self):
+        with self.assertRaises(TypeError):
+            Loader(isolated="49736F6C61746564")
+
+    async def test_loader_collects_lifecycle_stats(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "measured.py")
+            SystemUtils.write_to_file(filepath, "from src.interfaces.photon import IPhoton\n"
+                                                "class Measured(IPhoton):\n    async def finalize(self): return True\n")
+            SystemUtils.write_to_file(os.path.join(directory, "broken.py"), "class Broken(:\n")
+            loader = Loader(collect_stats=True)
+            await loader.load_photons(directory)
+            await loader.warm()
+            SystemUtils.write_to_file(filepath, "from src.interfaces.photon import IPhoton\nVERSION = 2\n"
+                                                "class Measured(IPhoton):\n    async def finalize(self): return True\n")
+            await loader.reload_photon(loader.photons["Measured"])
+            stats = loader.stats()
+            self.assertTrue(stats["enabled"])
+            measured = stats["photons"]["Measured"]
+            self.assertEqual((measured["loads"], measured["reloads"], measured["failures"]), (1, 1, 0))
+            for phase in ("scan", "checksum", "exec_module", "validation", "instantiation", "finalize", "cleanup"):
+                self.assertIn(phase, measured["phases"])
+            self.assertEqual(measured["phases"]["exec_module"]["count"], 2)
+            self.assertEqual(measured["phases"]["exec_module"]["recent"]["count"], 2)
+            self.assertLessEqual(measured["phases"]["exec_module"]["min"], measured["phases"]["exec_module"]["recent"]["p95"])
+            self.assertEqual(stats["files"][os.path.join(directory, "broken.py")]["failures"], 1)
+            self.assertNotIn("Broken", stats["photons"])
+
+    async def test_subscribe_to_photon_lifecycle_events(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "observed.py")
+            SystemUtils.write_to_file(filepath, "from src.interfaces.photon import IPhoton\n"
+                                                "class Observed(IPhoton):\n    async def finalize(self): return True\n")
+            SystemUtils.write_to_file(os.path.join(directory, "broken.py"), "class Broken(:\n")
+            loader = Loader()
+            heard: list[PhotonEvent] = []
+            async def _listen(event: PhotonEvent) -> None: heard.append(event)
+            loader.add_listener(_listen, ["unloaded"])
+            async with loader.subscribe() as events:
+                await loader.load_photons(directory)
+                await loader.warm()
+                await loader.reload_photon(loader.photons["Observed"])
+                await loader.unload_photons([loader.photons["Observed"]])
+                self.assertTrue(loader.remove_listener(_listen))
+                self.assertFalse(loader.remove_listener(_listen))
+            received = [event async for event in events] # Closing the subscription ends the iterator.
+            self.assertEqual([(event.kind, event.name) for event in received if event.filepath == filepath],
+                             [("imported", None), ("discovered", "Observed"), ("started", "Observed"),
+                              ("imported", None), ("started", "Observed"), ("reloaded", "Observed"),
+                              ("unloaded", "Observed")])
+            failed = [event for event in received if event.kind == "failed"]
+            self.assertEqual(len(failed), 1)
+            self.assertIsInstance(failed[0].error, SyntaxError)
+            self.assertTrue(all(event.duration >= 0 and event.timestamp > 0 for event in received))
+            await asyncio.sleep(0)
+            self.assertEqual([(event.kind, event.name) for event in heard], [("unloaded", "Observed")])
+
+    async def test_subscription_buffers_are_bounded(self):
+        for drop, expected in (("oldest", ["2", "3"]), ("newest", ["1", "2"])):
+            subscription = Subscription(buffer=2, drop=drop)
+            for name in ("1", "2", "3"):
+                subscription.push(PhotonEvent("discovered", "4C6F6E67", name))
+            self.assertEqual(subscription.dropped, 1)
+            subscription.close()
+            self.assertEqual([event.name async for event in subscription], expected)
+        waiting = Subscription(kinds=["unloaded"])
+        consumer = asyncio.ensure_future(waiting.__anext__())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.accepts(PhotonEvent("started", "4C6F6E67")))
+        waiting.push(PhotonEvent("unloaded", "4C6F6E67", "576F6B656E"))
+        self.assertEqual((await asyncio.wait_for(consumer, 1)).name, "576F6B656E")
+        with self.assertRaises(ValueError):
+            Subscription(drop="6D6964646C65")
+        with self.assertRaises(ValueError):
+            Subscription(kinds=["6D6F766564"])
+        with self.assertRaises(TypeError):
+            Subscription(buffer="10")
+        with self.assertRaises(TypeError):
+            Loader().add_listener("6E6F742063616C6C61626C65")
+
+    async def test_loader_stats_are_empty_when_disabled(self):
+        loader = Loader()
+        await loader.load_photon(PhotonLocations.basic_photon)
+        self.assertEqual(loader.stats(), {"enabled": False, "window": None, "photons": {}, "files": {}})
+        with self.assertRaises(TypeError):
+            Loader(collect_stats="456E61626C6564")
+
+    async def test_warm_photons_with_invalid_concurrency(self):
+        with self.assertRaises(TypeError):
+            await Loader().warm(concurrency="4F6E65")
+        with self.assertRaises(ValueError):
+            await Loader().warm(concurrency=0)
+
+    async def test_warm_photons_with_invalid_type(self):
+        with self.assertRaises(TypeError):
+            await Loader(lazy=True).warm([889419603671545951289])
+
+    async def test_loader_with_invalid_workers_type(self):
+        with self.assertRaises(TypeError):
+            Loader(workers="4D616E7920776F726B657273")
+
+    async def test_loader_with_invalid_workers_value(self):
+        with self.assertRaises(ValueError):
+            Loader(workers=0)
+
+    async def test_load_photons_with_checksum_algorithm(self):
+        loader = Loader(algorithm="blake2b")
+        photon = await loader.load_photon(PhotonLocations.basic_photon)
+        expected = SystemUtils.get_file_checksum(PhotonLocations.basic_photon, algorithm="blake2b")
+        self.assertEqual(photon.checksum, expected)
+        self.assertEqual(loader.fingerprints.algorithm, "blake2b")
+
+    async def test_loader_with_invalid_checksum_algorithm(self):
+        with self.assertRaises(ValueError):
+            Loader(algorithm="4D6F6F6E")
+
+    async def test_load_photons_with_colliding_names(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = "from src.interfaces.photon import IPhoton\nclass Twin(IPhoton): pass\n"
+            SystemUtils.write_to_file(os.path.join(directory, "first_twin.py"), source)
+            SystemUtils.write_to_file(os.path.join(directory, "second_twin.py"), source)
+            loader = Loader()
+            photons = await loader.load_photons(directory)
+            self.assertEqual(len(photons), 1)
+            self.assertTrue(loader.photons["Twin"].filepath.endswith("first_twin.py"))
+
 #@unittest.skip(reason="Debugging")
 class UnloadingTest(unittest.IsolatedAsyncioTestCase):
     @classmethod
@@ -657,6 +1398,64 @@ class UnloadingTest(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(PhotonNotFoundError):
             await self._loader.unload_photons(photon_filepaths, force_stop=True)
 
+    async def test_unload_multiple_photons_concurrently_with_deadlines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "finalizers.py"),
+                "from src.interfaces.photon import IPhoton\nimport asyncio\n"
+                "class First(IPhoton):\n    async def finalize(self): await asyncio.sleep(0.3)\n"
+                "class Second(IPhoton):\n    async def finalize(self): await asyncio.sleep(0.3)\n"
+                "class Hung(IPhoton):\n    async def finalize(self): await asyncio.Event().wait()\n")
+            photons = await self._loader.load_photons(directory)
+            for photon in photons: await photon.start()
+            started = time.perf_counter()
+            results = await self._loader.unload_photons(photons, timeout=0.6, report=True)
+            self.assertLess(time.perf_counter() - started, 0.9) # Not the 1.2 seconds of running them in turn.
+            self.assertEqual([result.name for result in results if result.timed_out], ["Hung"])
+            self.assertTrue(all(result.is_absorbed and result.duration >= 0.3 for result in results))
+            self.assertEqual(len(self._loader.photons), 0)
+
+    async def test_unload_photons_lets_cancelled_finalizers_unwind(self):
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, "unwound")
+            SystemUtils.write_to_file(os.path.join(directory, "finalizers.py"),
+                "from src.interfaces.photon import IPhoton\nimport asyncio\n"
+                "class Unwinding(IPhoton):\n    async def finalize(self):\n"
+                "        try: await asyncio.Event().wait()\n"
+                "        except asyncio.CancelledError:\n"
+                "            await asyncio.sleep(0.05)\n"
+                f"            open({marker!r}, 'w').close()\n"
+                "            raise RuntimeError()\n")
+            photons = await self._loader.load_photons(directory)
+            for photon in photons: await photon.start()
+            results = await self._loader.unload_photons(photons, timeout=0.1, report=True)
+            self.assertTrue(os.path.exists(marker))
+            self.assertTrue(results[0].timed_out and results[0].is_absorbed)
+            self.assertIsNone(results[0].error)
+
+    async def test_unload_multiple_photons_past_the_deadline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SystemUtils.write_to_file(os.path.join(directory, "finalizers.py"),
+                "from src.interfaces.photon import IPhoton\nimport asyncio\n"
+                "class First(IPhoton):\n    async def finalize(self): await asyncio.sleep(0.3)\n"
+                "class Second(IPhoton):\n    async def finalize(self): await asyncio.sleep(0.3)\n")
+            photons = await self._loader.load_photons(directory)
+            for photon in photons: await photon.start()
+            unloaded_paths = await self._loader.unload_photons(photons, concurrency=1, deadline=0.1)
+            self.assertEqual(unloaded_paths, [photons[0].filepath])
+            self.assertEqual(len(self._loader.photons), 0)
+
+    async def test_unload_multiple_photons_with_invalid_deadlines(self):
+        with self.assertRaises(TypeError):
+            await self._loader.unload_photons([], concurrency="4E6F6E65")
+        with self.assertRaises(ValueError):
+            await self._loader.unload_photons([], concurrency=0)
+        with self.assertRaises(TypeError):
+            await self._loader.unload_photons([], timeout=True)
+        with self.assertRaises(ValueError):
+            await self._loader.unload_photons([], deadline=-1)
+        with self.assertRaises(TypeError):
+            await self._loader.unload_photons([], report="5265706F7274")
+
 #@unittest.skip(reason="Debugging")
 class ReloadingTest(unittest.IsolatedAsyncioTestCase): 
     @classmethod
@@ -688,6 +1487,50 @@ class ReloadingTest(unittest.IsolatedAsyncioTestCase):
         SystemUtils.write_to_file(photon.filepath, original_photon)
         self.assertTrue(success)
 
+    async def test_reload_photon_is_double_buffered(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "buffered.py")
+            template = ("from src.interfaces.photon import IPhoton\nimport asyncio\nfinalized = []\n"
+                        "class Buffered(IPhoton):\n    version = '{0}'\n"
+                        "    async def initialize(self): await asyncio.sleep(0.2)\n"
+                        "    async def finalize(self): finalized.append(self.version); return True\n")
+            SystemUtils.write_to_file(filepath, template.format("4F6C64"))
+            loader = Loader()
+            photon = await loader.load_photon(filepath)
+            await photon.start()
+            previous = photon.instance
+            SystemUtils.write_to_file(filepath, template.format("4E65772056657273696F6E"))
+            reloading = asyncio.ensure_future(loader.reload_photon(photon))
+            observed = []
+            while not reloading.done():
+                observed.append(loader.photons["Buffered"].instance)
+                await asyncio.sleep(0.02)
+            reloaded = await reloading
+            self.assertTrue(all(not instance is None for instance in observed)) # Never missing, never half-started.
+            self.assertIs(observed[0], previous)
+            self.assertIs(loader.photons["Buffered"], reloaded)
+            self.assertTrue(reloaded.is_ready)
+            self.assertEqual(reloaded.instance.version, "4E65772056657273696F6E")
+            self.assertEqual(type(reloaded.instance).finalize.__globals__["finalized"], [])
+            self.assertEqual(type(previous).finalize.__globals__["finalized"], ["4F6C64"])
+            self.assertFalse(photon.is_started)
+
+    async def test_reload_photon_keeps_previous_version_on_failures(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "resilient.py")
+            SystemUtils.write_to_file(filepath, "from src.interfaces.photon import IPhoton\n"
+                                                "class Resilient(IPhoton):\n    version = '4F6C64'\n")
+            loader = Loader()
+            photon = await loader.load_photon(filepath)
+            await photon.start()
+            for broken in ("class Resilient(:\n", "from src.interfaces.photon import IPhoton\nclass Resilient(IPhoton):\n"
+                                                  "    async def initialize(self): raise OSError('4E6F7065')\n"):
+                SystemUtils.write_to_file(filepath, broken)
+                self.assertIs(await loader.reload_photon(photon), photon)
+                self.assertIs(loader.photons["Resilient"], photon)
+                self.assertTrue(photon.is_ready)
+                self.assertEqual(photon.instance.version, "4F6C64")
+
     #* Single photons — Test for successful, and unsuccessful, reloading.
     async def test_reload_photon_as_handler(self):
         photon = await self._loader.load_photon(PhotonLocations.basic_photon)
@@ -727,6 +1570,22 @@ class ReloadingTest(unittest.IsolatedAsyncioTestCase):
         reloaded = await self._loader.reload_photons(photons)
         self.assertTrue(all(isinstance(photon, Handler) for photon in reloaded))
 
+    async def test_reload_multiple_photons_concurrently(self):
+        loader = Loader(workers=2)
+        photons = await loader.load_photons(PhotonLocations.main_directory, recursive=True)
+        active, peak = 0, 0
+        async def _reload_photon(photon):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return photon
+        with patch.object(loader, "_reload_photon", side_effect=_reload_photon):
+            reloaded = await loader.reload_photons(photons)
+        self.assertEqual(len(reloaded), len(photons))
+        self.assertEqual(peak, 2)
+
     async def test_reload_multiple_photons_as_string(self): # TODO: Needs to be converted to photon names.
         photon_names = []
         photons = await self._loader.load_photons(PhotonLocations.main_directory, other_classes=['Alpha', 'Omega'])
@@ -787,6 +1646,18 @@ class WatchingTest(unittest.IsolatedAsyncioTestCase):
             await self._loader.watch_photons(["417265206F757220647265616D73207265616C3F20"])
         await self._loader.stop_watching_photons(halt_threads=True)
 
+    async def test_watch_photons_with_invalid_engine(self):
+        with self.assertRaises(TypeError):
+            await self._loader.watch_photons(PhotonLocations.main_directory, engine=1)
+        with self.assertRaises(ValueError):
+            await self._loader.watch_photons(PhotonLocations.main_directory, engine="5761746368")
+
+    async def test_watch_photons_with_invalid_debounce(self):
+        with self.assertRaises(TypeError):
+            await self._loader.watch_photons(PhotonLocations.main_directory, debounce="4465626F756E6365")
+        with self.assertRaises(ValueError):
+            await self._loader.watch_photons(PhotonLocations.main_directory, max_delay=-1)
+
     async def test_watch_photons_with_non_existent_path(self):
         with self.assertRaises(DirectoryNotFoundError):
             await self._loader.watch_photons("57687920617265206F757220626F6469657320696D6D6F62696C6520647572696E67207468656D3F")
@@ -847,6 +1718,114 @@ class ToolsTest(unittest.IsolatedAsyncioTestCase):
         checksum = SystemUtils.get_file_checksum(PhotonLocations.basic_photon)
         self.assertIsInstance(checksum, str)
 
+    async def test_calculate_file_checksum_with_algorithms(self):
+        for algorithm in DigestUtils.get_algorithms():
+            checksum = SystemUtils.get_file_checksum(PhotonLocations.basic_photon, algorithm=algorithm)
+            self.assertEqual(len(checksum), DigestUtils.new(algorithm).digest_size * 2)
+        with self.assertRaises(ValueError):
+            SystemUtils.get_file_checksum(PhotonLocations.basic_photon, algorithm="536861646F77")
+
+    async def test_checksum_engine_hashes_small_and_large_files(self):
+        import hashlib
+        with tempfile.TemporaryDirectory() as directory:
+            for size in (0, 1024, ChecksumEngine.mmap_threshold * 4 + 7): # Read into a buffer, or memory-mapped.
+                filepath = os.path.join(directory, f"photon_{size}.py")
+                data = (b"4C756D696E616C" * (size // 14 + 1))[:size]
+                with open(filepath, "wb") as file: file.write(data)
+                expected = hashlib.sha256(data).hexdigest()
+                self.assertEqual(ChecksumEngine.hash_file(filepath, "sha256", block=4096), expected)
+                self.assertEqual(ChecksumEngine.hash_file(filepath, "sha256", use_mmap=True), expected)
+                self.assertEqual(await ChecksumEngine.hash_file_async(filepath, "sha256"), expected)
+                self.assertEqual(await ChecksumEngine.hash_file_async(filepath, "sha256", use_mmap=True), expected)
+                self.assertEqual(await Handler._get_checksum(filepath, algorithm="sha256"), expected)
+            with self.assertRaises(OSError):
+                ChecksumEngine.hash_file(os.path.join(directory, "4D697373696E67.py"))
+
+    async def test_checksum_engine_hashes_many_files_in_parallel(self):
+        import hashlib
+        with tempfile.TemporaryDirectory() as directory:
+            expected = {}
+            for index in range(8):
+                filepath = os.path.join(directory, f"photon_{index}.py")
+                SystemUtils.write_to_file(filepath, f"VALUE = '{'4C756D696E616C' * index}'\n")
+                with open(filepath, "rb") as file: expected[filepath] = hashlib.sha256(file.read()).hexdigest()
+            missing = os.path.join(directory, "4D697373696E67.py")
+            filepaths = list(reversed(expected)) + [missing]
+            checksums = ChecksumEngine.checksums(filepaths, "sha256", workers=4)
+            self.assertEqual(list(checksums), filepaths)
+            self.assertEqual(checksums, {**expected, missing: None})
+            self.assertEqual(dict(ChecksumEngine.iterate_checksums(filepaths, "sha256", workers=1)), checksums)
+            with self.assertRaises(ValueError):
+                ChecksumEngine.checksums(filepaths, workers=0)
+
+    async def test_crc32_digest_matches_zlib(self):
+        import zlib
+        digest = DigestUtils.new("crc32")
+        digest.update(b"4C756D")
+        digest.update(b"696E616C")
+        self.assertEqual(digest.hexdigest(), f"{zlib.crc32(b'4C756D696E616C'):08x}")
+        self.assertEqual(digest.copy().digest(), digest.digest())
+
+    @unittest.skipUnless(Inotify.is_supported(), "inotify is only available on Linux")
+    async def test_inotify_reports_changed_paths(self):
+        with tempfile.TemporaryDirectory() as directory:
+            watcher = Inotify()
+            self.assertEqual(watcher.watch_tree(directory), [directory])
+            nested = os.path.join(directory, "nested")
+            os.makedirs(nested)
+            paths = Inotify.get_changed_paths(await watcher.wait(1))
+            self.assertEqual(paths, [nested])
+            self.assertIn(nested, watcher.watches)
+            photon_path = os.path.join(nested, "inotify_photon.py")
+            SystemUtils.write_to_file(photon_path, "VALUE = 1\n")
+            self.assertEqual(Inotify.get_changed_paths(await watcher.wait(1)), [photon_path])
+            self.assertEqual(await watcher.wait(0), [])
+            watcher.close()
+
+    async def test_fingerprint_checksum_is_cached(self):
+        fingerprints = Fingerprints()
+        first = fingerprints.get_checksum(PhotonLocations.basic_photon)
+        with patch.object(SystemUtils, "get_file_checksum") as mock_checksum:
+            second = fingerprints.get_checksum(PhotonLocations.basic_photon)
+            mock_checksum.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual((fingerprints.hits, fingerprints.misses), (1, 1))
+
+    async def test_fingerprint_checksums_are_batched(self):
+        fingerprints = Fingerprints()
+        first = fingerprints.get_checksum(PhotonLocations.basic_photon)
+        checksums = fingerprints.get_checksums([PhotonLocations.basic_photon, PhotonLocations.advanced_photon])
+        self.assertEqual(checksums[PhotonLocations.basic_photon], first)
+        self.assertEqual(checksums[PhotonLocations.advanced_photon],
+                         SystemUtils.get_file_checksum(PhotonLocations.advanced_photon))
+        self.assertEqual((fingerprints.hits, fingerprints.misses), (1, 2))
+        self.assertIn(PhotonLocations.advanced_photon, fingerprints)
+
+    async def test_fingerprint_checksum_detects_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "fingerprint.py")
+            SystemUtils.write_to_file(filepath, "VALUE = 1\n")
+            fingerprints = Fingerprints()
+            first = fingerprints.get_checksum(filepath)
+            SystemUtils.write_to_file(filepath, "VALUE = 22\n")
+            self.assertNotEqual(first, fingerprints.get_checksum(filepath))
+            os.remove(filepath)
+            self.assertIsNone(fingerprints.get_checksum(filepath))
+            self.assertNotIn(filepath, fingerprints)
+
+    async def test_fingerprint_cache_is_bounded(self):
+        fingerprints = Fingerprints(limit=1)
+        fingerprints.get_checksum(PhotonLocations.basic_photon)
+        fingerprints.get_checksum(PhotonLocations.advanced_photon)
+        self.assertEqual(len(fingerprints), 1)
+        self.assertIn(PhotonLocations.advanced_photon, fingerprints)
+        self.assertTrue(fingerprints.invalidate(PhotonLocations.advanced_photon))
+        self.assertFalse(fingerprints.invalidate())
+
+    async def test_fingerprint_cache_with_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            Fingerprints(limit=0)
+
     async def test_compare_module_names(self):
         is_submodule = SystemUtils.is_submodule("5368616C6F6D", "5368616C6F6D")
         self.assertTrue(is_submodule)